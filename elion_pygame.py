@@ -3,14 +3,34 @@ ELION – The Last Lightkeeper
 """
 
 import pygame
+import argparse
 import os
 import sys
 import math
 import random
-from typing import List, Tuple, Optional, Dict
-from dataclasses import dataclass
+import hashlib
+import inspect
+import json
+import shutil
+import struct
+import threading
+import time
+import zlib
+from typing import List, Tuple, Optional, Dict, Callable, Hashable, Iterable, Sequence, Union
+from collections import deque, OrderedDict
+from itertools import compress, zip_longest
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
 
+# Mode headless (tanpa display/audio) harus dipilih sebelum pygame.init();
+# --benchmark selalu berjalan headless
+HEADLESS = (os.environ.get("ELION_HEADLESS", "") not in ("", "0")
+            or any(arg in ("--headless", "--benchmark") for arg in sys.argv[1:]))
+if HEADLESS:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
 # Initialize Pygame dengan pengaturan yang lebih baik
 pygame.init()
 pygame.mixer.init()
@@ -23,8 +43,17 @@ try:
 except ImportError:
     USE_OPENGL = False
 
+try:
+    # NumPy opsional, dipakai untuk backend partikel vektor
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
 # Enable anti-aliasing
-pygame.display.set_mode((0, 0), pygame.HWSURFACE | pygame.DOUBLEBUF)
+if not HEADLESS:
+    pygame.display.set_mode((0, 0), pygame.HWSURFACE | pygame.DOUBLEBUF)
 
 # ==================== CONSTANTS ====================
 class GameState(Enum):
@@ -33,6 +62,7 @@ class GameState(Enum):
     CUTSCENE = "cutscene"
     PLAYING = "playing"
     PAUSE = "pause"
+    LOADING = "loading"
     WIN = "win"
     GAMEOVER = "gameover"
     ENDING = "ending"
@@ -48,6 +78,11 @@ WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
 RENDER_WIDTH = 640
 RENDER_HEIGHT = 360
+# Scaler render_surface -> window: "nearest", "smooth" atau "integer" (kelipatan bulat + letterbox)
+RENDER_SCALERS = ("nearest", "smooth", "integer")
+RENDER_SCALER = os.environ.get("ELION_SCALER", "nearest")
+# World map, codex, cutscene dan ending digambar di resolusi internal juga, bukan langsung di window
+LOWRES_SCREENS = os.environ.get("ELION_LOWRES_SCREENS", "") not in ("", "0")
 FPS = 60
 
 # Enhanced Colors dengan gradien yang lebih smooth
@@ -100,12 +135,53 @@ COMPANION_FOLLOW_SPEED = 0.08
 ENEMY_PATROL_SPEED = 80
 ENEMY_CHASE_SPEED = 120
 PARTICLE_POOL_SIZE = 300
+VECTOR_PARTICLE_CAPACITY = 20000
+# "pool" = ParticleSystem klasik, "vector" = VectorParticleSystem (butuh NumPy)
+PARTICLE_BACKENDS = ("pool", "vector")
+PARTICLE_BACKEND = os.environ.get("ELION_PARTICLE_BACKEND", "pool")
+# "object" = atribut per objek musuh, "store" = EnemyStore berbasis array (butuh NumPy)
+ENEMY_BACKENDS = ("object", "store")
+ENEMY_BACKEND = os.environ.get("ELION_ENEMY_BACKEND", "object")
+ENEMY_STORE_CAPACITY = 64
+# Kelompok musuh sekelas yang lebih kecil dari ini tetap memakai take_action() per objek
+ENEMY_BATCH_MIN = 8
+# LOD AI musuh (ELION_AI_LOD=1): (tier, jarak maks. di luar viewport dalam px, interval frame).
+# Jarak None = semua sisanya; interval 0 = beku (tidak di-update sama sekali)
+AI_LOD_ENABLED = os.environ.get("ELION_AI_LOD", "") not in ("", "0")
+AI_LOD_TIERS = (("near", 32, 1), ("buffer", 384, 4), ("far", None, 30))
+# Musuh dalam radius ini dari pemain selalu tier pertama (aggro Umbra 150, dash Flare Wolf 200 px)
+AI_LOD_ACTIVE_RADIUS = 256
+# Batas dt terakumulasi per tick agar musuh tidak melompat jauh setelah frame tersendat.
+# Minimal interval terpanjang / FPS, supaya tier jarang tetap berjalan dengan kecepatan penuh
+AI_LOD_MAX_DT = max(interval for _, _, interval in AI_LOD_TIERS) / FPS
+# Kebijakan saat pool penuh: "drop", "recycle" (timpa yang tertua), "grow" (sampai cap)
+PARTICLE_OVERFLOW_POLICY = "drop"
+PARTICLE_POOL_CAP = 2000
+# Setengah lebar sprite partikel terbesar (light_flower ukuran 5)
+PARTICLE_CULL_MARGIN = 24
+# Tilemap ber-chunk: ukuran chunk, jumlah chunk di cache LRU, dan prefetch per frame
+TILEMAP_CHUNK_SIZE = 256
+TILEMAP_MAX_CHUNKS = 96
+TILEMAP_PREFETCH_MARGIN = 1
+TILEMAP_PREFETCH_BUDGET = 2
+# Cache chunk tilemap di disk (None = nonaktif); hanya berguna jika seed tetap
+TILEMAP_CACHE_DIR = os.environ.get("ELION_CACHE_DIR",
+                                   os.path.join(os.path.dirname(os.path.abspath(__file__)), ".elion_cache"))
+TILEMAP_CACHE_MAX_MAPS = 8
+# Seed tilemap tetap dari environment supaya layout (dan cache-nya) sama antar launch
+TILEMAP_SEED = int(os.environ["ELION_TILEMAP_SEED"]) if os.environ.get("ELION_TILEMAP_SEED") else None
+TILEMAP_CACHE_VERSION = 1
+# Sprite sheet player (PNG) disimpan langsung di root cache; prune tilemap hanya menghapus direktori
+SPRITE_CACHE_DIR = TILEMAP_CACHE_DIR
+SPRITE_CACHE_VERSION = 1
 
 # Level-specific
 LEVEL2_WORLD_WIDTH = 2560
 LEVEL2_WORLD_HEIGHT = 1080
 LEVEL3_WORLD_WIDTH = 1920
 LEVEL3_WORLD_HEIGHT = 1440
+# Durasi minimum efek transisi saat level berikutnya dibangun di background
+LEVEL_LOADING_MIN_TIME = 0.4
 
 # Attack system
 PLAYER_ATTACK_COOLDOWN = 0.5
@@ -114,6 +190,827 @@ SPIRIT_BURST_LIFETIME = 1.2
 SPIRIT_BURST_SIZE = 12
 ATTACK_RANGE = 400
 
+# Seed master untuk semua stream RNG (None = acak tiap launch); bisa juga lewat --seed
+RNG_SEED = int(os.environ["ELION_SEED"]) if os.environ.get("ELION_SEED") else None
+# Overlay profiler frame aktif sejak awal (toggle dengan F3)
+PROFILER_ENABLED = os.environ.get("ELION_PROFILE", "") not in ("", "0")
+# Jumlah maksimum teks ter-render yang disimpan TextCache
+TEXT_CACHE_MAX_ENTRIES = 512
+# Gradien latar ter-cache, dan varian latar animasi yang diputar per frame
+GRADIENT_CACHE_MAX = 8
+BACKGROUND_VARIANTS = 8
+BACKGROUND_VARIANT_MS = 1000 // FPS
+# Sprite berotasi: jumlah langkah sudut per putaran dan kapasitas LRU
+ROTATION_CACHE_STEPS = 64
+ROTATION_CACHE_MAX_ENTRIES = 256
+# Ukuran sel grid spatial hash (px dunia); beberapa kali ukuran entity
+SPATIAL_CELL_SIZE = 128
+# Kapasitas awal pool proyektil (Spirit Burst + proyektil musuh); pool tumbuh bila penuh
+PROJECTILE_POOL_SIZE = 256
+# Perpindahan musuh per frame (px) di atas mana tabrakan dengan pemain diperiksa
+# tersapu (swept), supaya dt besar / tick rate rendah tidak membuat musuh tembus
+SWEPT_MIN_STEP = 4.0
+
+
+# ==================== RNG STREAMS ====================
+class RNGRegistry:
+    """Satu random.Random per subsistem, semua diturunkan dari satu seed master.
+    
+    Stream terpisah membuat jumlah panggilan random di satu subsistem (misal
+    partikel) tidak menggeser hasil subsistem lain (misal AI musuh).
+    """
+    STREAMS = ("tilemap", "particles", "ai", "camera", "ui")
+    
+    def __init__(self, seed: Optional[int] = None):
+        self._streams: Dict[str, random.Random] = {name: random.Random() for name in self.STREAMS}
+        self._np_streams: Dict[str, "np.random.Generator"] = {}
+        if HAS_NUMPY:
+            self._np_streams = {name: np.random.default_rng() for name in self.STREAMS}
+        self.seed = 0
+        self.fixed = False
+        self.reseed(seed)
+    
+    def reseed(self, seed: Optional[int] = None) -> None:
+        """Seed ulang semua stream di tempat (referensi yang sudah dibagikan tetap valid)"""
+        self.fixed = seed is not None
+        self.seed = seed if seed is not None else random.SystemRandom().randrange(2 ** 63)
+        for name, stream in self._streams.items():
+            stream.seed(self.derive_seed(name))
+        for name, generator in self._np_streams.items():
+            generator.bit_generator.state = np.random.PCG64(self.derive_seed(name, "numpy")).state
+    
+    def derive_seed(self, *parts) -> int:
+        """Seed turunan yang stabil untuk (seed master, parts...), tanpa memakai state stream"""
+        key = ":".join(str(part) for part in (self.seed, *parts)).encode()
+        return int.from_bytes(hashlib.sha256(key).digest()[:8], "little") & 0x7FFFFFFFFFFFFFFF
+    
+    def get(self, name: str) -> random.Random:
+        return self._streams[name]
+    
+    def numpy(self, name: str) -> "np.random.Generator":
+        return self._np_streams[name]
+    
+    @property
+    def tilemap(self) -> random.Random:
+        return self._streams["tilemap"]
+    
+    @property
+    def particles(self) -> random.Random:
+        return self._streams["particles"]
+    
+    @property
+    def ai(self) -> random.Random:
+        return self._streams["ai"]
+    
+    @property
+    def camera(self) -> random.Random:
+        return self._streams["camera"]
+    
+    @property
+    def ui(self) -> random.Random:
+        return self._streams["ui"]
+
+
+RNG = RNGRegistry(RNG_SEED)
+
+
+# ==================== SIMULATION ====================
+class SimulationClock:
+    """Jam simulasi: waktu hanya maju lewat advance(), bukan wall clock"""
+    def __init__(self, start_ms: float = 0.0):
+        self.ms = start_ms
+    
+    def advance(self, dt: float) -> None:
+        self.ms += dt * 1000.0
+    
+    def get_ticks(self) -> int:
+        return int(self.ms)
+
+
+_simulation_clock: Optional[SimulationClock] = None
+
+
+def set_simulation_clock(clock: Optional[SimulationClock]) -> None:
+    """Pasang jam simulasi untuk game_ticks() (None = kembali ke wall clock)"""
+    global _simulation_clock
+    _simulation_clock = clock
+
+
+def game_ticks() -> int:
+    """pygame.time.get_ticks(), atau jam simulasi jika sedang headless"""
+    if _simulation_clock is not None:
+        return _simulation_clock.get_ticks()
+    return pygame.time.get_ticks()
+
+
+class _KeyState:
+    """Meniru ScancodeWrapper dari pygame.key.get_pressed()"""
+    def __init__(self, pressed: Iterable[int] = ()):
+        self._pressed = frozenset(pressed)
+    
+    def __getitem__(self, key: int) -> bool:
+        return key in self._pressed
+
+
+class ScriptedInput:
+    """Input terskrip untuk simulasi, dipakai Game sebagai pengganti pygame.key.
+    
+    Script berupa urutan (jumlah_frame, tombol) yang dijalankan berurutan,
+    atau callable frame -> tombol yang ditekan.
+    """
+    def __init__(self, script: Union[Sequence[Tuple[int, Iterable[int]]], Callable[[int], Iterable[int]]] = (),
+                 loop: bool = False):
+        self.script = script
+        self.loop = loop
+        self.frame = 0
+        self._state = _KeyState()
+        if not callable(script):
+            self._steps = [(frames, frozenset(keys)) for frames, keys in script]
+            self._total = sum(frames for frames, _ in self._steps)
+    
+    def advance(self) -> None:
+        """Pindah ke frame berikutnya; dipanggil sekali per frame simulasi"""
+        self._state = _KeyState(self._keys_at(self.frame))
+        self.frame += 1
+    
+    def _keys_at(self, frame: int) -> Iterable[int]:
+        if callable(self.script):
+            return self.script(frame)
+        if self.loop and self._total:
+            frame %= self._total
+        for frames, keys in self._steps:
+            if frame < frames:
+                return keys
+            frame -= frames
+        return ()
+    
+    def get_pressed(self) -> _KeyState:
+        return self._state
+
+
+# ==================== PROFILER ====================
+class _NullSection:
+    """Context manager kosong; dipakai saat profiler mati"""
+    __slots__ = ()
+    
+    def __enter__(self) -> None:
+        return None
+    
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+# Counter frame milik profiler yang sedang hidup (None = tidak menghitung)
+_alloc_counts: Optional[Dict[str, int]] = None
+# Alokasi thread lain (mis. worker LevelLoader) tidak masuk hitungan frame
+_MAIN_THREAD_ID = threading.main_thread().ident
+
+
+def count_alloc(kind: str = "surfaces") -> None:
+    """Catat satu alokasi ("surfaces"/"fonts") ke profiler jika sedang hidup"""
+    if _alloc_counts is not None and threading.get_ident() == _MAIN_THREAD_ID:
+        _alloc_counts[kind] += 1
+
+
+def new_surface(size: Tuple[int, int], flags: int = 0, *args) -> pygame.Surface:
+    """pygame.Surface yang ikut dihitung profiler"""
+    count_alloc()
+    return pygame.Surface(size, flags, *args)
+
+
+class _ProfileSection:
+    __slots__ = ("_totals", "_name", "_start")
+    
+    def __init__(self, totals: Dict[str, float], name: str):
+        self._totals = totals
+        self._name = name
+    
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+    
+    def __exit__(self, *exc) -> bool:
+        elapsed = time.perf_counter() - self._start
+        self._totals[self._name] = self._totals.get(self._name, 0.0) + elapsed
+        return False
+
+
+class FrameProfiler:
+    """Profiler per fase frame dengan overlay (toggle F3).
+    
+    Saat mati, section() mengembalikan context manager kosong sehingga
+    biayanya hanya satu pemanggilan method. Saat hidup, alokasi per frame di
+    thread utama dihitung lewat count_alloc() di titik-titik alokasi game
+    sendiri: new_surface(), miss get_font/text_cache/rotation_cache dan
+    gradien baru. copy() dan pygame.transform di luar cache tidak terlihat.
+    """
+    PHASES = ("events", "input", "enemies", "collisions", "particles_update",
+              "background", "tilemap", "entities", "particles_draw", "hud",
+              "scale", "flip")
+    PHASE_COLORS = {
+        "events": (120, 120, 120), "input": (90, 160, 255), "enemies": (255, 110, 90),
+        "collisions": (255, 190, 60), "particles_update": (200, 120, 255),
+        "background": (80, 200, 160), "tilemap": (60, 150, 90), "entities": (240, 240, 120),
+        "particles_draw": (230, 90, 200), "hud": (120, 220, 255), "scale": (255, 150, 150),
+        "flip": (180, 180, 220), "other": (70, 70, 70),
+    }
+    HISTORY = 120
+    BUDGET_MS = 1000.0 / 60
+    
+    def __init__(self, enabled: bool = False):
+        self.enabled = False
+        self.history: deque = deque(maxlen=self.HISTORY)
+        self._totals: Dict[str, float] = {}
+        self._frame_start = 0.0
+        self._counts = {"surfaces": 0, "fonts": 0}
+        if enabled:
+            self.toggle()
+    
+    def toggle(self) -> bool:
+        global _alloc_counts
+        self.enabled = not self.enabled
+        self.history.clear()
+        self._totals = {}
+        _alloc_counts = self._counts if self.enabled else None
+        return self.enabled
+    
+    def section(self, name: str):
+        """with profiler.section("nama"): ... — waktu diakumulasi per frame"""
+        if not self.enabled:
+            return _NULL_SECTION
+        return _ProfileSection(self._totals, name)
+    
+    def begin_frame(self) -> None:
+        if not self.enabled:
+            return
+        self._totals = {}
+        self._counts["surfaces"] = 0
+        self._counts["fonts"] = 0
+        self._frame_start = time.perf_counter()
+    
+    def end_frame(self) -> None:
+        if not self.enabled or not self._frame_start:
+            return
+        frame_ms = (time.perf_counter() - self._frame_start) * 1000.0
+        phases = {name: seconds * 1000.0 for name, seconds in self._totals.items()}
+        phases["other"] = max(0.0, frame_ms - sum(phases.values()))
+        self.history.append({
+            "frame": frame_ms,
+            "phases": phases,
+            "surfaces": self._counts["surfaces"],
+            "fonts": self._counts["fonts"],
+        })
+    
+    def averages(self) -> Dict[str, float]:
+        """Rata-rata ms per fase (plus 'frame', 'surfaces', 'fonts') atas history"""
+        if not self.history:
+            return {}
+        count = len(self.history)
+        result: Dict[str, float] = {}
+        for record in self.history:
+            for name, ms in record["phases"].items():
+                result[name] = result.get(name, 0.0) + ms / count
+            for key in ("frame", "surfaces", "fonts"):
+                result[key] = result.get(key, 0.0) + record[key] / count
+        return result
+    
+    # -------- Overlay --------
+    def draw(self, surface: pygame.Surface) -> None:
+        """Tabel ms per fase + flame bar bergulir di pojok kanan atas"""
+        global _alloc_counts
+        if not self.enabled or not self.history:
+            return
+        # Alokasi overlay sendiri tidak ikut dihitung
+        _alloc_counts = None
+        try:
+            self._draw_overlay(surface)
+        finally:
+            _alloc_counts = self._counts
+    
+    def _draw_overlay(self, surface: pygame.Surface) -> None:
+        font = get_font(18)
+        averages = self.averages()
+        phases = [name for name in self.PHASES + ("other",) if averages.get(name, 0.0) > 0.0]
+        
+        line_height = 15
+        graph_height = 48
+        column_width = 2
+        width = 12 + column_width * self.HISTORY
+        height = 28 + line_height * (len(phases) + 1) + graph_height
+        x = surface.get_width() - width - 8
+        y = 8
+        
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        surface.blit(panel, (x, y))
+        
+        header = (f"frame {averages['frame']:.2f} ms  "
+                  f"surf {averages['surfaces']:.1f}  font {averages['fonts']:.1f}")
+        surface.blit(font.render(header, True, (255, 255, 255)), (x + 6, y + 6))
+        
+        row_y = y + 24
+        for name in phases:
+            ms = averages[name]
+            color = self.PHASE_COLORS.get(name, (200, 200, 200))
+            pygame.draw.rect(surface, color, (x + 6, row_y + 3, 8, 8))
+            surface.blit(font.render(name, True, (220, 220, 220)), (x + 20, row_y))
+            value = font.render(f"{ms:6.2f}", True, (220, 220, 220))
+            surface.blit(value, (x + width - 8 - value.get_width(), row_y))
+            row_y += line_height
+        
+        # Flame bar: satu kolom bertumpuk per frame, garis = budget 60 FPS
+        graph_top = row_y + 6
+        graph_bottom = graph_top + graph_height
+        scale = graph_height / (self.BUDGET_MS * 2)
+        for i, record in enumerate(self.history):
+            column_x = x + 6 + i * column_width
+            bar_y = graph_bottom
+            for name in self.PHASES + ("other",):
+                ms = record["phases"].get(name)
+                if not ms:
+                    continue
+                bar_height = min(bar_y - graph_top, int(round(ms * scale)))
+                if bar_height <= 0:
+                    continue
+                bar_y -= bar_height
+                pygame.draw.rect(surface, self.PHASE_COLORS[name],
+                                 (column_x, bar_y, column_width, bar_height))
+        budget_y = graph_bottom - int(self.BUDGET_MS * scale)
+        pygame.draw.line(surface, (255, 255, 255), (x + 6, budget_y), (x + width - 6, budget_y))
+
+
+# ==================== FONTS ====================
+_fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+
+
+def get_font(size: int, face: Optional[str] = None) -> pygame.font.Font:
+    """Font bersama per (face, size); file font hanya dibuka sekali"""
+    key = (face, size)
+    font = _fonts.get(key)
+    if font is None:
+        count_alloc("fonts")
+        font = pygame.font.Font(face, size)
+        _fonts[key] = font
+    return font
+
+
+class TextCache:
+    """Cache LRU untuk teks yang sudah dirender, key (text, size, color, antialias, face).
+    
+    Surface hasil dipakai bersama: jangan diubah (set_alpha, blit ke dalamnya)
+    tanpa .copy() lebih dulu.
+    """
+    def __init__(self, max_entries: int = TEXT_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def render(self, text: str, size: int, color: Tuple[int, ...], antialias: bool = True,
+               face: Optional[str] = None) -> pygame.Surface:
+        key = (text, size, tuple(color), antialias, face)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        count_alloc()
+        surf = get_font(size, face).render(text, antialias, color)
+        self._surfaces[key] = surf
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surf
+    
+    def clear(self) -> None:
+        self._surfaces.clear()
+    
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._surfaces),
+            "fonts": len(_fonts),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+text_cache = TextCache()
+
+
+def render_text(text: str, size: int, color: Tuple[int, ...], antialias: bool = True,
+                face: Optional[str] = None) -> pygame.Surface:
+    """Render teks lewat text_cache (surface dipakai bersama, jangan dimutasi)"""
+    return text_cache.render(text, size, color, antialias, face)
+
+
+# ==================== GRADIENTS ====================
+def render_vertical_gradient(size: Tuple[int, int], top: Tuple[int, ...],
+                             bottom: Tuple[int, ...]) -> pygame.Surface:
+    """Gradien vertikal baru (RGB, atau SRCALPHA jika warna punya alpha).
+    
+    Warna baris y sama dengan loop draw.line lama:
+    int(top * (1 - y/h) + bottom * y/h) per channel.
+    """
+    width, height = size
+    channels = len(top)
+    surf = new_surface(size, pygame.SRCALPHA if channels == 4 else 0)
+    if width <= 0 or height <= 0:
+        return surf
+    
+    if HAS_NUMPY:
+        ratio = np.arange(height) / height
+        rows = np.empty((height, channels), dtype=np.uint8)
+        for c in range(channels):
+            rows[:, c] = (top[c] * (1 - ratio) + bottom[c] * ratio).astype(np.int64)
+        pixels = pygame.surfarray.pixels3d(surf)
+        pixels[:] = rows[np.newaxis, :, :3]
+        del pixels
+        if channels == 4:
+            alpha = pygame.surfarray.pixels_alpha(surf)
+            alpha[:] = rows[np.newaxis, :, 3]
+            del alpha
+        return surf
+    
+    for y in range(height):
+        ratio = y / height
+        color = tuple(int(a * (1 - ratio) + b * ratio) for a, b in zip(top, bottom))
+        pygame.draw.line(surf, color, (0, y), (width, y))
+    return surf
+
+
+_gradients: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+
+
+def vertical_gradient(size: Tuple[int, int], top: Tuple[int, ...],
+                      bottom: Tuple[int, ...]) -> pygame.Surface:
+    """Gradien ter-cache (LRU); surface dipakai bersama, jangan dimutasi"""
+    key = (tuple(size), tuple(top), tuple(bottom))
+    surf = _gradients.get(key)
+    if surf is not None:
+        _gradients.move_to_end(key)
+        return surf
+    surf = render_vertical_gradient(size, top, bottom)
+    _gradients[key] = surf
+    if len(_gradients) > GRADIENT_CACHE_MAX:
+        _gradients.popitem(last=False)
+    return surf
+
+
+# ==================== ROTATION CACHE ====================
+class RotationCache:
+    """Varian pygame.transform.rotate ter-cache (LRU), sudut dikuantisasi ke `steps` langkah.
+    
+    Tanpa key eksplisit, surface sumber diidentifikasi lewat id() dan ikut
+    disimpan di entry supaya id-nya tidak bisa dipakai ulang selama entry hidup.
+    Surface hasil dipakai bersama: jangan dimutasi.
+    """
+    def __init__(self, steps: int = ROTATION_CACHE_STEPS, max_entries: int = ROTATION_CACHE_MAX_ENTRIES):
+        self.steps = steps
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, Tuple[pygame.Surface, pygame.Surface]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def quantize(self, angle: float) -> int:
+        return int(round((angle % 360.0) * self.steps / 360.0)) % self.steps
+    
+    def rotate(self, surface: pygame.Surface, angle: float, key: Optional[Hashable] = None) -> pygame.Surface:
+        step = self.quantize(angle)
+        if step == 0:
+            return surface
+        
+        entry_key = (id(surface) if key is None else key, step)
+        entry = self._entries.get(entry_key)
+        if entry is not None and (key is not None or entry[0] is surface):
+            self._entries.move_to_end(entry_key)
+            self.hits += 1
+            return entry[1]
+        
+        self.misses += 1
+        count_alloc()
+        rotated = pygame.transform.rotate(surface, step * 360.0 / self.steps)
+        self._entries[entry_key] = (surface, rotated)
+        self._entries.move_to_end(entry_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return rotated
+    
+    def clear(self) -> None:
+        self._entries.clear()
+    
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+rotation_cache = RotationCache()
+
+
+# ==================== DIRTY RECTS ====================
+def merge_rects(rects: Iterable[pygame.Rect]) -> List[pygame.Rect]:
+    """Gabungkan rect yang bersinggungan supaya area tidak digambar dua kali"""
+    merged: List[pygame.Rect] = []
+    for rect in rects:
+        index = rect.collidelist(merged)
+        if index >= 0:
+            merged[index].union_ip(rect)
+        else:
+            merged.append(pygame.Rect(rect))
+    return merged
+
+
+def dirty_rects(previous: Sequence[pygame.Rect], current: Sequence[pygame.Rect]) -> List[pygame.Rect]:
+    """Area berubah antara dua frame: posisi lama dan baru tiap elemen dinamis.
+    
+    Elemen dipasangkan per indeks; posisi yang berdekatan digabung jadi satu
+    rect, yang berjauhan (mis. partikel yang wrap) tetap terpisah.
+    """
+    rects: List[pygame.Rect] = []
+    for old, new in zip_longest(previous, current):
+        # Rect kosong (lebar/tinggi 0) bernilai False
+        if old and new:
+            if old.inflate(2, 2).colliderect(new):
+                rects.append(old.union(new))
+            else:
+                rects += (old, new)
+        elif old:
+            rects.append(old)
+        elif new:
+            rects.append(new)
+    return merge_rects(rects)
+
+
+# ==================== SPATIAL HASH ====================
+class SpatialHash:
+    """Grid seragam untuk query tabrakan/jarak per jenis entity.
+    
+    Entity didaftarkan dengan rect dunia dan jenisnya ("enemy", "burst",
+    "projectile", ...). Query hanya memeriksa sel yang disentuh rect, dan
+    hasilnya selalu urut sesuai pendaftaran supaya logika game deterministik.
+    """
+    
+    def __init__(self, cell_size: int = SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self._cells: Dict[str, Dict[Tuple[int, int], List[Tuple[int, pygame.Rect, object]]]] = {}
+        self._count = 0
+    
+    def clear(self) -> None:
+        self._cells.clear()
+        self._count = 0
+    
+    def insert(self, kind: str, obj: object, rect: pygame.Rect) -> None:
+        self.insert_many(kind, ((obj, rect),))
+    
+    def insert_many(self, kind: str, items: Iterable[Tuple[object, pygame.Rect]]) -> None:
+        """Daftarkan banyak entity sekaligus (jalur utama saat grid dibangun ulang per frame)"""
+        cells = self._cells.get(kind)
+        if cells is None:
+            cells = self._cells[kind] = {}
+        size = self.cell_size
+        order = self._count
+        for obj, rect in items:
+            entry = (order, rect, obj)
+            order += 1
+            left, top = rect.x // size, rect.y // size
+            if (rect.right - 1) // size <= left and (rect.bottom - 1) // size <= top:
+                # Entity umumnya jauh lebih kecil dari sel
+                bucket = cells.get((left, top))
+                if bucket is None:
+                    cells[(left, top)] = [entry]
+                else:
+                    bucket.append(entry)
+                continue
+            for cell in self._cells_for(rect):
+                bucket = cells.get(cell)
+                if bucket is None:
+                    cells[cell] = [entry]
+                else:
+                    bucket.append(entry)
+        self._count = order
+    
+    def query(self, rect: pygame.Rect, kind: str) -> List[object]:
+        """Entity jenis kind yang rect-nya bertabrakan dengan rect"""
+        cells = self._cells.get(kind)
+        if not cells:
+            return []
+        covered = self._cells_for(rect)
+        if len(covered) == 1:
+            # Satu sel: bucket sudah urut pendaftaran dan tanpa duplikat
+            bucket = cells.get(covered[0])
+            if not bucket:
+                return []
+            return [obj for _, entry_rect, obj in bucket if entry_rect.colliderect(rect)]
+        hits: Dict[int, object] = {}
+        for cell in covered:
+            for order, entry_rect, obj in cells.get(cell, ()):
+                if order not in hits and entry_rect.colliderect(rect):
+                    hits[order] = obj
+        return [hits[order] for order in sorted(hits)]
+    
+    def nearby(self, x: float, y: float, radius: float, kind: str) -> List[object]:
+        """Kandidat dalam kotak radius di sekitar (x, y); jarak pastinya dicek pemanggil"""
+        size = int(radius * 2) + 1
+        return self.query(pygame.Rect(int(x - radius), int(y - radius), size, size), kind)
+    
+    def _cells_for(self, rect: pygame.Rect) -> List[Tuple[int, int]]:
+        size = self.cell_size
+        left, top = rect.x // size, rect.y // size
+        # Rect kosong tetap menempati sel titik asalnya
+        right = max(left, (rect.right - 1) // size)
+        bottom = max(top, (rect.bottom - 1) // size)
+        if left == right and top == bottom:
+            return [(left, top)]
+        return [(cx, cy) for cx in range(left, right + 1) for cy in range(top, bottom + 1)]
+
+
+def sweep_entry(x: float, y: float, dx: float, dy: float,
+                left: float, top: float, right: float, bottom: float) -> Optional[float]:
+    """Waktu masuk t di [0, 1] titik (x, y) yang bergerak (dx, dy) ke kotak terbuka
+    (left, right) x (top, bottom), atau None jika tidak tersapu.
+    
+    AABB yang bergerak diperiksa sebagai titik dengan memperbesar kotak target
+    (jumlah Minkowski). Sentuhan tepi tidak dihitung, sama seperti colliderect.
+    """
+    t_enter, t_exit = 0.0, 1.0
+    for start, delta, low, high in ((x, dx, left, right), (y, dy, top, bottom)):
+        if delta == 0:
+            if not low < start < high:
+                return None
+            continue
+        near = (low - start) / delta
+        far = (high - start) / delta
+        if near > far:
+            near, far = far, near
+        if near > t_enter:
+            t_enter = near
+        if far < t_exit:
+            t_exit = far
+        if t_enter >= t_exit:
+            return None
+    return t_enter
+
+
+# ==================== PROJECTILES ====================
+class Projectile:
+    """Record proyektil ter-pool (Spirit Burst pemain, bola energi Guardian).
+    
+    owner adalah tag pihak ("player", "guardian", ...) untuk memilih target
+    tabrakan, source adalah objek pemilik (untuk draw dan pembersihan).
+    """
+    __slots__ = ("owner", "source", "x", "y", "prev_x", "prev_y", "vx", "vy", "speed",
+                 "life", "max_life", "size", "distance_traveled", "max_distance", "index",
+                 "source_index")
+    
+    def __init__(self):
+        self.owner = ""
+        self.source: object = None
+        self.x = self.y = self.prev_x = self.prev_y = 0.0
+        self.vx = self.vy = self.speed = 0.0
+        self.life = self.max_life = 0.0
+        self.size = 0
+        self.distance_traveled = 0.0
+        self.max_distance = math.inf
+        self.index = -1
+        self.source_index = -1
+    
+    def rect(self) -> pygame.Rect:
+        half = self.size // 2
+        return pygame.Rect(int(self.x - half), int(self.y - half), self.size, self.size)
+    
+    def swept_rect(self) -> pygame.Rect:
+        """Rect yang mencakup seluruh lintasan frame ini (untuk broad phase grid)"""
+        half = self.size // 2
+        return self.rect().union(pygame.Rect(int(self.prev_x - half), int(self.prev_y - half),
+                                             self.size, self.size))
+    
+    def sweep(self, rect: pygame.Rect) -> Optional[float]:
+        """Waktu masuk lintasan frame ini ke rect (0..1), None jika tidak kena.
+        
+        Posisi akhir yang overlap selalu dihitung kena (t = 1 jika sapuan
+        float tidak menangkapnya karena pembulatan rect).
+        """
+        half = self.size / 2
+        t = sweep_entry(self.prev_x, self.prev_y, self.x - self.prev_x, self.y - self.prev_y,
+                        rect.left - half, rect.top - half, rect.right + half, rect.bottom + half)
+        if t is None and self.rect().colliderect(rect):
+            return 1.0
+        return t
+
+
+class ProjectilePool:
+    """Pool proyektil bersama dengan swap-remove dan satu lintasan integrasi+tabrakan.
+    
+    Record dialokasikan sekali dan dipakai ulang; active tidak punya urutan
+    tetap karena penghapusan menukar record terakhir ke slot yang kosong.
+    Daftar per source dijaga dengan swap-remove yang sama, jadi owned_by()
+    tidak perlu memfilter active.
+    """
+    
+    def __init__(self, capacity: int = PROJECTILE_POOL_SIZE):
+        self._free: List[Projectile] = [Projectile() for _ in range(capacity)]
+        self.active: List[Projectile] = []
+        # id(source) -> proyektil aktifnya; proj.source menjaga id tetap valid
+        self._owned: Dict[int, List[Projectile]] = {}
+        self.spawned = 0
+        self.peak = 0
+    
+    def __len__(self) -> int:
+        return len(self.active)
+    
+    def spawn(self, owner: str, source: object, x: float, y: float, vx: float, vy: float,
+              life: float, size: int, max_distance: float = math.inf) -> Projectile:
+        proj = self._free.pop() if self._free else Projectile()
+        proj.owner = owner
+        proj.source = source
+        proj.x, proj.y = x, y
+        proj.prev_x, proj.prev_y = x, y
+        proj.vx, proj.vy = vx, vy
+        proj.speed = math.sqrt(vx * vx + vy * vy)
+        proj.life = proj.max_life = life
+        proj.size = size
+        proj.distance_traveled = 0.0
+        proj.max_distance = max_distance
+        proj.index = len(self.active)
+        self.active.append(proj)
+        owned = self._owned.setdefault(id(source), [])
+        proj.source_index = len(owned)
+        owned.append(proj)
+        self.spawned += 1
+        if len(self.active) > self.peak:
+            self.peak = len(self.active)
+        return proj
+    
+    def release(self, proj: Projectile) -> None:
+        """Hapus proyektil aktif dalam O(1) (tukar dengan yang terakhir)"""
+        index = proj.index
+        if index < 0:
+            return
+        active = self.active
+        last = active.pop()
+        if last is not proj:
+            active[index] = last
+            last.index = index
+        proj.index = -1
+        
+        key = id(proj.source)
+        owned = self._owned[key]
+        last = owned.pop()
+        if last is not proj:
+            owned[proj.source_index] = last
+            last.source_index = proj.source_index
+        elif not owned:
+            del self._owned[key]
+        proj.source_index = -1
+        proj.source = None
+        self._free.append(proj)
+    
+    def owned_by(self, source: object) -> List[Projectile]:
+        """Proyektil aktif milik source (daftar internal: jangan diubah, salin sebelum release)"""
+        return self._owned.get(id(source), [])
+    
+    def clear(self, sources: Optional[Iterable[object]] = None) -> None:
+        """Lepas semua proyektil (atau hanya milik objek-objek di sources)"""
+        if sources is None:
+            for proj in reversed(self.active):
+                self.release(proj)
+            return
+        for source in sources:
+            owned = self._owned.get(id(source))
+            while owned:
+                self.release(owned[-1])
+    
+    def update(self, dt: float, collide: Optional[Callable[[Projectile], bool]] = None) -> None:
+        """Integrasi semua proyektil, buang yang kedaluwarsa, lalu collide(proj).
+        
+        collide mengembalikan True bila proyektil habis terpakai; prev_x/prev_y
+        berisi posisi awal frame untuk tabrakan tersapu. Iterasi mundur supaya
+        swap-remove tidak melewatkan record.
+        """
+        active = self.active
+        for index in range(len(active) - 1, -1, -1):
+            proj = active[index]
+            proj.prev_x = proj.x
+            proj.prev_y = proj.y
+            proj.x += proj.vx * dt
+            proj.y += proj.vy * dt
+            proj.life -= dt
+            proj.distance_traveled += proj.speed * dt
+            if proj.life <= 0 or proj.distance_traveled > proj.max_distance:
+                self.release(proj)
+            elif collide is not None and collide(proj):
+                self.release(proj)
+
+
+projectile_pool = ProjectilePool()
+
 
 # ==================== ENHANCED PARTICLE SYSTEM ====================
 @dataclass
@@ -131,17 +1028,193 @@ class ParticleData:
     rotation: float = 0.0
     rotation_speed: float = 0.0
 
+class ParticleAtlas:
+    """Sprite partikel mist, light_flower dan sparkle yang dipanggang sekali.
+    
+    Sprite dikuantisasi per ukuran, langkah alpha dan langkah rotasi lalu
+    disimpan saat pertama dipakai, sehingga draw cukup lookup + blit.
+    """
+    BAKED_TYPES = ("mist", "light_flower", "sparkle")
+    ALPHA_STEPS = 16
+    # Sparkle simetri 4 arah, jadi cukup seperempat putaran
+    ROTATION_STEPS = 16
+    ROTATION_PERIOD = math.pi / 2
+    
+    def __init__(self):
+        self._sprites: Dict[tuple, Tuple[pygame.Surface, int, int]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.memory_bytes = 0
+    
+    def get(self, particle_type: str, color: Tuple[int, int, int], size: int,
+            alpha_ratio: float, rotation: float = 0.0) -> Tuple[Optional[pygame.Surface], int, int]:
+        """Kembalikan (sprite, setengah lebar, blend flags) untuk partikel"""
+        alpha_step = min(self.ALPHA_STEPS, int(alpha_ratio * self.ALPHA_STEPS + 0.5))
+        if alpha_step <= 0:
+            return None, 0, 0
+        if particle_type == "sparkle":
+            rotation_step = int((rotation % self.ROTATION_PERIOD) / self.ROTATION_PERIOD
+                                * self.ROTATION_STEPS + 0.5) % self.ROTATION_STEPS
+        else:
+            rotation_step = 0
+        
+        key = (particle_type, color, size, alpha_step, rotation_step)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            return sprite
+        
+        self.misses += 1
+        sprite = self._bake(particle_type, color, size, alpha_step / self.ALPHA_STEPS,
+                            rotation_step * self.ROTATION_PERIOD / self.ROTATION_STEPS)
+        self._sprites[key] = sprite
+        surf = sprite[0]
+        self.memory_bytes += surf.get_width() * surf.get_height() * surf.get_bytesize()
+        return sprite
+    
+    def bake(self, particle_type: str, color: Tuple[int, int, int],
+             sizes: Tuple[int, ...] = (2, 3, 4, 5)) -> None:
+        """Panggang semua variasi satu tipe/warna di depan (misal saat level dimuat)"""
+        rotations = self.ROTATION_STEPS if particle_type == "sparkle" else 1
+        for size in sizes:
+            for alpha_step in range(1, self.ALPHA_STEPS + 1):
+                for rotation_step in range(rotations):
+                    self.get(particle_type, color, size, alpha_step / self.ALPHA_STEPS,
+                             rotation_step * self.ROTATION_PERIOD / self.ROTATION_STEPS)
+    
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "sprites": len(self._sprites),
+            "memory_bytes": self.memory_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+    
+    def _bake(self, particle_type: str, color: Tuple[int, int, int], size: int,
+              alpha_ratio: float, rotation: float) -> Tuple[pygame.Surface, int, int]:
+        if particle_type == "mist":
+            mist_size = int(size * 2.5)
+            mist_surf = new_surface((mist_size * 2, mist_size * 2), pygame.SRCALPHA)
+            mist_alpha = int(100 * alpha_ratio)
+            
+            # Mist dengan gradien
+            for i in range(3, 0, -1):
+                layer_size = mist_size - i * 4
+                layer_alpha = mist_alpha // (i + 2)
+                pygame.draw.circle(mist_surf, (*color, layer_alpha), 
+                                 (mist_size, mist_size), layer_size)
+            return mist_surf, mist_size, pygame.BLEND_ALPHA_SDL2
+        
+        if particle_type == "light_flower":
+            glow_surf = new_surface((size * 8, size * 8), pygame.SRCALPHA)
+            glow_alpha = int(180 * alpha_ratio)
+            
+            # Outer glow
+            pygame.draw.circle(glow_surf, (*color, glow_alpha // 2), 
+                             (size * 4, size * 4), size * 4)
+            # Inner glow
+            pygame.draw.circle(glow_surf, (*color, glow_alpha), 
+                             (size * 4, size * 4), size * 2)
+            # Core
+            core_alpha = int(220 * alpha_ratio)
+            pygame.draw.circle(glow_surf, (255, 255, 255, core_alpha),
+                             (size * 4, size * 4), size)
+            return glow_surf, size * 4, pygame.BLEND_ADD
+        
+        # Sparkle: bintang berujung 4
+        sparkle_size = size * 2
+        sparkle_surf = new_surface((sparkle_size * 2, sparkle_size * 2), pygame.SRCALPHA)
+        sparkle_alpha = int(200 * alpha_ratio)
+        points = []
+        for i in range(4):
+            angle = rotation + i * math.pi / 2
+            outer_x = sparkle_size + math.cos(angle) * sparkle_size
+            outer_y = sparkle_size + math.sin(angle) * sparkle_size
+            inner_x = sparkle_size + math.cos(angle + math.pi/4) * (sparkle_size * 0.4)
+            inner_y = sparkle_size + math.sin(angle + math.pi/4) * (sparkle_size * 0.4)
+            points.append((outer_x, outer_y))
+            points.append((inner_x, inner_y))
+        
+        pygame.draw.polygon(sparkle_surf, (*color, sparkle_alpha), points)
+        return sparkle_surf, sparkle_size, pygame.BLEND_ADD
+
+
 class ParticleSystem:
-    def __init__(self, max_particles: int = PARTICLE_POOL_SIZE):
+    OVERFLOW_POLICIES = ("drop", "recycle", "grow")
+    
+    def __init__(self, max_particles: int = PARTICLE_POOL_SIZE,
+                 overflow_policy: str = PARTICLE_OVERFLOW_POLICY,
+                 max_capacity: int = PARTICLE_POOL_CAP,
+                 atlas: Optional[ParticleAtlas] = None):
+        if overflow_policy not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
         self.particles: List[ParticleData] = [ParticleData() for _ in range(max_particles)]
         self.max_particles = max_particles
+        self.overflow_policy = overflow_policy
+        self.max_capacity = max(max_capacity, max_particles)
         self.glow_cache = {}
+        self.atlas = atlas or ParticleAtlas()
+        
+        # Free-list (stack) slot kosong; pop() memberi indeks terkecil lebih dulu
+        self._free: List[int] = list(range(max_particles - 1, -1, -1))
+        # Urutan alokasi (index, serial) untuk kebijakan "recycle"
+        self._spawn_order: deque = deque()
+        self._serials: List[int] = [0] * max_particles
+        self._next_serial = 0
+        self.stats = {"allocations": 0, "drops": 0, "recycles": 0, "grows": 0}
+    
+    def live_count(self) -> int:
+        return len(self.particles) - len(self._free)
+    
+    def _allocate(self) -> Optional[int]:
+        """Ambil slot kosong dalam O(1), terapkan overflow policy jika penuh"""
+        if not self._free:
+            if self.overflow_policy == "grow" and len(self.particles) < self.max_capacity:
+                self._grow()
+            elif self.overflow_policy == "recycle":
+                index = self._pop_oldest()
+                if index is not None:
+                    self.stats["recycles"] += 1
+                    return self._mark_allocated(index)
+        if not self._free:
+            return None
+        return self._mark_allocated(self._free.pop())
+    
+    def _mark_allocated(self, index: int) -> int:
+        self._next_serial += 1
+        self._serials[index] = self._next_serial
+        self._spawn_order.append((index, self._next_serial))
+        # Buang entri basi agar antrian tidak tumbuh tanpa batas
+        if len(self._spawn_order) > 2 * len(self.particles):
+            self._spawn_order = deque(
+                (i, serial) for i, serial in self._spawn_order
+                if self.particles[i].active and self._serials[i] == serial)
+        self.stats["allocations"] += 1
+        return index
+    
+    def _pop_oldest(self) -> Optional[int]:
+        while self._spawn_order:
+            index, serial = self._spawn_order.popleft()
+            if self.particles[index].active and self._serials[index] == serial:
+                return index
+        return None
+    
+    def _grow(self) -> None:
+        old_size = len(self.particles)
+        new_size = min(self.max_capacity, max(old_size * 2, old_size + 1))
+        self.particles.extend(ParticleData() for _ in range(new_size - old_size))
+        self._serials.extend([0] * (new_size - old_size))
+        self._free.extend(range(new_size - 1, old_size - 1, -1))
+        self.max_particles = new_size
+        self.stats["grows"] += 1
     
     def create_glow_surface(self, size: int, color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
         """Cache glow surfaces untuk performa lebih baik"""
         key = (size, color, alpha)
         if key not in self.glow_cache:
-            surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            surf = new_surface((size * 2, size * 2), pygame.SRCALPHA)
             # Multi-layer glow untuk efek lebih halus
             for i in range(3, 0, -1):
                 layer_size = size - i * 2
@@ -155,45 +1228,49 @@ class ParticleSystem:
              count: int = 10, spread: float = 50.0, life: float = 1.0,
              particle_type: str = "default", gravity: float = 50.0,
              rotation_speed: float = 0.0) -> None:
-        emitted = 0
-        for particle in self.particles:
-            if not particle.active and emitted < count:
-                angle = random.uniform(0, math.pi * 2)
-                speed = random.uniform(20, spread)
-                particle.x = x
-                particle.y = y
-                particle.vx = math.cos(angle) * speed
-                
-                if particle_type == "ember":
-                    particle.vy = random.uniform(-70, -30)
-                    particle.rotation_speed = random.uniform(-2, 2)
-                elif particle_type == "mist":
-                    particle.vx = random.uniform(-12, 12)
-                    particle.vy = random.uniform(-8, 8)
-                    particle.rotation_speed = random.uniform(-0.5, 0.5)
-                elif particle_type == "light_flower":
-                    particle.vx = random.uniform(-20, 20)
-                    particle.vy = random.uniform(-50, -30)
-                    particle.rotation_speed = random.uniform(-1, 1)
-                elif particle_type == "sparkle":
-                    particle.vx = random.uniform(-15, 15)
-                    particle.vy = random.uniform(-15, 15)
-                    particle.rotation_speed = random.uniform(-3, 3)
-                else:
-                    particle.vy = math.sin(angle) * speed - 40
-                
-                particle.life = life
-                particle.max_life = life
-                particle.color = color
-                particle.size = random.randint(2, 5)
-                particle.active = True
-                particle.particle_type = particle_type
-                particle.rotation = random.uniform(0, math.pi * 2)
-                particle.rotation_speed = rotation_speed or random.uniform(-2, 2)
-                emitted += 1
+        rng = RNG.particles
+        for emitted in range(count):
+            index = self._allocate()
+            if index is None:
+                self.stats["drops"] += count - emitted
+                break
+            particle = self.particles[index]
+            angle = rng.uniform(0, math.pi * 2)
+            speed = rng.uniform(20, spread)
+            particle.x = x
+            particle.y = y
+            particle.vx = math.cos(angle) * speed
+            
+            if particle_type == "ember":
+                particle.vy = rng.uniform(-70, -30)
+                particle.rotation_speed = rng.uniform(-2, 2)
+            elif particle_type == "mist":
+                particle.vx = rng.uniform(-12, 12)
+                particle.vy = rng.uniform(-8, 8)
+                particle.rotation_speed = rng.uniform(-0.5, 0.5)
+            elif particle_type == "light_flower":
+                particle.vx = rng.uniform(-20, 20)
+                particle.vy = rng.uniform(-50, -30)
+                particle.rotation_speed = rng.uniform(-1, 1)
+            elif particle_type == "sparkle":
+                particle.vx = rng.uniform(-15, 15)
+                particle.vy = rng.uniform(-15, 15)
+                particle.rotation_speed = rng.uniform(-3, 3)
+            else:
+                particle.vy = math.sin(angle) * speed - 40
+            
+            particle.life = life
+            particle.max_life = life
+            particle.color = color
+            particle.size = rng.randint(2, 5)
+            particle.active = True
+            particle.particle_type = particle_type
+            particle.rotation = rng.uniform(0, math.pi * 2)
+            particle.rotation_speed = rotation_speed or rng.uniform(-2, 2)
     
     def update(self, dt: float) -> None:
-        for particle in self.particles:
+        rng = RNG.particles
+        for index, particle in enumerate(self.particles):
             if particle.active:
                 particle.x += particle.vx * dt
                 particle.y += particle.vy * dt
@@ -201,8 +1278,8 @@ class ParticleSystem:
                 
                 if particle.particle_type == "ember":
                     particle.vy += 45 * dt
-                    if random.random() < 0.1:
-                        particle.vx += random.uniform(-12, 12)
+                    if rng.random() < 0.1:
+                        particle.vx += rng.uniform(-12, 12)
                 elif particle.particle_type == "mist":
                     particle.vy += 6 * dt
                     particle.vx += math.sin(particle.life * 3) * 0.8
@@ -217,79 +1294,286 @@ class ParticleSystem:
                 particle.life -= dt
                 if particle.life <= 0:
                     particle.active = False
+                    self._free.append(index)
     
     def draw(self, surface: pygame.Surface, camera_offset: Tuple[int, int]) -> None:
+        left, top, right, bottom = self.cull_bounds(surface)
+        batch: list = []
         for particle in self.particles:
-            if particle.active:
-                alpha_ratio = particle.life / particle.max_life
-                if alpha_ratio > 0:
-                    x = int(particle.x - camera_offset[0])
-                    y = int(particle.y - camera_offset[1])
-                    
-                    if particle.particle_type == "mist":
-                        mist_size = int(particle.size * 2.5)
-                        mist_surf = pygame.Surface((mist_size * 2, mist_size * 2), pygame.SRCALPHA)
-                        mist_alpha = int(100 * alpha_ratio)
-                        
-                        # Mist dengan gradien
-                        for i in range(3, 0, -1):
-                            layer_size = mist_size - i * 4
-                            layer_alpha = mist_alpha // (i + 2)
-                            pygame.draw.circle(mist_surf, (*particle.color, layer_alpha), 
-                                             (mist_size, mist_size), layer_size)
-                        
-                        surface.blit(mist_surf, (x - mist_size, y - mist_size), 
-                                   special_flags=pygame.BLEND_ALPHA_SDL2)
-                        
-                    elif particle.particle_type == "light_flower":
-                        glow_surf = pygame.Surface((particle.size * 8, particle.size * 8), pygame.SRCALPHA)
-                        glow_alpha = int(180 * alpha_ratio)
-                        
-                        # Outer glow
-                        pygame.draw.circle(glow_surf, (*particle.color, glow_alpha // 2), 
-                                         (particle.size * 4, particle.size * 4), particle.size * 4)
-                        # Inner glow
-                        pygame.draw.circle(glow_surf, (*particle.color, glow_alpha), 
-                                         (particle.size * 4, particle.size * 4), particle.size * 2)
-                        # Core
-                        core_alpha = int(220 * alpha_ratio)
-                        pygame.draw.circle(glow_surf, (255, 255, 255, core_alpha),
-                                         (particle.size * 4, particle.size * 4), particle.size)
-                        
-                        surface.blit(glow_surf, (x - particle.size * 4, y - particle.size * 4),
-                                   special_flags=pygame.BLEND_ADD)
-                        
-                    elif particle.particle_type == "sparkle":
-                        # Sparkle dengan rotasi
-                        sparkle_size = particle.size * 2
-                        sparkle_surf = pygame.Surface((sparkle_size * 2, sparkle_size * 2), pygame.SRCALPHA)
-                        sparkle_alpha = int(200 * alpha_ratio)
-                        
-                        # Bintang berujung 4
-                        points = []
-                        for i in range(4):
-                            angle = particle.rotation + i * math.pi / 2
-                            outer_x = sparkle_size + math.cos(angle) * sparkle_size
-                            outer_y = sparkle_size + math.sin(angle) * sparkle_size
-                            inner_x = sparkle_size + math.cos(angle + math.pi/4) * (sparkle_size * 0.4)
-                            inner_y = sparkle_size + math.sin(angle + math.pi/4) * (sparkle_size * 0.4)
-                            points.append((outer_x, outer_y))
-                            points.append((inner_x, inner_y))
-                        
-                        pygame.draw.polygon(sparkle_surf, (*particle.color, sparkle_alpha), points)
-                        surface.blit(sparkle_surf, (x - sparkle_size, y - sparkle_size),
-                                   special_flags=pygame.BLEND_ADD)
-                        
-                    else:
-                        # Particle biasa dengan glow
-                        particle_size = int(particle.size * (0.8 + 0.4 * math.sin(particle.life * 5)))
-                        pygame.draw.circle(surface, particle.color, (x, y), particle_size)
-                        
-                        if particle_size > 2:
-                            glow_surf = self.create_glow_surface(particle_size, particle.color, 
-                                                               int(120 * alpha_ratio))
-                            surface.blit(glow_surf, (x - particle_size, y - particle_size),
-                                       special_flags=pygame.BLEND_ALPHA_SDL2)
+            if not particle.active:
+                continue
+            x = int(particle.x - camera_offset[0])
+            y = int(particle.y - camera_offset[1])
+            # Cull sebelum kerja apa pun
+            if x < left or x > right or y < top or y > bottom:
+                continue
+            self.batch_particle(batch, surface, particle.particle_type, x, y,
+                                particle.color, particle.size,
+                                particle.life, particle.max_life, particle.rotation)
+        self.flush_batch(surface, batch)
+    
+    @staticmethod
+    def cull_bounds(surface: pygame.Surface) -> Tuple[int, int, int, int]:
+        """Batas layar (plus margin sprite terbesar) untuk culling partikel"""
+        clip = surface.get_clip()
+        return (clip.left - PARTICLE_CULL_MARGIN, clip.top - PARTICLE_CULL_MARGIN,
+                clip.right + PARTICLE_CULL_MARGIN, clip.bottom + PARTICLE_CULL_MARGIN)
+    
+    @staticmethod
+    def flush_batch(surface: pygame.Surface, batch: list) -> None:
+        """Kirim semua blit yang terkumpul (urutan dijaga) dalam satu blits(), lalu kosongkan"""
+        if batch:
+            surface.blits(batch, doreturn=False)
+            batch.clear()
+    
+    def draw_particle(self, surface: pygame.Surface, particle_type: str, x: int, y: int,
+                      color: Tuple[int, int, int], size: int, life: float,
+                      max_life: float, rotation: float) -> None:
+        """Gambar satu partikel langsung (tanpa batching)"""
+        batch: list = []
+        self.batch_particle(batch, surface, particle_type, x, y, color, size,
+                            life, max_life, rotation)
+        self.flush_batch(surface, batch)
+    
+    def batch_particle(self, batch: list, surface: pygame.Surface,
+                       particle_type: str, x: int, y: int,
+                       color: Tuple[int, int, int], size: int, life: float,
+                       max_life: float, rotation: float) -> None:
+        """Masukkan satu partikel ke batch (dipakai semua backend).
+        
+        Urutan gambar sama dengan menggambar satu per satu: batch dikirim dulu
+        sebelum inti partikel biasa digambar langsung, lalu glow-nya menyusul.
+        """
+        alpha_ratio = life / max_life
+        if alpha_ratio <= 0:
+            return
+        
+        if particle_type in ParticleAtlas.BAKED_TYPES:
+            sprite, half, flags = self.atlas.get(particle_type, color, size, alpha_ratio, rotation)
+            if sprite is not None:
+                batch.append((sprite, (x - half, y - half), None, flags))
+        else:
+            # Particle biasa dengan glow
+            particle_size = int(size * (0.8 + 0.4 * math.sin(life * 5)))
+            self.flush_batch(surface, batch)
+            pygame.draw.circle(surface, color, (x, y), particle_size)
+            
+            if particle_size > 2:
+                glow_surf = self.create_glow_surface(particle_size, color, 
+                                                   int(120 * alpha_ratio))
+                batch.append((glow_surf, (x - particle_size, y - particle_size),
+                              None, pygame.BLEND_ALPHA_SDL2))
+
+
+class VectorParticleSystem(ParticleSystem):
+    """Backend partikel structure-of-arrays berbasis NumPy.
+    
+    Semua partikel hidup disimpan rapat di awal array, sehingga update cukup
+    beberapa operasi vektor per frame dan partikel mati langsung dipadatkan.
+    Signature emit()/update()/draw() sama dengan ParticleSystem.
+    """
+    TYPE_NAMES = ("default", "ember", "mist", "light_flower", "sparkle")
+    TYPE_CODES = {name: code for code, name in enumerate(TYPE_NAMES)}
+    # Gravitasi dan goyangan horizontal per tipe (urutan sama dengan TYPE_NAMES)
+    TYPE_GRAVITY = (60.0, 45.0, 6.0, 12.0, 30.0)
+    TYPE_WOBBLE_FREQ = (0.0, 0.0, 3.0, 0.0, 5.0)
+    TYPE_WOBBLE_AMP = (0.0, 0.0, 0.8, 0.0, 2.0)
+    
+    FLOAT_FIELDS = ("x", "y", "vx", "vy", "life", "max_life", "rotation", "rotation_speed")
+    
+    def __init__(self, max_particles: int = VECTOR_PARTICLE_CAPACITY,
+                 initial_capacity: int = PARTICLE_POOL_SIZE,
+                 overflow_policy: str = PARTICLE_OVERFLOW_POLICY,
+                 atlas: Optional[ParticleAtlas] = None):
+        if not HAS_NUMPY:
+            raise RuntimeError("VectorParticleSystem membutuhkan NumPy")
+        if overflow_policy not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+        # Array selalu tumbuh sampai max_particles, jadi "grow" sama dengan "drop" di cap
+        self.max_particles = max_particles
+        self.max_capacity = max_particles
+        self.overflow_policy = overflow_policy
+        self.stats = {"allocations": 0, "drops": 0, "recycles": 0, "grows": 0}
+        self.count = 0
+        self.glow_cache = {}
+        self.atlas = atlas or ParticleAtlas()
+        self._capacity = 0
+        self._palette: List[Tuple[int, int, int]] = []
+        self._palette_index: Dict[Tuple[int, int, int], int] = {}
+        self._gravity = np.array(self.TYPE_GRAVITY)
+        self._wobble_freq = np.array(self.TYPE_WOBBLE_FREQ)
+        self._wobble_amp = np.array(self.TYPE_WOBBLE_AMP)
+        self._resize(max(1, min(initial_capacity, max_particles)))
+    
+    def _resize(self, capacity: int) -> None:
+        """Alokasikan ulang array dengan kapasitas baru, salin partikel hidup"""
+        n = self.count
+        for name in self.FLOAT_FIELDS:
+            arr = np.zeros(capacity, dtype=np.float64)
+            if self._capacity:
+                arr[:n] = getattr(self, name)[:n]
+            setattr(self, name, arr)
+        for name, dtype in (("size", np.int32), ("ptype", np.uint8), ("color_index", np.uint16)):
+            arr = np.zeros(capacity, dtype=dtype)
+            if self._capacity:
+                arr[:n] = getattr(self, name)[:n]
+            setattr(self, name, arr)
+        if self._capacity:
+            self.stats["grows"] += 1
+        self._capacity = capacity
+    
+    def live_count(self) -> int:
+        return self.count
+    
+    def _recycle_oldest(self, k: int) -> None:
+        """Buang k partikel tertua (selalu di depan array karena urutan terjaga)"""
+        n = self.count
+        for name in self.FLOAT_FIELDS + ("size", "ptype", "color_index"):
+            arr = getattr(self, name)
+            arr[:n - k] = arr[k:n]
+        self.count = n - k
+        self.stats["recycles"] += k
+    
+    def _color_code(self, color: Tuple[int, int, int]) -> int:
+        color = tuple(color[:3])
+        code = self._palette_index.get(color)
+        if code is None:
+            code = len(self._palette)
+            self._palette.append(color)
+            self._palette_index[color] = code
+        return code
+    
+    @staticmethod
+    def _uniform(low: float, high: float, n: int) -> "np.ndarray":
+        return low + (high - low) * RNG.numpy("particles").random(n)
+    
+    def emit(self, x: float, y: float, color: Tuple[int, int, int], 
+             count: int = 10, spread: float = 50.0, life: float = 1.0,
+             particle_type: str = "default", gravity: float = 50.0,
+             rotation_speed: float = 0.0) -> None:
+        if count <= 0:
+            return
+        free = self.max_particles - self.count
+        if count > free and self.overflow_policy == "recycle":
+            self._recycle_oldest(min(count, self.max_particles) - free)
+            free = self.max_particles - self.count
+        n = min(count, free)
+        self.stats["drops"] += count - n
+        if n <= 0:
+            return
+        self.stats["allocations"] += n
+        start = self.count
+        end = start + n
+        if end > self._capacity:
+            self._resize(min(self.max_particles, max(end, self._capacity * 2)))
+        
+        angle = self._uniform(0, math.pi * 2, n)
+        speed = self._uniform(20, spread, n)
+        self.x[start:end] = x
+        self.y[start:end] = y
+        
+        if particle_type == "ember":
+            self.vx[start:end] = np.cos(angle) * speed
+            self.vy[start:end] = self._uniform(-70, -30, n)
+        elif particle_type == "mist":
+            self.vx[start:end] = self._uniform(-12, 12, n)
+            self.vy[start:end] = self._uniform(-8, 8, n)
+        elif particle_type == "light_flower":
+            self.vx[start:end] = self._uniform(-20, 20, n)
+            self.vy[start:end] = self._uniform(-50, -30, n)
+        elif particle_type == "sparkle":
+            self.vx[start:end] = self._uniform(-15, 15, n)
+            self.vy[start:end] = self._uniform(-15, 15, n)
+        else:
+            self.vx[start:end] = np.cos(angle) * speed
+            self.vy[start:end] = np.sin(angle) * speed - 40
+        
+        self.life[start:end] = life
+        self.max_life[start:end] = life
+        self.size[start:end] = RNG.numpy("particles").integers(2, 6, n)
+        self.ptype[start:end] = self.TYPE_CODES.get(particle_type, 0)
+        self.color_index[start:end] = self._color_code(color)
+        self.rotation[start:end] = self._uniform(0, math.pi * 2, n)
+        if rotation_speed:
+            self.rotation_speed[start:end] = rotation_speed
+        else:
+            self.rotation_speed[start:end] = self._uniform(-2, 2, n)
+        self.count = end
+    
+    def update(self, dt: float) -> None:
+        n = self.count
+        if n == 0:
+            return
+        x, y = self.x[:n], self.y[:n]
+        vx, vy = self.vx[:n], self.vy[:n]
+        life = self.life[:n]
+        ptype = self.ptype[:n]
+        
+        x += vx * dt
+        y += vy * dt
+        self.rotation[:n] += self.rotation_speed[:n] * dt
+        
+        vy += self._gravity[ptype] * dt
+        vx += np.sin(life * self._wobble_freq[ptype]) * self._wobble_amp[ptype]
+        
+        # Ember sesekali terdorong angin
+        gust = (ptype == self.TYPE_CODES["ember"]) & (RNG.numpy("particles").random(n) < 0.1)
+        gust_count = int(gust.sum())
+        if gust_count:
+            vx[gust] += self._uniform(-12, 12, gust_count)
+        
+        life -= dt
+        alive = life > 0
+        alive_count = int(alive.sum())
+        if alive_count < n:
+            self._compact(alive, alive_count)
+    
+    def _compact(self, alive: "np.ndarray", alive_count: int) -> None:
+        """Geser partikel hidup ke depan array (urutan tetap terjaga)"""
+        n = self.count
+        for name in self.FLOAT_FIELDS + ("size", "ptype", "color_index"):
+            arr = getattr(self, name)
+            arr[:alive_count] = arr[:n][alive]
+        self.count = alive_count
+    
+    def draw(self, surface: pygame.Surface, camera_offset: Tuple[int, int]) -> None:
+        n = self.count
+        if n == 0:
+            return
+        left, top, right, bottom = self.cull_bounds(surface)
+        sx = (self.x[:n] - camera_offset[0]).astype(np.int64)
+        sy = (self.y[:n] - camera_offset[1]).astype(np.int64)
+        visible = np.flatnonzero((sx >= left) & (sx <= right) & (sy >= top) & (sy <= bottom)
+                                 & (self.life[:n] > 0))
+        if visible.size == 0:
+            return
+        
+        xs = sx[visible].tolist()
+        ys = sy[visible].tolist()
+        ptypes = self.ptype[visible].tolist()
+        colors = self.color_index[visible].tolist()
+        sizes = self.size[visible].tolist()
+        lives = self.life[visible].tolist()
+        max_lives = self.max_life[visible].tolist()
+        rotations = self.rotation[visible].tolist()
+        names = self.TYPE_NAMES
+        palette = self._palette
+        pending: list = []
+        batch = self.batch_particle
+        
+        for i in range(len(xs)):
+            batch(pending, surface, names[ptypes[i]], xs[i], ys[i], palette[colors[i]],
+                  sizes[i], lives[i], max_lives[i], rotations[i])
+        self.flush_batch(surface, pending)
+
+
+def create_particle_system(backend: str = PARTICLE_BACKEND) -> ParticleSystem:
+    """Pilih backend partikel; "vector" jatuh ke pool klasik jika NumPy tidak ada"""
+    if backend not in PARTICLE_BACKENDS:
+        raise ValueError(f"Unknown particle backend {backend!r}, expected one of {PARTICLE_BACKENDS}")
+    if backend == "vector" and HAS_NUMPY:
+        return VectorParticleSystem()
+    return ParticleSystem()
 
 
 # ==================== ENHANCED CAMERA ====================
@@ -339,6 +1623,11 @@ class Camera:
             self.shake_timer -= dt
             self.shake_intensity *= self.shake_decay
     
+    def get_view_rect(self) -> pygame.Rect:
+        """Area dunia yang terlihat (tanpa shake)"""
+        return pygame.Rect(int(self.x), int(self.y),
+                           int(self.width / self.zoom), int(self.height / self.zoom))
+    
     def get_offset(self) -> Tuple[int, int]:
         offset_x = int(self.x)
         offset_y = int(self.y)
@@ -346,8 +1635,8 @@ class Camera:
         if self.shake_timer > 0:
             # Shake dengan easing
             intensity = self.shake_intensity * (self.shake_timer / 0.3)
-            angle = random.uniform(0, math.pi * 2)
-            distance = random.uniform(0, intensity)
+            angle = RNG.camera.uniform(0, math.pi * 2)
+            distance = RNG.camera.uniform(0, intensity)
             offset_x += int(math.cos(angle) * distance)
             offset_y += int(math.sin(angle) * distance)
         
@@ -358,6 +1647,11 @@ class Location:
     def __init__(self, name: str, pos: Tuple[int, int], color: Tuple[int, int, int], 
                  level: Level, radius: int = 44):
         self.name = name
+        # Posisi/radius dalam koordinat desain (WINDOW_WIDTH x WINDOW_HEIGHT);
+        # pos/radius adalah nilai ter-skala untuk surface tujuan
+        self.design_pos = pos
+        self.design_radius = radius
+        self.scale = 1.0
         self.pos = pos
         self.color = color
         self.level = level
@@ -369,14 +1663,29 @@ class Location:
         self.glow_surface = None
         self.create_glow_surface()
         
+    def set_scale(self, scale: float) -> None:
+        """Skala posisi dan ukuran dari koordinat desain ke surface tujuan"""
+        if scale == self.scale:
+            return
+        self.scale = scale
+        self.pos = (round(self.design_pos[0] * scale), round(self.design_pos[1] * scale))
+        self.radius = max(1, round(self.design_radius * scale))
+        self.create_glow_surface()
+    
+    def _px(self, value: float) -> int:
+        """Ukuran desain (px window) ke px surface tujuan"""
+        return round(value * self.scale)
+        
     def create_glow_surface(self):
         """Create cached glow surface untuk performa"""
-        glow_size = self.radius + 20
-        self.glow_surface = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+        glow_size = self.radius + self._px(20)
+        self.glow_surface = new_surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+        # Glow yang sudah dikalikan alpha hover/normal
+        self._tinted_glow: Dict[int, pygame.Surface] = {}
         
         # Multi-layer glow
         for i in range(4, 0, -1):
-            layer_size = glow_size - i * 4
+            layer_size = glow_size - i * self._px(4)
             layer_alpha = 60 // (i + 1)
             pygame.draw.circle(self.glow_surface, (*self.color, layer_alpha), 
                              (glow_size, glow_size), layer_size)
@@ -390,21 +1699,25 @@ class Location:
         
     def draw(self, surface: pygame.Surface) -> None:
         pulse = (math.sin(self.pulse_timer * 2) + 1) * 0.1 + 0.9
+        px = self._px
         
         # Outer glow if unlocked
         if self.unlocked:
             glow_alpha = 120 if self.hovered else 60
-            temp_glow = self.glow_surface.copy()
-            temp_glow.fill((255, 255, 255, glow_alpha), None, pygame.BLEND_RGBA_MULT)
-            surface.blit(temp_glow, (self.pos[0] - (self.radius + 20), 
-                                   self.pos[1] - (self.radius + 20)))
+            temp_glow = self._tinted_glow.get(glow_alpha)
+            if temp_glow is None:
+                temp_glow = self.glow_surface.copy()
+                temp_glow.fill((255, 255, 255, glow_alpha), None, pygame.BLEND_RGBA_MULT)
+                self._tinted_glow[glow_alpha] = temp_glow
+            surface.blit(temp_glow, (self.pos[0] - (self.radius + px(20)), 
+                                   self.pos[1] - (self.radius + px(20))))
         
         # Main circle dengan efek 3D
         color = self.color if self.unlocked else COLOR_LOCATION_INACTIVE
         current_radius = int(self.radius * pulse)
         
         # Shadow
-        shadow_offset = 3
+        shadow_offset = px(3)
         pygame.draw.circle(surface, (0, 0, 0, 100), 
                          (self.pos[0] + shadow_offset, self.pos[1] + shadow_offset), 
                          current_radius)
@@ -413,8 +1726,8 @@ class Location:
         pygame.draw.circle(surface, color, self.pos, current_radius)
         
         # Highlight
-        highlight_size = current_radius - 2
-        highlight_surf = pygame.Surface((highlight_size * 2, highlight_size * 2), pygame.SRCALPHA)
+        highlight_size = current_radius - px(2)
+        highlight_surf = new_surface((highlight_size * 2, highlight_size * 2), pygame.SRCALPHA)
         pygame.draw.circle(highlight_surf, (255, 255, 255, 60), 
                          (highlight_size, highlight_size), highlight_size)
         surface.blit(highlight_surf, (self.pos[0] - highlight_size, 
@@ -435,11 +1748,11 @@ class Location:
         
         # Checkmark dengan glow
         if self.codex_read:
-            check_size = 14
-            check_pos = (self.pos[0] + 28, self.pos[1] - 28)
+            check_size = px(14)
+            check_pos = (self.pos[0] + px(28), self.pos[1] - px(28))
             
             # Checkmark glow
-            check_glow = pygame.Surface((check_size * 4, check_size * 4), pygame.SRCALPHA)
+            check_glow = new_surface((check_size * 4, check_size * 4), pygame.SRCALPHA)
             pygame.draw.circle(check_glow, (100, 255, 100, 100), 
                              (check_size * 2, check_size * 2), check_size * 2)
             surface.blit(check_glow, (check_pos[0] - check_size * 2, 
@@ -447,107 +1760,110 @@ class Location:
             
             # Checkmark
             pygame.draw.circle(surface, (80, 220, 80), check_pos, check_size)
-            font = pygame.font.Font(None, 22)
-            check = font.render("✓", True, (255, 255, 255))
-            surface.blit(check, (check_pos[0] - 7, check_pos[1] - 9))
+            check = render_text("✓", max(1, px(22)), (255, 255, 255))
+            surface.blit(check, (check_pos[0] - px(7), check_pos[1] - px(9)))
     
     def draw_tree_icon(self, surface: pygame.Surface):
         """Draw enhanced tree icon"""
+        px = self._px
         # Trunk
-        trunk_width = 16
-        trunk_height = 24
+        trunk_width = px(16)
+        trunk_height = px(24)
         trunk_x = self.pos[0] - trunk_width // 2
         trunk_y = self.pos[1] - trunk_height // 2
         pygame.draw.rect(surface, (70, 140, 70), 
                        (trunk_x, trunk_y, trunk_width, trunk_height), 
-                       border_radius=4)
+                       border_radius=px(4))
         
         # Canopy layers
         canopy_colors = [(90, 200, 90), (110, 210, 110), (130, 220, 130)]
         for i, color in enumerate(canopy_colors):
-            canopy_y = self.pos[1] - 20 - i * 8
-            canopy_radius = 20 - i * 4
+            canopy_y = self.pos[1] - px(20) - i * px(8)
+            canopy_radius = px(20) - i * px(4)
             pygame.draw.circle(surface, color, (self.pos[0], canopy_y), canopy_radius)
             
             # Highlight
-            highlight_surf = pygame.Surface((canopy_radius * 2, canopy_radius * 2), pygame.SRCALPHA)
+            highlight_surf = new_surface((canopy_radius * 2, canopy_radius * 2), pygame.SRCALPHA)
             pygame.draw.circle(highlight_surf, (255, 255, 255, 40), 
                              (canopy_radius, canopy_radius), canopy_radius)
             surface.blit(highlight_surf, (self.pos[0] - canopy_radius, canopy_y - canopy_radius))
     
     def draw_mountain_icon(self, surface: pygame.Surface):
         """Draw enhanced mountain icon"""
+        px = self._px
         # Mountain base
         base_points = [
-            (self.pos[0] - 24, self.pos[1] + 12),
-            (self.pos[0], self.pos[1] - 28),
-            (self.pos[0] + 24, self.pos[1] + 12)
+            (self.pos[0] - px(24), self.pos[1] + px(12)),
+            (self.pos[0], self.pos[1] - px(28)),
+            (self.pos[0] + px(24), self.pos[1] + px(12))
         ]
         pygame.draw.polygon(surface, (170, 100, 100), base_points)
         
         # Snow cap
         snow_points = [
-            (self.pos[0] - 12, self.pos[1] - 8),
-            (self.pos[0], self.pos[1] - 28),
-            (self.pos[0] + 12, self.pos[1] - 8)
+            (self.pos[0] - px(12), self.pos[1] - px(8)),
+            (self.pos[0], self.pos[1] - px(28)),
+            (self.pos[0] + px(12), self.pos[1] - px(8))
         ]
         pygame.draw.polygon(surface, (240, 240, 255), snow_points)
         
         # Volcano crater dengan lava glow
-        crater_glow = pygame.Surface((24, 24), pygame.SRCALPHA)
-        pygame.draw.circle(crater_glow, (255, 140, 60, 150), (12, 12), 12)
-        surface.blit(crater_glow, (self.pos[0] - 12, self.pos[1] - 12))
+        crater = px(12)
+        crater_glow = new_surface((crater * 2, crater * 2), pygame.SRCALPHA)
+        pygame.draw.circle(crater_glow, (255, 140, 60, 150), (crater, crater), crater)
+        surface.blit(crater_glow, (self.pos[0] - crater, self.pos[1] - crater))
         
-        pygame.draw.circle(surface, (255, 100, 60), self.pos, 10)
-        pygame.draw.circle(surface, (255, 180, 80), self.pos, 6)
+        pygame.draw.circle(surface, (255, 100, 60), self.pos, px(10))
+        pygame.draw.circle(surface, (255, 180, 80), self.pos, px(6))
     
     def draw_castle_icon(self, surface: pygame.Surface):
         """Draw enhanced castle icon"""
+        px = self._px
         # Main castle body
-        castle_width = 36
-        castle_height = 24
+        castle_width = px(36)
+        castle_height = px(24)
         castle_x = self.pos[0] - castle_width // 2
         castle_y = self.pos[1] - castle_height // 2
         
         # Castle base dengan shading
         pygame.draw.rect(surface, (220, 200, 120), 
                        (castle_x, castle_y, castle_width, castle_height),
-                       border_radius=6)
+                       border_radius=px(6))
         
         # Shadow effect
         pygame.draw.rect(surface, (200, 180, 100), 
                        (castle_x, castle_y, castle_width, castle_height),
-                       width=2, border_radius=6)
+                       width=max(1, px(2)), border_radius=px(6))
         
         # Towers
-        tower_width = 12
-        tower_height = 16
-        left_tower_x = castle_x - 4
-        right_tower_x = castle_x + castle_width - tower_width + 4
+        tower_width = px(12)
+        tower_height = px(16)
+        left_tower_x = castle_x - px(4)
+        right_tower_x = castle_x + castle_width - tower_width + px(4)
         
         for tx in [left_tower_x, right_tower_x]:
             pygame.draw.rect(surface, (200, 180, 100), 
-                           (tx, castle_y - 8, tower_width, tower_height),
-                           border_radius=4)
+                           (tx, castle_y - px(8), tower_width, tower_height),
+                           border_radius=px(4))
             
             # Tower roofs
             roof_points = [
-                (tx, castle_y - 8),
-                (tx + tower_width // 2, castle_y - 16),
-                (tx + tower_width, castle_y - 8)
+                (tx, castle_y - px(8)),
+                (tx + tower_width // 2, castle_y - px(16)),
+                (tx + tower_width, castle_y - px(8))
             ]
             pygame.draw.polygon(surface, (180, 160, 90), roof_points)
         
         # Flag dengan animasi sederhana
-        flag_y = castle_y - 20 + math.sin(self.pulse_timer) * 2
+        flag_y = castle_y - px(20) + math.sin(self.pulse_timer) * 2 * self.scale
         pygame.draw.line(surface, (120, 100, 60), 
-                       (self.pos[0], castle_y - 8), 
-                       (self.pos[0], flag_y), 3)
+                       (self.pos[0], castle_y - px(8)), 
+                       (self.pos[0], flag_y), max(1, px(3)))
         
         flag_points = [
             (self.pos[0], flag_y),
-            (self.pos[0] + 14, flag_y - 6),
-            (self.pos[0], flag_y - 12)
+            (self.pos[0] + px(14), flag_y - px(6)),
+            (self.pos[0], flag_y - px(12))
         ]
         pygame.draw.polygon(surface, (200, 60, 60), flag_points)
 
@@ -626,6 +1942,33 @@ class CodexPanel:
         self.panel_bg = None
         self.concept_badge = None
         self.illustration = None
+        # Lapisan gelap layar penuh, serta panel jadi dan posisinya dari draw terakhir
+        self._overlay: Optional[pygame.Surface] = None
+        self._surface: Optional[pygame.Surface] = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+    
+    def _backdrop(self, size: Tuple[int, int]) -> pygame.Surface:
+        if self._overlay is None or self._overlay.get_size() != size:
+            self._overlay = new_surface(size, pygame.SRCALPHA)
+            self._overlay.fill((0, 0, 0, 220))
+        return self._overlay
+    
+    def redraw(self, surface: pygame.Surface, background: pygame.Surface,
+               rects: List[pygame.Rect]) -> None:
+        """Susun ulang background + lapisan gelap + panel dari draw terakhir di rects.
+        
+        Hasilnya sama dengan draw() penuh di atas background tanpa menyusun panel
+        lagi. Tiap rect dimulai dari background agar rect yang tumpang tindih tidak
+        mencampur lapisan transparan dua kali.
+        """
+        overlay = self._backdrop(surface.get_size())
+        panel_rect = self.rect
+        for rect in rects:
+            surface.blit(background, rect, rect)
+            surface.blit(overlay, rect, rect)
+            clipped = rect.clip(panel_rect)
+            if self._surface is not None and clipped.width and clipped.height:
+                surface.blit(self._surface, clipped.topleft, clipped.move(-panel_rect.x, -panel_rect.y))
     
     def update_scroll(self, mouse_wheel: int):
         """Update scroll offset based on mouse wheel"""
@@ -634,49 +1977,48 @@ class CodexPanel:
             self.scroll_offset = max(0, min(self.scroll_offset, self.max_scroll))
     
     def draw(self, surface: pygame.Surface) -> pygame.Rect:
-        """Draw enhanced codex panel with improved layout"""
+        """Draw enhanced codex panel with improved layout.
+        
+        Panel disusun dalam ukuran desain lalu di-skala ke tinggi surface
+        (mis. render_surface saat lowres_screens); hanya digambar saat redraw penuh.
+        """
         if not self.visible:
             return pygame.Rect(0, 0, 0, 0)
             
         # Background overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 220))
-        surface.blit(overlay, (0, 0))
+        surface.blit(self._backdrop(surface.get_size()), (0, 0))
         
         # Panel dimensions
         panel_width = 900
         panel_height = 650
-        panel_x = (WINDOW_WIDTH - panel_width) // 2
-        panel_y = (WINDOW_HEIGHT - panel_height) // 2
         
         # Create panel surface
-        panel_surf = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+        panel_surf = new_surface((panel_width, panel_height), pygame.SRCALPHA)
         
         # Glass effect background
         pygame.draw.rect(panel_surf, (*COLOR_CODEX_BG[:3], 220), 
                         (0, 0, panel_width, panel_height), border_radius=25)
         
         # Border with gradient
-        border_surf = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+        border_surf = new_surface((panel_width, panel_height), pygame.SRCALPHA)
         pygame.draw.rect(border_surf, (120, 200, 255, 80), 
                         (0, 0, panel_width, panel_height), 5, border_radius=25)
         panel_surf.blit(border_surf, (0, 0))
         
         # Inner glow
-        inner_glow = pygame.Surface((panel_width - 30, panel_height - 30), pygame.SRCALPHA)
+        inner_glow = new_surface((panel_width - 30, panel_height - 30), pygame.SRCALPHA)
         pygame.draw.rect(inner_glow, (255, 255, 255, 30), 
                         (0, 0, panel_width - 30, panel_height - 30), border_radius=20)
         panel_surf.blit(inner_glow, (15, 15))
         
         # Title
-        font_title = pygame.font.Font(None, 48)
-        title_text = font_title.render(self.title, True, (255, 255, 220))
-        title_shadow = font_title.render(self.title, True, (0, 0, 0, 120))
+        title_text = render_text(self.title, 48, (255, 255, 220))
+        title_shadow = render_text(self.title, 48, (0, 0, 0, 120))
         panel_surf.blit(title_shadow, (panel_width//2 - title_shadow.get_width()//2 + 2, 42))
         panel_surf.blit(title_text, (panel_width//2 - title_text.get_width()//2, 40))
         
         # Decorative separator
-        sep_surf = pygame.Surface((panel_width - 100, 3), pygame.SRCALPHA)
+        sep_surf = new_surface((panel_width - 100, 3), pygame.SRCALPHA)
         for i in range(sep_surf.get_width()):
             alpha = int(200 * (1 - abs(i - sep_surf.get_width()//2) / (sep_surf.get_width()//2)))
             sep_surf.set_at((i, 0), (*self.image_color, alpha))
@@ -689,13 +2031,13 @@ class CodexPanel:
         ill_y = 120
         
         # Glow around illustration
-        glow_surf = pygame.Surface((ill_size + 60, ill_size + 60), pygame.SRCALPHA)
+        glow_surf = new_surface((ill_size + 60, ill_size + 60), pygame.SRCALPHA)
         pygame.draw.circle(glow_surf, (*self.image_color, 100), 
                          ((ill_size + 60)//2, (ill_size + 60)//2), (ill_size + 60)//2)
         panel_surf.blit(glow_surf, (ill_x - 30, ill_y - 30))
         
         # Draw illustration based on location
-        ill_surf = pygame.Surface((ill_size, ill_size), pygame.SRCALPHA)
+        ill_surf = new_surface((ill_size, ill_size), pygame.SRCALPHA)
         if "Forest" in self.location.name:
             # Tree
             pygame.draw.circle(ill_surf, (*self.image_color, 180), 
@@ -721,15 +2063,14 @@ class CodexPanel:
         panel_surf.blit(ill_surf, (ill_x, ill_y))
         
         # Concept badge
-        font_concept = pygame.font.Font(None, 40)
-        concept_text = font_concept.render(self.oop_concept, True, (255, 255, 180))
-        concept_shadow = font_concept.render(self.oop_concept, True, (0, 0, 0, 120))
+        concept_text = render_text(self.oop_concept, 40, (255, 255, 180))
+        concept_shadow = render_text(self.oop_concept, 40, (0, 0, 0, 120))
         badge_y = 290
         panel_surf.blit(concept_shadow, (panel_width//2 - concept_shadow.get_width()//2 + 2, badge_y + 2))
         panel_surf.blit(concept_text, (panel_width//2 - concept_text.get_width()//2, badge_y))
         
         # Content area with scroll
-        content_font = pygame.font.Font(None, 24)
+        content_font = get_font(24)
         y_offset = 350 - self.scroll_offset
         content_width = panel_width - 100
         
@@ -751,13 +2092,12 @@ class CodexPanel:
                 # Bullet point
                 bullet_x = 70
                 pygame.draw.circle(panel_surf, self.image_color, (bullet_x, y_offset + 10), 5)
-                text = content_font.render(line[2:], True, (230, 245, 255))
+                text = render_text(line[2:], 24, (230, 245, 255))
                 panel_surf.blit(text, (bullet_x + 20, y_offset))
                 y_offset += 28
             elif line.endswith(":") and ":" in line:
                 # Header
-                header_font = pygame.font.Font(None, 28)
-                text = header_font.render(line, True, (255, 255, 150))
+                text = render_text(line, 28, (255, 255, 150))
                 panel_surf.blit(text, (panel_width//2 - text.get_width()//2, y_offset))
                 y_offset += 35
             else:
@@ -768,19 +2108,19 @@ class CodexPanel:
                     test_line = current_line + " " + word if current_line else word
                     if content_font.size(test_line)[0] > content_width - 20:
                         if current_line:
-                            text = content_font.render(current_line, True, (240, 250, 255))
+                            text = render_text(current_line, 24, (240, 250, 255))
                             panel_surf.blit(text, (panel_width//2 - text.get_width()//2, y_offset))
                             y_offset += 26
                             current_line = word
                         else:
                             # Force break long word
-                            text = content_font.render(word, True, (240, 250, 255))
+                            text = render_text(word, 24, (240, 250, 255))
                             panel_surf.blit(text, (60, y_offset))
                             y_offset += 26
                     else:
                         current_line = test_line
                 if current_line:
-                    text = content_font.render(current_line, True, (240, 250, 255))
+                    text = render_text(current_line, 24, (240, 250, 255))
                     panel_surf.blit(text, (panel_width//2 - text.get_width()//2, y_offset))
                     y_offset += 26
         
@@ -797,7 +2137,7 @@ class CodexPanel:
         
         # Close button
         button_rect = pygame.Rect(panel_width//2 - 120, panel_height - 90, 240, 50)
-        button_surf = pygame.Surface((240, 50), pygame.SRCALPHA)
+        button_surf = new_surface((240, 50), pygame.SRCALPHA)
         
         # Button gradient
         for y in range(50):
@@ -808,20 +2148,32 @@ class CodexPanel:
         panel_surf.blit(button_surf, (button_rect.x, button_rect.y))
         
         # Button text
-        button_font = pygame.font.Font(None, 28)
-        button_text = button_font.render("Tutup Codex", True, (0, 0, 0))
-        button_shadow = button_font.render("Tutup Codex", True, (255, 255, 255, 80))
+        button_text = render_text("Tutup Codex", 28, (0, 0, 0))
+        button_shadow = render_text("Tutup Codex", 28, (255, 255, 255, 80))
         panel_surf.blit(button_shadow, (panel_width//2 - button_shadow.get_width()//2 + 1, panel_height - 75 + 1))
         panel_surf.blit(button_text, (panel_width//2 - button_text.get_width()//2, panel_height - 75))
         
         # Draw panel
+        scale = surface.get_height() / WINDOW_HEIGHT
+        if scale != 1:
+            panel_surf = pygame.transform.smoothscale(
+                panel_surf, (max(1, round(panel_width * scale)), max(1, round(panel_height * scale))))
+            button_rect = pygame.Rect(round(button_rect.x * scale), round(button_rect.y * scale),
+                                      round(button_rect.width * scale), round(button_rect.height * scale))
+        panel_x = (surface.get_width() - panel_surf.get_width()) // 2
+        panel_y = (surface.get_height() - panel_surf.get_height()) // 2
         surface.blit(panel_surf, (panel_x, panel_y))
+        self._surface = panel_surf
+        self.rect = panel_surf.get_rect(topleft=(panel_x, panel_y))
         
         return button_rect.move(panel_x, panel_y)
 
 
 class WorldMap:
-    def __init__(self):
+    """Peta dunia; tata letak dalam koordinat desain (WINDOW_WIDTH x WINDOW_HEIGHT)
+    yang di-skala ke surface tujuan (lihat set_scale)."""
+    def __init__(self, scale: float = 1.0):
+        self.scale = 1.0
         self.locations = [
             Location("Spirit Forest", (200, 300), COLOR_SPIRIT_FOREST, Level.LEVEL_1),
             Location("Crimson Mountain", (600, 300), COLOR_CRIMSON_MOUNTAIN, Level.LEVEL_2),
@@ -832,16 +2184,22 @@ class WorldMap:
         self.codex_panel = None
         self.all_codex_read = False
         self.start_button_rect = None
+        # Lapisan statis (judul, garis, tombol nonaktif) dan rect dinamis frame terakhir
+        self._static_key: Optional[tuple] = None
+        self._static_surface: Optional[pygame.Surface] = None
+        self._rects: List[pygame.Rect] = []
+        
+        self.set_scale(scale)
         
-        # Particle system for map
+        # Particle system for map (koordinat desain)
         self.particles = []
         for _ in range(50):
             self.particles.append({
-                'x': random.randint(0, WINDOW_WIDTH),
-                'y': random.randint(0, WINDOW_HEIGHT),
-                'speed': random.uniform(0.5, 2),
-                'size': random.uniform(1, 3),
-                'alpha': random.randint(50, 150)
+                'x': RNG.ui.randint(0, WINDOW_WIDTH),
+                'y': RNG.ui.randint(0, WINDOW_HEIGHT),
+                'speed': RNG.ui.uniform(0.5, 2),
+                'size': RNG.ui.uniform(1, 3),
+                'alpha': RNG.ui.randint(50, 150)
             })
     
     def update(self, dt: float) -> None:
@@ -850,7 +2208,22 @@ class WorldMap:
             p['y'] -= p['speed']
             if p['y'] < -10:
                 p['y'] = WINDOW_HEIGHT + 10
-                p['x'] = random.randint(0, WINDOW_WIDTH)
+                p['x'] = RNG.ui.randint(0, WINDOW_WIDTH)
+    
+    def set_scale(self, scale: float) -> None:
+        """Skala tata letak ke surface tujuan (tinggi surface / WINDOW_HEIGHT).
+        
+        Koordinat mouse untuk check_hover/handle_click harus dalam ruang yang sama.
+        """
+        self.scale = scale
+        for loc in self.locations:
+            loc.set_scale(scale)
+        self._static_key = None
+        self._rects = []
+    
+    def _px(self, value: float) -> int:
+        """Ukuran desain (px window) ke px surface tujuan"""
+        return round(value * self.scale)
     
     def check_hover(self, mouse_pos: Tuple[int, int]) -> None:
         """Check which location is hovered"""
@@ -890,108 +2263,214 @@ class WorldMap:
                     self.all_codex_read = all(loc.codex_read for loc in self.locations)
                     break
     
+    def layout_key(self) -> Tuple:
+        """Bagian peta yang hanya berubah lewat input; jika berubah, redraw penuh"""
+        return (self.all_codex_read,) + tuple((loc.unlocked, loc.codex_read, loc.hovered)
+                                              for loc in self.locations)
+    
     def draw(self, surface: pygame.Surface) -> None:
         """Draw world map"""
+        frame = self._frame()
+        self._rects = frame.rects()
+        self._compose(surface, [surface.get_rect()], frame)
+    
+    def draw_dirty(self, surface: pygame.Surface) -> List[pygame.Rect]:
+        """Gambar ulang hanya elemen yang bergerak sejak frame sebelumnya"""
+        frame = self._frame()
+        current = frame.rects()
+        screen_rect = surface.get_rect()
+        rects = [rect.clip(screen_rect) for rect in dirty_rects(self._rects, current)]
+        rects = [rect for rect in rects if rect.width and rect.height]
+        self._compose(surface, rects, frame)
+        self._rects = current
+        return rects
+    
+    def _frame(self) -> "_MapFrame":
+        """Posisi semua elemen dinamis untuk frame ini (dihitung sekali)"""
+        ticks = game_ticks()
+        frame = _MapFrame()
+        px = self._px
+        for x, y, radius in self._particle_points():
+            frame.particles.append(pygame.Rect(x - radius - 1, y - radius - 1,
+                                               radius * 2 + 3, radius * 2 + 3))
+        for loc in self.locations:
+            frame.locations.append(self._location_bounds(loc))
+        
+        # Animated particles along the line if active
+        for loc1, loc2 in zip(self.locations, self.locations[1:]):
+            if loc1.codex_read:
+                t = (ticks % 3000) / 3000
+                dot_x = int(loc1.pos[0] + (loc2.pos[0] - loc1.pos[0]) * t)
+                dot_y = int(loc1.pos[1] + (loc2.pos[1] - loc1.pos[1]) * t)
+                reach = px(7)
+                frame.dots.append(((dot_x, dot_y), pygame.Rect(dot_x - reach, dot_y - reach,
+                                                               reach * 2 + 1, reach * 2 + 1)))
+            else:
+                frame.dots.append(None)
+        
+        if self.all_codex_read:
+            frame.pulse = (math.sin(ticks * 0.003) + 1) * 0.3 + 0.7
+            button_x, button_y = px(WINDOW_WIDTH//2 - 250), px(WINDOW_HEIGHT - 150)
+            self.start_button_rect = pygame.Rect(button_x, button_y, px(500), px(60))
+            frame.button = self.start_button_rect.inflate(px(40), px(40))
+        else:
+            self.start_button_rect = None
+        return frame
+    
+    def _compose(self, surface: pygame.Surface, rects: List[pygame.Rect], frame: "_MapFrame") -> None:
+        """Susun ulang lapisan peta di dalam rects, urut dari bawah ke atas.
+        
+        Lapisan statis hanya di-blit di rects; elemen dinamis selalu digambar
+        utuh karena posisinya sekarang pasti termasuk dalam rects.
+        """
+        size = surface.get_size()
+        
         # Background
-        for y in range(surface.get_height()):
-            ratio = y / surface.get_height()
-            r = int(COLOR_MAP_BG[0] * (1 - ratio) + 5 * ratio)
-            g = int(COLOR_MAP_BG[1] * (1 - ratio) + 10 * ratio)
-            b = int(COLOR_MAP_BG[2] * (1 - ratio) + 20 * ratio)
-            pygame.draw.line(surface, (r, g, b), (0, y), (surface.get_width(), y))
+        background = vertical_gradient(size, COLOR_MAP_BG, (5, 10, 20))
+        surface.blits([(background, rect, rect) for rect in rects], doreturn=False)
         
         # Particles
-        for p in self.particles:
-            pygame.draw.circle(surface, (100, 200, 255, p['alpha']), 
-                             (int(p['x']), int(p['y'])), int(p['size']))
+        for p, (x, y, radius) in zip(self.particles, self._particle_points()):
+            pygame.draw.circle(surface, (100, 200, 255, p['alpha']), (x, y), radius)
         
-        # Title
-        font_title = pygame.font.Font(None, 72)
-        title = font_title.render("PETA PERJALANAN ELION", True, (200, 230, 255))
-        surface.blit(title, (WINDOW_WIDTH//2 - title.get_width()//2, 50))
+        for dot in frame.dots:
+            if dot is not None:
+                pygame.draw.circle(surface, (100, 255, 200), dot[0], self._px(6))
         
-        # Subtitle
-        font_sub = pygame.font.Font(None, 28)
-        subtitle = font_sub.render("Pelajari pengetahuan sebelum memulai", True, (180, 220, 255))
-        surface.blit(subtitle, (WINDOW_WIDTH//2 - subtitle.get_width()//2, 120))
-        
-        # Connection lines
-        for i in range(len(self.locations) - 1):
-            loc1 = self.locations[i]
-            loc2 = self.locations[i + 1]
-            
-            line_color = COLOR_MAP_LINE_ACTIVE if loc1.codex_read else COLOR_MAP_LINE
-            line_width = 4 if loc1.codex_read else 2
-            
-            # Animated particles along the line if active
-            if loc1.codex_read:
-                t = (pygame.time.get_ticks() % 3000) / 3000
-                px = loc1.pos[0] + (loc2.pos[0] - loc1.pos[0]) * t
-                py = loc1.pos[1] + (loc2.pos[1] - loc1.pos[1]) * t
-                pygame.draw.circle(surface, (100, 255, 200), (int(px), int(py)), 6)
-            
-            pygame.draw.line(surface, line_color, loc1.pos, loc2.pos, line_width)
+        # Judul, garis penghubung dan tombol nonaktif
+        static = self._static_layer(size)
+        surface.blits([(static, rect, rect) for rect in rects], doreturn=False)
         
         # Draw locations
         for loc in self.locations:
             loc.draw(surface)
-            
-            # Show name on hover
-            if loc.hovered and loc.unlocked:
-                font = pygame.font.Font(None, 32)
-                name = font.render(loc.name, True, (255, 255, 200))
-                surface.blit(name, (loc.pos[0] - name.get_width()//2, loc.pos[1] + 60))
-                
-                status = "✓ Sudah dipelajari" if loc.codex_read else "📖 Klik untuk pelajari"
-                status_font = pygame.font.Font(None, 22)
-                status_text = status_font.render(status, True, (200, 255, 200))
-                surface.blit(status_text, (loc.pos[0] - status_text.get_width()//2, loc.pos[1] + 90))
+            for label, pos in self._labels(loc):
+                surface.blit(label, pos)
         
         # Start Journey Button
-        if self.all_codex_read:
-            button_width, button_height = 500, 60
-            button_x = WINDOW_WIDTH//2 - button_width//2
-            button_y = WINDOW_HEIGHT - 150
-            
-            # Glow effect
-            pulse = (math.sin(pygame.time.get_ticks() * 0.003) + 1) * 0.3 + 0.7
-            glow_surf = pygame.Surface((button_width + 40, button_height + 40), pygame.SRCALPHA)
-            pygame.draw.rect(glow_surf, (100, 255, 200, int(100 * pulse)), 
-                           (20, 20, button_width, button_height), border_radius=15)
-            surface.blit(glow_surf, (button_x - 20, button_y - 20))
-            
-            # Button
-            pygame.draw.rect(surface, COLOR_BUTTON_ENABLED, 
-                           (button_x, button_y, button_width, button_height), border_radius=10)
-            pygame.draw.rect(surface, (255, 255, 255), 
-                           (button_x, button_y, button_width, button_height), 3, border_radius=10)
-            
-            font_button = pygame.font.Font(None, 30)
-            button_text = font_button.render("MULAI PERJALANAN ELION", True, (0, 0, 0))
-            surface.blit(button_text, (button_x + button_width//2 - button_text.get_width()//2, 
-                                     button_y + 15))
-            
-            self.start_button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
-        else:
+        if frame.button is not None:
+            self._draw_start_button(surface, frame.pulse)
+    
+    def _particle_points(self) -> List[Tuple[int, int, int]]:
+        """(x, y, radius) partikel peta di surface tujuan"""
+        scale = self.scale
+        if scale == 1:
+            return [(int(p['x']), int(p['y']), int(p['size'])) for p in self.particles]
+        return [(int(p['x'] * scale), int(p['y'] * scale), max(1, int(p['size'] * scale)))
+                for p in self.particles]
+    
+    def _static_layer(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Lapisan transparan yang hanya berubah saat progres codex berubah"""
+        key = (size, self.all_codex_read, tuple(loc.codex_read for loc in self.locations))
+        if self._static_key == key:
+            return self._static_surface
+        
+        layer = new_surface(size, pygame.SRCALPHA)
+        px = self._px
+        center_x = px(WINDOW_WIDTH//2)
+        
+        # Title
+        title = render_text("PETA PERJALANAN ELION", max(1, px(72)), (200, 230, 255))
+        layer.blit(title, (center_x - title.get_width()//2, px(50)))
+        
+        # Subtitle
+        subtitle = render_text("Pelajari pengetahuan sebelum memulai", max(1, px(28)), (180, 220, 255))
+        layer.blit(subtitle, (center_x - subtitle.get_width()//2, px(120)))
+        
+        # Connection lines
+        for loc1, loc2 in zip(self.locations, self.locations[1:]):
+            line_color = COLOR_MAP_LINE_ACTIVE if loc1.codex_read else COLOR_MAP_LINE
+            line_width = max(1, px(4 if loc1.codex_read else 2))
+            # Di window (tanpa alpha) garis selalu tergambar opaque; layer harus sama
+            pygame.draw.line(layer, line_color[:3], loc1.pos, loc2.pos, line_width)
+        
+        if not self.all_codex_read:
             # Disabled button
-            button_width, button_height = 500, 60
-            button_x = WINDOW_WIDTH//2 - button_width//2
-            button_y = WINDOW_HEIGHT - 150
-            
-            pygame.draw.rect(surface, COLOR_BUTTON_DISABLED, 
-                           (button_x, button_y, button_width, button_height), border_radius=10)
-            pygame.draw.rect(surface, (100, 100, 100), 
-                           (button_x, button_y, button_width, button_height), 2, border_radius=10)
-            
-            font_button = pygame.font.Font(None, 30)
-            button_text = font_button.render("PELAJARI SEMUA CODEX TERLEBIH DAHULU", True, (200, 200, 200))
-            surface.blit(button_text, (button_x + button_width//2 - button_text.get_width()//2, 
-                                     button_y + 20))
-            
-            self.start_button_rect = None
+            button_width, button_height = px(500), px(60)
+            button_x = center_x - button_width//2
+            button_y = px(WINDOW_HEIGHT - 150)
+            
+            pygame.draw.rect(layer, COLOR_BUTTON_DISABLED, 
+                           (button_x, button_y, button_width, button_height), border_radius=px(10))
+            pygame.draw.rect(layer, (100, 100, 100), 
+                           (button_x, button_y, button_width, button_height), max(1, px(2)),
+                           border_radius=px(10))
+            
+            button_text = render_text("PELAJARI SEMUA CODEX TERLEBIH DAHULU", max(1, px(30)), (200, 200, 200))
+            layer.blit(button_text, (button_x + button_width//2 - button_text.get_width()//2, 
+                                     button_y + px(20)))
+        
+        self._static_key = key
+        self._static_surface = layer
+        return layer
+    
+    def _labels(self, loc: Location) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Nama dan status lokasi, hanya saat di-hover"""
+        if not (loc.hovered and loc.unlocked):
+            return []
+        px = self._px
+        name = render_text(loc.name, max(1, px(32)), (255, 255, 200))
+        status = "✓ Sudah dipelajari" if loc.codex_read else "📖 Klik untuk pelajari"
+        status_text = render_text(status, max(1, px(22)), (200, 255, 200))
+        return [(name, (loc.pos[0] - name.get_width()//2, loc.pos[1] + px(60))),
+                (status_text, (loc.pos[0] - status_text.get_width()//2, loc.pos[1] + px(90)))]
+    
+    def _location_bounds(self, loc: Location) -> pygame.Rect:
+        """Area yang disentuh Location.draw (glow terbesar) plus label hover"""
+        reach = loc.radius + self._px(20)
+        bounds = pygame.Rect(loc.pos[0] - reach, loc.pos[1] - reach, reach * 2, reach * 2)
+        for label, pos in self._labels(loc):
+            bounds.union_ip(label.get_rect(topleft=pos))
+        return bounds
+    
+    def _draw_start_button(self, surface: pygame.Surface, pulse: float) -> None:
+        button_x, button_y, button_width, button_height = self.start_button_rect
+        px = self._px
+        margin = px(20)
+        
+        # Glow effect
+        glow_surf = new_surface((button_width + margin * 2, button_height + margin * 2), pygame.SRCALPHA)
+        pygame.draw.rect(glow_surf, (100, 255, 200, int(100 * pulse)), 
+                       (margin, margin, button_width, button_height), border_radius=px(15))
+        surface.blit(glow_surf, (button_x - margin, button_y - margin))
+        
+        # Button
+        pygame.draw.rect(surface, COLOR_BUTTON_ENABLED, 
+                       (button_x, button_y, button_width, button_height), border_radius=px(10))
+        pygame.draw.rect(surface, (255, 255, 255), 
+                       (button_x, button_y, button_width, button_height), max(1, px(3)),
+                       border_radius=px(10))
+        
+        button_text = render_text("MULAI PERJALANAN ELION", max(1, px(30)), (0, 0, 0))
+        surface.blit(button_text, (button_x + button_width//2 - button_text.get_width()//2, 
+                                 button_y + px(15)))
+
+
+@dataclass
+class _MapFrame:
+    """Posisi elemen dinamis world map pada satu frame"""
+    particles: List[pygame.Rect] = field(default_factory=list)
+    locations: List[pygame.Rect] = field(default_factory=list)
+    dots: List[Optional[Tuple[Tuple[int, int], pygame.Rect]]] = field(default_factory=list)
+    button: Optional[pygame.Rect] = None
+    pulse: float = 0.0
+    
+    def rects(self) -> List[pygame.Rect]:
+        """Rect dinamis dengan urutan tetap; lokasi duluan supaya partikel ikut digabung ke sana"""
+        empty = pygame.Rect(0, 0, 0, 0)
+        return (self.locations + self.particles
+                + [dot[1] if dot is not None else empty for dot in self.dots]
+                + [self.button or empty])
 
 # ==================== PLAYER ====================
 class Player:
+    SPRITE_SIZE = 64
+    # Urutan frame idle (indeks ke frame unik di sprite sheet)
+    IDLE_SEQUENCE = (0, 1, 1, 2)
+    _sprite_sheet: Optional[Tuple[List[pygame.Surface], pygame.Surface]] = None
+    _sprite_hash: Optional[str] = None
+    _burst_sprites: Dict[int, pygame.Surface] = {}
+    
     def __init__(self, x: float, y: float):
         self._x = x
         self._y = y
@@ -1013,12 +2492,12 @@ class Player:
         self._at_altar = False
         self._placing_gems = False
         self._gem_placement_timer = 0.0
+        self._placement_inner: Dict[int, pygame.Surface] = {}
 
         # Attack system for Level 2+
         self._has_spirit_lantern = False
         self._attack_cooldown = 0.0
         self._last_direction = (1, 0)
-        self._spirit_bursts: List[dict] = []
         self._attack_flash_timer = 0.0
         self._trail_particles: List[dict] = []
         
@@ -1031,11 +2510,104 @@ class Player:
         self.create_surfaces()
     
     def create_surfaces(self):
-        """Create authentic pixel art knight sprite surfaces"""
+        """Ambil sprite knight dari sprite sheet (memo per class, cache PNG di disk)"""
+        frames, glow_surface = self.load_sprite_sheet()
+        self._size = self.SPRITE_SIZE  # Ukuran lebih besar untuk player yang lebih dominan
+        self._glow_surface = glow_surface
+        
+        # Frame 2 ditampilkan dua kali dalam satu siklus idle
+        self._idle_frames = [frames[i] for i in self.IDLE_SEQUENCE]
+        
+        # Animation properties
+        self._current_frame = 0
+        self._frame_timer = 0
+        self._frame_delay = 0.2  # 5 FPS untuk pixel art
+        
+        # Set initial surface
+        self._player_surface = self._idle_frames[0]
+    
+    @classmethod
+    def sprite_hash(cls) -> str:
+        """Hash kode generator sprite; cache PNG otomatis basi jika gambarnya berubah"""
+        if cls._sprite_hash is None:
+            digest = hashlib.sha1(f"{SPRITE_CACHE_VERSION}:{cls.SPRITE_SIZE}".encode())
+            try:
+                digest.update(inspect.getsource(cls._paint_sprites).encode())
+            except (OSError, TypeError):
+                digest.update(cls._paint_sprites.__qualname__.encode())
+            cls._sprite_hash = digest.hexdigest()[:12]
+        return cls._sprite_hash
+    
+    @classmethod
+    def load_sprite_sheet(cls, cache_dir: Optional[str] = SPRITE_CACHE_DIR) -> Tuple[List[pygame.Surface], pygame.Surface]:
+        """Frame idle unik + glow; dibangun sekali per proses, dari PNG jika ada.
+        
+        Layout sheet: frame idle berdampingan (SPRITE_SIZE persegi), lalu glow
+        (SPRITE_SIZE + 8 persegi) di kanan.
+        """
+        if cls._sprite_sheet is not None:
+            return cls._sprite_sheet
+        
+        size = cls.SPRITE_SIZE
+        frame_count = max(cls.IDLE_SEQUENCE) + 1
+        glow_size = size + 8
+        sheet_size = (frame_count * size + glow_size, glow_size)
+        path = os.path.join(cache_dir, f"player_{cls.sprite_hash()}.png") if cache_dir else None
+        
+        sheet = None
+        if path is not None and os.path.exists(path):
+            try:
+                sheet = pygame.image.load(path)
+            except (pygame.error, OSError):
+                sheet = None
+            if sheet is not None and sheet.get_size() != sheet_size:
+                sheet = None
+        
+        if sheet is None:
+            frames, glow_surface = cls._paint_sprites(size)
+            if path is not None:
+                sheet = new_surface(sheet_size, pygame.SRCALPHA)
+                for i, frame in enumerate(frames):
+                    sheet.blit(frame, (i * size, 0))
+                sheet.blit(glow_surface, (frame_count * size, 0))
+                cls._store_sprite_sheet(sheet, path)
+        else:
+            # Blit ke surface SRCALPHA kosong menyalin piksel apa adanya,
+            # dengan format yang sama seperti hasil menggambar langsung
+            frames = []
+            for i in range(frame_count):
+                frame = new_surface((size, size), pygame.SRCALPHA)
+                frame.blit(sheet, (0, 0), (i * size, 0, size, size))
+                frames.append(frame)
+            glow_surface = new_surface((glow_size, glow_size), pygame.SRCALPHA)
+            glow_surface.blit(sheet, (0, 0), (frame_count * size, 0, glow_size, glow_size))
+        
+        cls._sprite_sheet = (frames, glow_surface)
+        return cls._sprite_sheet
+    
+    @staticmethod
+    def _store_sprite_sheet(sheet: pygame.Surface, path: str) -> None:
+        directory = os.path.dirname(path)
+        tmp_path = f"{path}.{os.getpid()}.tmp.png"
+        try:
+            os.makedirs(directory, exist_ok=True)
+            pygame.image.save(sheet, tmp_path)
+            os.replace(tmp_path, path)
+            # Sheet dari versi generator lama tidak akan dipakai lagi
+            name = os.path.basename(path)
+            for entry in os.listdir(directory):
+                if entry.startswith("player_") and entry.endswith(".png") and entry != name:
+                    os.remove(os.path.join(directory, entry))
+        except (pygame.error, OSError):
+            # Cache hanya optimasi; disk read-only/penuh tidak boleh menghentikan game
+            pass
+    
+    @staticmethod
+    def _paint_sprites(size: int) -> Tuple[List[pygame.Surface], pygame.Surface]:
+        """Gambar knight pixel art: frame idle unik (size x size) dan glow (size + 8)"""
         # Player surface (32x32 or 48x48 untuk pixel art klasik)
         base_size = 32
-        self._size = 64  # Ukuran lebih besar untuk player yang lebih dominan
-        temp_surface = pygame.Surface((base_size, base_size), pygame.SRCALPHA)
+        temp_surface = new_surface((base_size, base_size), pygame.SRCALPHA)
         
         # Color palette untuk pixel art (warna terbatas, lebih terang)
         silver = (180, 180, 180)       # Perak
@@ -1255,10 +2827,10 @@ class Player:
             temp_surface.set_at((x, 10), (220, 220, 220))
         
         # Scale ke ukuran akhir
-        self._player_surface = pygame.transform.scale(temp_surface, (self._size, self._size))
+        player_surface = pygame.transform.scale(temp_surface, (size, size))
         
         # === GLOW EFFECT (untuk pixel art) ===
-        self._glow_surface = pygame.Surface((self._size + 8, self._size + 8), pygame.SRCALPHA)
+        glow_surface = new_surface((size + 8, size + 8), pygame.SRCALPHA)
         
         # Glow grid pattern (lebih pixelated)
         glow_pattern = [
@@ -1270,53 +2842,46 @@ class Player:
         
         for gx, gy in glow_pattern:
             # Outer glow (lebih transparan)
-            pygame.draw.rect(self._glow_surface, (*blue_energy, 60), 
+            pygame.draw.rect(glow_surface, (*blue_energy, 60), 
                             (gx * 2, gy * 2, 8, 8))  # Scale x2
             # Inner glow (lebih terang)
-            pygame.draw.rect(self._glow_surface, (*blue_energy, 120), 
+            pygame.draw.rect(glow_surface, (*blue_energy, 120), 
                             (gx * 2 + 2, gy * 2 + 2, 4, 4))
         
         # Sword glow khusus
         sword_glow_coords = [(28, 13), (32, 13), (28, 18), (32, 18)]
         for gx, gy in sword_glow_coords:
-            pygame.draw.rect(self._glow_surface, (*blue_energy, 100), 
+            pygame.draw.rect(glow_surface, (*blue_energy, 100), 
                             (gx * 2, gy * 2, 4, 4))
         
         # === ANIMATION FRAMES (untuk idle animation) ===
-        self._idle_frames = []
+        idle_frames = []
         
         # Frame 1 (standar)
-        frame1 = self._player_surface.copy()
-        self._idle_frames.append(frame1)
+        frame1 = player_surface.copy()
+        idle_frames.append(frame1)
         
         # Frame 2 (sedikit bergerak - cape dan sword)
-        frame2 = self._player_surface.copy()
+        frame2 = player_surface.copy()
         
         # Sword sedikit bergerak (animasi sederhana)
         # Karena sudah di-scale, kita skip detail animasi untuk sekarang
-        self._idle_frames.append(frame2)
         pixel[0] = min(255, pixel[0] + 20)
         frame2.set_at((x, y), tuple(pixel))
         
-        self._idle_frames.append(frame2)
+        idle_frames.append(frame2)
         
         # Frame 3 (kembali ke normal dengan variasi)
-        frame3 = self._player_surface.copy()
+        frame3 = player_surface.copy()
         
         # Emblem glow berdenyut
         emblem_glow = [(15, 13), (16, 13), (15, 14), (16, 14)]
         for px in emblem_glow:
             frame3.set_at(px, (120, 220, 255))
         
-        self._idle_frames.append(frame3)
+        idle_frames.append(frame3)
         
-        # Animation properties
-        self._current_frame = 0
-        self._frame_timer = 0
-        self._frame_delay = 0.2  # 5 FPS untuk pixel art
-        
-        # Set initial surface
-        self._player_surface = self._idle_frames[0]
+        return idle_frames, glow_surface
 
     def update(self, dt: float) -> None:
         """Update dengan animasi pixel art"""
@@ -1369,7 +2934,7 @@ class Player:
             surface.blit(self._player_surface, player_rect.topleft)
         
         # Trail particles untuk pixel art (lebih jarang)
-        if random.random() < 0.08 and (self._vx != 0 or self._vy != 0):
+        if RNG.particles.random() < 0.08 and (self._vx != 0 or self._vy != 0):
             cx, cy = self.get_center()
             # Particle warna biru energi
             particle_system.emit(cx - 8, cy, (80, 180, 255), 
@@ -1403,15 +2968,10 @@ class Player:
         else:
             dx, dy = 1, 0
         
-        self._spirit_bursts.append({
-            'x': cx,
-            'y': cy,
-            'vx': dx * SPIRIT_BURST_SPEED,
-            'vy': dy * SPIRIT_BURST_SPEED,
-            'life': SPIRIT_BURST_LIFETIME,
-            'size': SPIRIT_BURST_SIZE,
-            'distance_traveled': 0.0
-        })
+        projectile_pool.spawn("player", self, cx, cy,
+                              dx * SPIRIT_BURST_SPEED, dy * SPIRIT_BURST_SPEED,
+                              SPIRIT_BURST_LIFETIME, SPIRIT_BURST_SIZE,
+                              max_distance=ATTACK_RANGE)
         
         if self._particle_system_ref:
             self._particle_system_ref.emit(cx, cy, COLOR_SPIRIT_CYAN, 
@@ -1515,14 +3075,38 @@ class Player:
         if keys[pygame.K_SPACE]:
             self.attack()
     
-    # Getter untuk daftar Spirit Bursts aktif
-    def get_spirit_bursts(self) -> List[dict]:
-        return self._spirit_bursts.copy()
+    @classmethod
+    def _burst_sprite(cls, burst_size: int) -> pygame.Surface:
+        """Sprite spirit burst (belum dirotasi), dibuat sekali per ukuran"""
+        burst_surf = cls._burst_sprites.get(burst_size)
+        if burst_surf is not None:
+            return burst_surf
+        
+        burst_surf = new_surface((burst_size * 4, burst_size * 4), pygame.SRCALPHA)
+        
+        # Outer glow
+        pygame.draw.circle(burst_surf, (100, 220, 255, 120),
+                         (burst_size * 2, burst_size * 2), burst_size * 2)
+        
+        # Middle layer
+        pygame.draw.circle(burst_surf, COLOR_SPIRIT_CYAN,
+                         (burst_size * 2, burst_size * 2), int(burst_size * 1.5))
+        
+        # Core
+        pygame.draw.circle(burst_surf, (255, 255, 255, 200),
+                         (burst_size * 2, burst_size * 2), burst_size // 2)
+        
+        cls._burst_sprites[burst_size] = burst_surf
+        return burst_surf
+    
+    # Getter untuk daftar Spirit Bursts aktif (record di projectile_pool)
+    def get_spirit_bursts(self) -> List[Projectile]:
+        return projectile_pool.owned_by(self)
     
     # Menghapus Spirit Burst tertentu
-    def remove_spirit_burst(self, burst: dict) -> None:
-        if burst in self._spirit_bursts:
-            self._spirit_bursts.remove(burst)
+    def remove_spirit_burst(self, burst: Projectile) -> None:
+        if burst.source is self:
+            projectile_pool.release(burst)
     
     # Memulai proses penempatan permata di altar
     def start_gem_placement(self) -> None:
@@ -1555,16 +3139,6 @@ class Player:
         
         if self._attack_flash_timer > 0:
             self._attack_flash_timer -= dt
-        
-        # Update spirit bursts
-        for burst in self._spirit_bursts[:]:
-            burst['x'] += burst['vx'] * dt
-            burst['y'] += burst['vy'] * dt
-            burst['life'] -= dt
-            burst['distance_traveled'] += math.sqrt(burst['vx']**2 + burst['vy']**2) * dt
-            
-            if burst['life'] <= 0 or burst['distance_traveled'] > ATTACK_RANGE:
-                self._spirit_bursts.remove(burst)
     
     # Menggambar pemain ke permukaan
     def draw(self, surface: pygame.Surface, camera_offset: Tuple[int, int], 
@@ -1586,13 +3160,13 @@ class Player:
                         special_flags=pygame.BLEND_ALPHA_SDL2)
         
         # Trail particles
-        if random.random() < 0.15 and (self._vx != 0 or self._vy != 0):
+        if RNG.particles.random() < 0.15 and (self._vx != 0 or self._vy != 0):
             cx, cy = self.get_center()
             particle_system.emit(cx - 15, cy, COLOR_SPIRIT_CYAN, 
                                count=1, spread=5, life=0.4, particle_type="sparkle")
         
-        # Draw player dengan rotasi
-        rotated_player = pygame.transform.rotate(self._player_surface, self._rotation)
+        # Draw player; frame sudah berukuran akhir, rotasi lewat cache (sudut 0 = surface asli)
+        rotated_player = rotation_cache.rotate(self._player_surface, self._rotation)
         player_rect = rotated_player.get_rect(center=(screen_x + self._size//2, 
                                                      screen_y + self._size//2))
         surface.blit(rotated_player, player_rect.topleft)
@@ -1603,21 +3177,21 @@ class Player:
             radius = int(24 * progress)
             alpha = int(220 * (1 - abs(progress - 0.5) * 2))
             
-            circle_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            circle_surf = new_surface((radius * 2, radius * 2), pygame.SRCALPHA)
             pygame.draw.circle(circle_surf, (255, 255, 255, alpha), 
                              (radius, radius), radius, 3)
             
-            # Inner rotation
+            # Inner disc: lingkaran penuh (rotasi tidak terlihat), di-bake sekali
+            # per radius dengan alpha penuh; alpha diterapkan saat blit
             inner_radius = int(radius * 0.7)
-            inner_surf = pygame.Surface((inner_radius * 2, inner_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(inner_surf, (200, 255, 200, alpha//2), 
-                             (inner_radius, inner_radius), inner_radius)
-            
-            # Rotate inner circle
-            rotation = self._gem_placement_timer * 180
-            rotated_inner = pygame.transform.rotate(inner_surf, rotation)
-            inner_rect = rotated_inner.get_rect(center=(radius, radius))
-            circle_surf.blit(rotated_inner, inner_rect.topleft)
+            inner_surf = self._placement_inner.get(inner_radius)
+            if inner_surf is None:
+                inner_surf = new_surface((inner_radius * 2, inner_radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(inner_surf, (200, 255, 200), 
+                                 (inner_radius, inner_radius), inner_radius)
+                self._placement_inner[inner_radius] = inner_surf
+            inner_surf.set_alpha(alpha // 2)
+            circle_surf.blit(inner_surf, (radius - inner_radius, radius - inner_radius))
             
             surface.blit(circle_surf, (screen_x + self._size//2 - radius, 
                                      screen_y + self._size//2 - radius))
@@ -1625,42 +3199,29 @@ class Player:
         # Attack flash
         if self._attack_flash_timer > 0:
             flash_alpha = int(180 * (self._attack_flash_timer / 0.1))
-            flash_surf = pygame.Surface((self._size + 24, self._size + 24), pygame.SRCALPHA)
+            flash_surf = new_surface((self._size + 24, self._size + 24), pygame.SRCALPHA)
             pygame.draw.rect(flash_surf, (255, 255, 255, flash_alpha),
                            (12, 12, self._size, self._size), border_radius=12)
             surface.blit(flash_surf, (screen_x - 12, screen_y - 12),
                         special_flags=pygame.BLEND_ADD)
         
         # Draw spirit bursts
-        for burst in self._spirit_bursts:
-            bx = int(burst['x'] - camera_offset[0])
-            by = int(burst['y'] - camera_offset[1])
-            burst_size = burst['size']
-            
-            burst_surf = pygame.Surface((burst_size * 4, burst_size * 4), pygame.SRCALPHA)
-            
-            # Outer glow
-            pygame.draw.circle(burst_surf, (100, 220, 255, 120),
-                             (burst_size * 2, burst_size * 2), burst_size * 2)
-            
-            # Middle layer
-            pygame.draw.circle(burst_surf, COLOR_SPIRIT_CYAN,
-                             (burst_size * 2, burst_size * 2), int(burst_size * 1.5))
-            
-            # Core
-            pygame.draw.circle(burst_surf, (255, 255, 255, 200),
-                             (burst_size * 2, burst_size * 2), burst_size // 2)
+        for burst in projectile_pool.owned_by(self):
+            bx = int(burst.x - camera_offset[0])
+            by = int(burst.y - camera_offset[1])
+            burst_size = burst.size
+            burst_surf = self._burst_sprite(burst_size)
             
             # Rotation
-            rotation = burst['life'] * 360
-            rotated_burst = pygame.transform.rotate(burst_surf, rotation)
+            rotation = burst.life * 360
+            rotated_burst = rotation_cache.rotate(burst_surf, rotation)
             burst_rect = rotated_burst.get_rect(center=(bx, by))
             surface.blit(rotated_burst, burst_rect.topleft,
                         special_flags=pygame.BLEND_ADD)
             
             # Trail particles
-            if random.random() < 0.4:
-                particle_system.emit(burst['x'], burst['y'], COLOR_SPIRIT_CYAN,
+            if RNG.particles.random() < 0.4:
+                particle_system.emit(burst.x, burst.y, COLOR_SPIRIT_CYAN,
                                    count=2, spread=15, life=0.4, particle_type="sparkle")
         
         # Draw cooldown indicator
@@ -1676,7 +3237,7 @@ class Player:
             if cooldown_ratio < 1.0:
                 # Progress arc
                 angle = 360 * (1 - cooldown_ratio)
-                arc_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                arc_surf = new_surface((radius * 2, radius * 2), pygame.SRCALPHA)
                 pygame.draw.arc(arc_surf, (*COLOR_SPIRIT_CYAN, 200),
                               (0, 0, radius * 2, radius * 2),
                               math.radians(-90), math.radians(-90 + angle), 3)
@@ -1725,6 +3286,10 @@ class Companion:
             self._hint_cooldown = 5.0
             self._glow_timer = 2.0
     
+    # Companion biasa tidak punya wisdom; MentorCompanion meng-override ini
+    def give_wisdom(self, event_type: str) -> None:
+        pass
+    
     # Mengikuti pemain
     def follow_player(self, player: Player) -> None:
         if self._idle_at_altar and self._altar_position:
@@ -1762,7 +3327,7 @@ class Companion:
         
         if self._glow_timer > 0:
             glow_alpha = int(100 * (self._glow_timer / 2.0))
-            glow_surf = pygame.Surface((self._size + 16, self._size + 16), pygame.SRCALPHA)
+            glow_surf = new_surface((self._size + 16, self._size + 16), pygame.SRCALPHA)
             pygame.draw.circle(glow_surf, (*COLOR_GEM_YELLOW, glow_alpha), 
                              (self._size // 2 + 8, self._size // 2 + 8), self._size // 2 + 8)
             surface.blit(glow_surf, (screen_x - 8, screen_y - 8 + bob))
@@ -1781,8 +3346,7 @@ class Companion:
         pygame.draw.circle(surface, COLOR_BLACK, (center_x, center_y + 4), 2)
         
         if self._hint_timer > 0:
-            font = pygame.font.Font(None, 18)
-            hint_surf = font.render(self._hint_text, True, COLOR_BLACK)
+            hint_surf = render_text(self._hint_text, 18, COLOR_BLACK)
             hint_rect = hint_surf.get_rect(center=(center_x, center_y - 25))
             
             bubble_rect = hint_rect.inflate(12, 8)
@@ -1855,7 +3419,7 @@ class MentorCompanion(Companion):  # Inherit from existing Companion class
             
         if event_type in self.wisdom_database:
             wisdom_list = self.wisdom_database[event_type]
-            self.current_wisdom = random.choice(wisdom_list)
+            self.current_wisdom = RNG.ai.choice(wisdom_list)
             self.mentor_wisdom_timer = 4.0  # Show for 4 seconds
             self._hint_timer = 4.0
             self._hint_text = self.current_wisdom
@@ -1866,8 +3430,8 @@ class MentorCompanion(Companion):  # Inherit from existing Companion class
                 self.mentor_particles.append({
                     'x': cx,
                     'y': cy,
-                    'vx': random.uniform(-20, 20),
-                    'vy': random.uniform(-30, -10),
+                    'vx': RNG.particles.uniform(-20, 20),
+                    'vy': RNG.particles.uniform(-30, -10),
                     'life': 1.0,
                     'color': (255, 255, 200)
                 })
@@ -1889,9 +3453,9 @@ class MentorCompanion(Companion):  # Inherit from existing Companion class
                     self.mentor_particles.remove(p)
             
             # Add new aura particles
-            if random.random() < 0.3:
+            if RNG.particles.random() < 0.3:
                 cx, cy = self._x + self._size // 2, self._y + self._size // 2
-                angle = random.uniform(0, math.pi * 2)
+                angle = RNG.particles.uniform(0, math.pi * 2)
                 radius = self._size // 2 + 10
                 self.mentor_particles.append({
                     'x': cx + math.cos(angle) * radius,
@@ -1911,7 +3475,7 @@ class MentorCompanion(Companion):  # Inherit from existing Companion class
                     x = int(p['x'] - camera_offset[0])
                     y = int(p['y'] - camera_offset[1])
                     
-                    glow_surf = pygame.Surface((8, 8), pygame.SRCALPHA)
+                    glow_surf = new_surface((8, 8), pygame.SRCALPHA)
                     pygame.draw.circle(glow_surf, (*p['color'][:3], alpha), (4, 4), 4)
                     surface.blit(glow_surf, (x - 4, y - 4))
         
@@ -1924,7 +3488,7 @@ class MentorCompanion(Companion):  # Inherit from existing Companion class
             # Pulsing aura
             pulse = (math.sin(self.aura_timer * 2) + 1) * 0.3 + 0.7
             aura_size = int(self._size * pulse)
-            aura_surf = pygame.Surface((aura_size + 30, aura_size + 30), pygame.SRCALPHA)
+            aura_surf = new_surface((aura_size + 30, aura_size + 30), pygame.SRCALPHA)
             
             # Multiple aura layers
             for i in range(3, 0, -1):
@@ -1941,10 +3505,10 @@ class MentorCompanion(Companion):  # Inherit from existing Companion class
         # Draw special mentor hint
         if self.mentor_activated and self.mentor_wisdom_timer > 0:
             # Removed mentor text box as requested
-            font = pygame.font.Font(None, 22)
+            font = get_font(22)
             wisdom_lines = self._wrap_text(self.current_wisdom, 380, font)
             for i, line in enumerate(wisdom_lines):
-                wisdom_text = font.render(line, True, (220, 255, 220))
+                wisdom_text = render_text(line, 22, (220, 255, 220))
                 wisdom_rect = wisdom_text.get_rect(center=(surface.get_width()//2, 
                                                           surface.get_height() - 75 + i * 25))
                 surface.blit(wisdom_text, wisdom_rect)
@@ -1974,7 +3538,319 @@ class MentorCompanion(Companion):  # Inherit from existing Companion class
         return lines
 
 # ==================== ENEMIES ====================
+class _EnemyField:
+    """Atribut Enemy yang dibaca/ditulis langsung ke array EnemyStore"""
+    
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.field = name.lstrip("_")
+    
+    def __get__(self, enemy: Optional["Enemy"], owner: Optional[type] = None):
+        if enemy is None:
+            return self
+        return getattr(enemy._store, self.field).item(enemy._slot)
+    
+    def __set__(self, enemy: "Enemy", value) -> None:
+        getattr(enemy._store, self.field)[enemy._slot] = value
+
+
+@dataclass
+class EnemyGroup:
+    """Musuh satu kelas di EnemyStore: slot (urut naik) dan objeknya"""
+    slots: "np.ndarray"
+    enemies: List["Enemy"]
+    cache: Dict[str, object] = field(default_factory=dict)
+    
+    def __len__(self) -> int:
+        return len(self.enemies)
+    
+    def subset(self, mask: "np.ndarray") -> "EnemyGroup":
+        """Sebagian anggota kelompok (mask boolean urut anggota)"""
+        group = EnemyGroup(self.slots[mask], list(compress(self.enemies, mask.tolist())))
+        group.cache["parent"] = (self, mask)
+        return group
+    
+    def waypoints(self) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+        """(offset, jumlah, x, y) tabel waypoint rata; waypoint ke-i musuh k ada di offset[k] + i"""
+        table = self.cache.get("waypoints")
+        if table is None and "parent" in self.cache:
+            parent, mask = self.cache["parent"]
+            offsets, counts, points_x, points_y = parent.waypoints()
+            table = self.cache["waypoints"] = (offsets[mask], counts[mask], points_x, points_y)
+        elif table is None:
+            counts = np.array([len(enemy._waypoints) for enemy in self.enemies], dtype=np.int64)
+            offsets = np.zeros(len(counts), dtype=np.int64)
+            np.cumsum(counts[:-1], out=offsets[1:])
+            points = np.array([point for enemy in self.enemies for point in enemy._waypoints],
+                              dtype=np.float64).reshape(-1, 2)
+            table = self.cache["waypoints"] = (offsets, counts, points[:, 0].copy(), points[:, 1].copy())
+        return table
+
+
+class EnemyStore:
+    """Structure-of-arrays untuk state musuh (posisi, kecepatan, ukuran, kesehatan, ...).
+    
+    Slot i selalu sama dengan indeks musuh di Game.enemies, sehingga integrasi,
+    clamp batas dunia, timer alert dan cek jarak/tabrakan ke pemain cukup
+    beberapa operasi vektor per frame. Selama terdaftar, kelas objek musuh
+    diganti ke subclass "view" yang atributnya (_x, _y, ...) menunjuk ke array,
+    jadi take_action() per kelas tetap berjalan tanpa perubahan dan backend
+    objek biasa tidak membayar overhead descriptor.
+    
+    Kolom dasar ada di BASE_FIELDS; subclass Enemy menambah kolom sendiri lewat
+    STORE_FIELDS sehingga batch_take_action() kelas itu bisa bekerja di array.
+    """
+    BASE_FIELDS: Dict[str, type] = {"x": float, "y": float, "vx": float, "vy": float,
+                                    "speed": float, "alert_timer": float, "ai_dt": float,
+                                    "prev_x": float, "prev_y": float, "size": int, "health": int}
+    DTYPES = {float: "float64", int: "int64", bool: "bool"}
+    _views: Dict[type, type] = {}
+    
+    def __init__(self, capacity: int = ENEMY_STORE_CAPACITY):
+        if not HAS_NUMPY:
+            raise RuntimeError("EnemyStore membutuhkan NumPy")
+        self.count = 0
+        self.enemies: List["Enemy"] = []
+        # Musuh dengan hook tick() sendiri (mis. timer hit flash Guardian)
+        self._ticking: List["Enemy"] = []
+        self._groups: Optional[Dict[type, EnemyGroup]] = None
+        self._columns: Dict[str, type] = {}
+        self._capacity = max(1, capacity)
+        self._add_columns(self.BASE_FIELDS)
+    
+    @classmethod
+    def fields_for(cls, enemy_class: type) -> Dict[str, type]:
+        """Kolom store untuk enemy_class: BASE_FIELDS + STORE_FIELDS sepanjang MRO"""
+        fields = dict(cls.BASE_FIELDS)
+        for klass in reversed(enemy_class.__mro__):
+            fields.update(klass.__dict__.get("STORE_FIELDS", {}))
+        return fields
+    
+    @classmethod
+    def view_class(cls, enemy_class: type) -> type:
+        """Subclass enemy_class yang atribut kolomnya disimpan di store"""
+        view = cls._views.get(enemy_class)
+        if view is None:
+            fields = tuple(cls.fields_for(enemy_class))
+            namespace = {f"_{name}": _EnemyField() for name in fields}
+            namespace["_base_class"] = enemy_class
+            namespace["_store_fields"] = fields
+            view = type(f"{enemy_class.__name__}View", (enemy_class,), namespace)
+            cls._views[enemy_class] = view
+        return view
+    
+    def _add_columns(self, fields: Dict[str, type]) -> None:
+        for name, kind in fields.items():
+            if name not in self._columns:
+                self._columns[name] = kind
+                setattr(self, name, np.zeros(self._capacity, dtype=self.DTYPES[kind]))
+    
+    def _resize(self, capacity: int) -> None:
+        """Alokasikan ulang array dengan kapasitas baru, salin slot yang terpakai"""
+        n = self.count
+        for name, kind in self._columns.items():
+            arr = np.zeros(capacity, dtype=self.DTYPES[kind])
+            arr[:n] = getattr(self, name)[:n]
+            setattr(self, name, arr)
+        self._capacity = capacity
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def add(self, enemy: "Enemy") -> None:
+        if enemy._store is not None:
+            raise ValueError("Enemy sudah terdaftar di sebuah EnemyStore")
+        view = self.view_class(type(enemy))
+        self._add_columns(self.fields_for(type(enemy)))
+        if self.count == self._capacity:
+            self._resize(self._capacity * 2)
+        slot = self.count
+        values = enemy.__dict__
+        for name in view._store_fields:
+            getattr(self, name)[slot] = values.pop(f"_{name}")
+        enemy._store = self
+        enemy._slot = slot
+        enemy.__class__ = view
+        self.enemies.append(enemy)
+        if view.tick is not Enemy.tick:
+            self._ticking.append(enemy)
+        self._groups = None
+        self.count += 1
+    
+    def assign(self, enemies: List["Enemy"]) -> None:
+        """Ganti seluruh isi store dengan enemies (urutan dipertahankan)"""
+        self.clear()
+        for enemy in enemies:
+            self.add(enemy)
+    
+    def clear(self) -> None:
+        for enemy in self.enemies:
+            self._detach(enemy)
+        self.enemies = []
+        self._ticking = []
+        self._groups = None
+        self.count = 0
+    
+    def _detach(self, enemy: "Enemy") -> None:
+        """Kembalikan musuh ke objek biasa dengan nilai terakhir dari array"""
+        slot = enemy._slot
+        values = {f"_{name}": getattr(self, name).item(slot) for name in enemy._store_fields}
+        enemy.__class__ = enemy._base_class
+        enemy.__dict__.update(values)
+        enemy._store = None
+        enemy._slot = -1
+    
+    def remove(self, removed: Iterable["Enemy"]) -> None:
+        """Keluarkan musuh dan padatkan array tanpa mengubah urutan sisanya"""
+        gone = {id(enemy) for enemy in removed if enemy._store is self}
+        if not gone:
+            return
+        keep = np.fromiter((id(enemy) not in gone for enemy in self.enemies),
+                           dtype=bool, count=self.count)
+        survivors = []
+        for enemy in self.enemies:
+            if id(enemy) in gone:
+                self._detach(enemy)
+            else:
+                survivors.append(enemy)
+        n = len(survivors)
+        for name in self._columns:
+            arr = getattr(self, name)
+            arr[:n] = arr[:self.count][keep]
+        for slot, enemy in enumerate(survivors):
+            enemy._slot = slot
+        self.enemies = survivors
+        self._ticking = [enemy for enemy in self._ticking if id(enemy) not in gone]
+        self._groups = None
+        self.count = n
+    
+    def groups(self) -> Dict[type, EnemyGroup]:
+        """Musuh dikelompokkan per kelas (dibangun ulang hanya saat isi store berubah)"""
+        if self._groups is None:
+            members: Dict[type, List[int]] = {}
+            for slot, enemy in enumerate(self.enemies):
+                members.setdefault(enemy._base_class, []).append(slot)
+            self._groups = {
+                enemy_class: EnemyGroup(np.array(slots, dtype=np.int64),
+                                        [self.enemies[slot] for slot in slots])
+                for enemy_class, slots in members.items()
+            }
+        return self._groups
+    
+    def take_actions(self, player: "Player", dt: Union[float, "np.ndarray"],
+                     due: Optional["np.ndarray"] = None) -> None:
+        """take_action() untuk semua musuh (atau hanya slot dengan due=True).
+        
+        dt boleh skalar atau array per slot (lihat AIScheduler). Kelas dengan
+        batch_take_action() dihitung per kelompok sekaligus; bagian per objek
+        (finish_action() atau take_action() penuh untuk kelompok kecil) lalu
+        dijalankan urut slot supaya urutan RNG.ai sama dengan loop biasa.
+        """
+        steps = np.full(self.count, dt) if np.ndim(dt) == 0 else dt
+        pending: List[Tuple[int, Optional[bool]]] = []
+        for enemy_class, group in self.groups().items():
+            if due is not None:
+                mask = due[group.slots]
+                if not mask.any():
+                    continue
+                if not mask.all():
+                    group = group.subset(mask)
+            hooks = None
+            if len(group) >= ENEMY_BATCH_MIN:
+                hooks = enemy_class.batch_take_action(self, group, player, steps[group.slots])
+            if hooks is None:
+                pending.extend((slot, None) for slot in group.slots.tolist())
+            else:
+                pending.extend(hooks)
+        pending.sort(key=lambda item: item[0])
+        enemies = self.enemies
+        step_values = steps.tolist()
+        for slot, active in pending:
+            if active is None:
+                enemies[slot].take_action(player, step_values[slot])
+            else:
+                enemies[slot].finish_action(step_values[slot], active)
+    
+    def integrate(self, dt: Union[float, "np.ndarray"], world_width: int, world_height: int) -> None:
+        """Enemy.update() untuk semua musuh sekaligus (dt 0 = slot tidak bergerak)"""
+        n = self.count
+        if not n:
+            return
+        x, y, size = self.x[:n], self.y[:n], self.size[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        x += self.vx[:n] * dt
+        y += self.vy[:n] * dt
+        np.maximum(np.minimum(x, world_width - size, out=x), 0, out=x)
+        np.maximum(np.minimum(y, world_height - size, out=y), 0, out=y)
+        alert = self.alert_timer[:n]
+        np.subtract(alert, dt, out=alert, where=alert > 0)
+        if np.ndim(dt) == 0:
+            for enemy in self._ticking:
+                enemy.tick(dt)
+        else:
+            for enemy in self._ticking:
+                step = dt.item(enemy._slot)
+                if step:
+                    enemy.tick(step)
+    
+    def rects(self) -> List[pygame.Rect]:
+        """Rect semua musuh (sama dengan get_rect() per musuh), urut slot"""
+        n = self.count
+        sizes = self.size[:n].tolist()
+        return [pygame.Rect(x, y, size, size) for x, y, size
+                in zip(self.x[:n].astype(np.int64).tolist(),
+                       self.y[:n].astype(np.int64).tolist(), sizes)]
+    
+    def overlapping(self, rect: pygame.Rect) -> List[int]:
+        """Slot musuh yang rect-nya bertabrakan dengan rect, urut slot"""
+        return np.flatnonzero(self._overlap_mask(rect)).tolist()
+    
+    def contacts(self, rect: pygame.Rect) -> List[int]:
+        """overlapping() ditambah musuh yang gerakannya frame ini menyapu rect (Enemy.sweeps)"""
+        n = self.count
+        hit = self._overlap_mask(rect)
+        x, y, size = self.x[:n], self.y[:n], self.size[:n]
+        prev_x, prev_y = self.prev_x[:n], self.prev_y[:n]
+        # Broad phase: hanya yang cukup cepat dan kotak lintasannya menyentuh rect
+        moving = (~hit & (np.abs(x - prev_x) + np.abs(y - prev_y) > SWEPT_MIN_STEP) &
+                  (np.minimum(x, prev_x) < rect.right) & (np.maximum(x, prev_x) + size > rect.left) &
+                  (np.minimum(y, prev_y) < rect.bottom) & (np.maximum(y, prev_y) + size > rect.top))
+        for slot in np.flatnonzero(moving).tolist():
+            hit[slot] = self.enemies[slot].sweeps(rect)
+        return np.flatnonzero(hit).tolist()
+    
+    def _overlap_mask(self, rect: pygame.Rect) -> "np.ndarray":
+        n = self.count
+        left = self.x[:n].astype(np.int64)
+        top = self.y[:n].astype(np.int64)
+        size = self.size[:n]
+        return ((left < rect.right) & (left + size > rect.left) &
+                (top < rect.bottom) & (top + size > rect.top))
+    
+    def distances_to(self, x: float, y: float) -> "np.ndarray":
+        """Jarak posisi (pojok kiri atas) tiap musuh ke titik (x, y)"""
+        n = self.count
+        dx = x - self.x[:n]
+        dy = y - self.y[:n]
+        return np.sqrt(dx * dx + dy * dy)
+
+
+def create_enemy_store(backend: str = ENEMY_BACKEND) -> Optional[EnemyStore]:
+    """EnemyStore untuk backend "store"; None (objek biasa) jika NumPy tidak ada"""
+    if backend not in ENEMY_BACKENDS:
+        raise ValueError(f"Unknown enemy backend {backend!r}, expected one of {ENEMY_BACKENDS}")
+    if backend == "store" and HAS_NUMPY:
+        return EnemyStore()
+    return None
+
+
 class Enemy:
+    # Diisi EnemyStore saat musuh terdaftar (lihat EnemyStore.add)
+    _store: Optional[EnemyStore] = None
+    _slot = -1
+    # Atribut tambahan (tanpa "_") yang disimpan sebagai kolom EnemyStore
+    STORE_FIELDS: Dict[str, type] = {}
+    
     def __init__(self, x: float, y: float, enemy_type: str):
         self._x = x
         self._y = y
@@ -1985,6 +3861,11 @@ class Enemy:
         self._speed = ENEMY_PATROL_SPEED
         self._alert_timer = 0.0
         self._health = 1
+        # dt yang terkumpul selama AIScheduler melewati musuh ini
+        self._ai_dt = 0.0
+        # Posisi sebelum integrasi terakhir (untuk tabrakan tersapu)
+        self._prev_x = x
+        self._prev_y = y
     
     # Getter untuk posisi, rect, dan status kesehatan musuh
     def get_position(self) -> Tuple[float, float]:
@@ -2011,8 +3892,22 @@ class Enemy:
     def take_action(self, player: Player, dt: float) -> None:
         pass
     
+    # Versi batch take_action() untuk satu kelompok di EnemyStore (dt: array per anggota).
+    # Mengembalikan (slot, active) yang masih butuh finish_action(), atau None
+    # jika kelas ini tidak punya versi batch.
+    @classmethod
+    def batch_take_action(cls, store: EnemyStore, group: EnemyGroup,
+                          player: Player, dt: float) -> Optional[List[Tuple[int, bool]]]:
+        return None
+    
+    # Bagian take_action() yang tetap per objek (RNG, trail); active = cabang khusus kelas
+    def finish_action(self, dt: float, active: bool) -> None:
+        pass
+    
     # Memperbarui posisi musuh
     def update(self, dt: float, world_width: int, world_height: int) -> None:
+        self._prev_x = self._x
+        self._prev_y = self._y
         self._x += self._vx * dt
         self._y += self._vy * dt
         
@@ -2021,6 +3916,22 @@ class Enemy:
         
         if self._alert_timer > 0:
             self._alert_timer -= dt
+        self.tick(dt)
+    
+    # Apakah gerakan update() terakhir menyapu rect walau posisi akhirnya tidak overlap.
+    # Hanya untuk perpindahan di atas SWEPT_MIN_STEP (dash Flare Wolf, dt besar).
+    def sweeps(self, rect: pygame.Rect) -> bool:
+        dx = self._x - self._prev_x
+        dy = self._y - self._prev_y
+        if abs(dx) + abs(dy) <= SWEPT_MIN_STEP:
+            return False
+        size = self._size
+        return sweep_entry(self._prev_x, self._prev_y, dx, dy, rect.left - size,
+                           rect.top - size, rect.right, rect.bottom) is not None
+    
+    # Hook timer khusus per kelas; dipanggil setelah integrasi (juga oleh EnemyStore)
+    def tick(self, dt: float) -> None:
+        pass
     
     # Metode abstrak untuk menggambar musuh
     def draw(self, surface: pygame.Surface, camera_offset: Tuple[int, int]) -> None:
@@ -2028,12 +3939,40 @@ class Enemy:
 
 
 class GlimpEnemy(Enemy):
+    STORE_FIELDS = {"current_waypoint": int, "wobble_timer": float}
+    
     def __init__(self, x: float, y: float, waypoints: List[Tuple[float, float]]):
         super().__init__(x, y, "glimp")
         self._waypoints = waypoints
         self._current_waypoint = 0
         self._wobble_timer = 0.0
 
+    @classmethod
+    def batch_take_action(cls, store: EnemyStore, group: EnemyGroup,
+                          player: Player, dt: float) -> List[Tuple[int, bool]]:
+        slots = group.slots
+        x, y = store.x[slots], store.y[slots]
+        offsets, counts, waypoint_x, waypoint_y = group.waypoints()
+        current = store.current_waypoint[slots]
+        dx = waypoint_x[offsets + current] - x
+        dy = waypoint_y[offsets + current] - y
+        dist = np.sqrt(dx * dx + dy * dy)
+        
+        arrived = dist < 5
+        store.current_waypoint[slots[arrived]] = (current[arrived] + 1) % counts[arrived]
+        steer = ~arrived & (dist > 0)
+        steer_slots = slots[steer]
+        speed = store.speed[steer_slots]
+        store.vx[steer_slots] = (dx[steer] / dist[steer]) * speed
+        store.vy[steer_slots] = (dy[steer] / dist[steer]) * speed
+        
+        px, py = player.get_position()
+        player_dist = np.sqrt((px - x) ** 2 + (py - y) ** 2)
+        store.alert_timer[slots[player_dist < 100]] = 0.5
+        
+        store.wobble_timer[slots] += dt * 4
+        return []
+
     def take_action(self, player: Player, dt: float) -> None:
         target = self._waypoints[self._current_waypoint]
         dx = target[0] - self._x
@@ -2056,56 +3995,90 @@ class GlimpEnemy(Enemy):
     def draw(self, surface: pygame.Surface, camera_offset: Tuple[int, int]) -> None:
         screen_x = int(self._x - camera_offset[0])
         screen_y = int(self._y - camera_offset[1])
+        size = self._size
+        alert_timer = self._alert_timer
         wobble = math.sin(self._wobble_timer) * 2
         
-        if self._alert_timer > 0:
-            glow_alpha = int(120 * (self._alert_timer / 0.5))
-            glow_surf = pygame.Surface((self._size + 12, self._size + 12), pygame.SRCALPHA)
+        if alert_timer > 0:
+            glow_alpha = int(120 * (alert_timer / 0.5))
+            glow_surf = new_surface((size + 12, size + 12), pygame.SRCALPHA)
             pygame.draw.rect(glow_surf, (255, 80, 80, glow_alpha),
-                           (6, 6, self._size, self._size), border_radius=10)
+                           (6, 6, size, size), border_radius=10)
             surface.blit(glow_surf, (screen_x - 6, screen_y - 6 + wobble))
         
-        enemy_rect = pygame.Rect(screen_x, int(screen_y + wobble), self._size, self._size)
+        enemy_rect = pygame.Rect(screen_x, int(screen_y + wobble), size, size)
         pygame.draw.rect(surface, (255, 80, 80), enemy_rect, border_radius=10)
         
-        eye_x = screen_x + self._size // 2
-        eye_y = int(screen_y + self._size // 2 + wobble)
-        eye_size = 10 if self._alert_timer > 0 else 8
+        eye_x = screen_x + size // 2
+        eye_y = int(screen_y + size // 2 + wobble)
+        eye_size = 10 if alert_timer > 0 else 8
         pygame.draw.circle(surface, COLOR_WHITE, (eye_x, eye_y), eye_size)
-        pupil_size = 6 if self._alert_timer > 0 else 4
+        pupil_size = 6 if alert_timer > 0 else 4
         pygame.draw.circle(surface, COLOR_BLACK, (eye_x, eye_y), pupil_size)
 
 
 class UmbraEnemy(Enemy):
+    STORE_FIELDS = {"aggro_range": float, "stretch_factor": float}
+    
     def __init__(self, x: float, y: float):
         super().__init__(x, y, "umbra")
         self._aggro_range = 150
         self._stretch_factor = 1.0
         self._trail_particles: List[dict] = []
 
+    @classmethod
+    def batch_take_action(cls, store: EnemyStore, group: EnemyGroup,
+                          player: Player, dt: float) -> List[Tuple[int, bool]]:
+        slots = group.slots
+        px, py = player.get_position()
+        dx = px - store.x[slots]
+        dy = py - store.y[slots]
+        dist = np.sqrt(dx * dx + dy * dy)
+        
+        chasing = (dist < store.aggro_range[slots]) & (dist > 0)
+        chase_slots = slots[chasing]
+        store.vx[chase_slots] = (dx[chasing] / dist[chasing]) * ENEMY_CHASE_SPEED
+        store.vy[chase_slots] = (dy[chasing] / dist[chasing]) * ENEMY_CHASE_SPEED
+        store.stretch_factor[chase_slots] = 1.2
+        store.alert_timer[chase_slots] = 0.3
+        idle_slots = slots[~chasing]
+        store.vx[idle_slots] = 0
+        store.vy[idle_slots] = 0
+        store.stretch_factor[idle_slots] = 1.0
+        
+        trailing = np.fromiter((bool(enemy._trail_particles) for enemy in group.enemies),
+                               dtype=bool, count=len(group))
+        pending = chasing | trailing
+        return list(zip(slots[pending].tolist(), chasing[pending].tolist()))
+
     def take_action(self, player: Player, dt: float) -> None:
         px, py = player.get_position()
         dx = px - self._x
         dy = py - self._y
         dist = math.sqrt(dx * dx + dy * dy)
         
-        if dist < self._aggro_range and dist > 0:
+        chasing = dist < self._aggro_range and dist > 0
+        if chasing:
             self._vx = (dx / dist) * ENEMY_CHASE_SPEED
             self._vy = (dy / dist) * ENEMY_CHASE_SPEED
             self._stretch_factor = 1.2
             self._alert_timer = 0.3
-            
-            if random.random() < 0.3:
-                self._trail_particles.append({
-                    'x': self._x + self._size // 2,
-                    'y': self._y + self._size // 2,
-                    'life': 0.5
-                })
         else:
             self._vx = 0
             self._vy = 0
             self._stretch_factor = 1.0
         
+        self.finish_action(dt, chasing)
+    
+    # active = sedang mengejar pemain
+    def finish_action(self, dt: float, active: bool) -> None:
+        if active and RNG.ai.random() < 0.3:
+            self._trail_particles.append({
+                'x': self._x + self._size // 2,
+                'y': self._y + self._size // 2,
+                'life': 0.5
+            })
+        
         for p in self._trail_particles[:]:
             p['life'] -= dt
             if p['life'] <= 0:
@@ -2114,27 +4087,29 @@ class UmbraEnemy(Enemy):
     def draw(self, surface: pygame.Surface, camera_offset: Tuple[int, int]) -> None:
         screen_x = int(self._x - camera_offset[0])
         screen_y = int(self._y - camera_offset[1])
+        size = self._size
+        alert_timer = self._alert_timer
         
         for p in self._trail_particles:
             alpha = int(150 * (p['life'] / 0.5))
-            trail_surf = pygame.Surface((8, 8), pygame.SRCALPHA)
+            trail_surf = new_surface((8, 8), pygame.SRCALPHA)
             pygame.draw.circle(trail_surf, (*COLOR_SHADOW_PURPLE, alpha), (4, 4), 4)
             surface.blit(trail_surf, (int(p['x'] - camera_offset[0] - 4), 
                                     int(p['y'] - camera_offset[1] - 4)))
         
-        if self._alert_timer > 0:
-            glow_surf = pygame.Surface((self._size + 12, self._size + 12), pygame.SRCALPHA)
+        if alert_timer > 0:
+            glow_surf = new_surface((size + 12, size + 12), pygame.SRCALPHA)
             pygame.draw.rect(glow_surf, (*COLOR_SHADOW_PURPLE, 100),
-                           (6, 6, self._size, self._size), border_radius=8)
+                           (6, 6, size, size), border_radius=8)
             surface.blit(glow_surf, (screen_x - 6, screen_y - 6))
         
-        stretch_w = int(self._size * self._stretch_factor)
-        stretch_x = screen_x - (stretch_w - self._size) // 2
+        stretch_w = int(size * self._stretch_factor)
+        stretch_x = screen_x - (stretch_w - size) // 2
         pygame.draw.rect(surface, COLOR_SHADOW_PURPLE,
-                        (stretch_x, screen_y, stretch_w, self._size), border_radius=8)
+                        (stretch_x, screen_y, stretch_w, size), border_radius=8)
         
-        left_eye = (stretch_x + stretch_w // 3, screen_y + self._size // 2)
-        right_eye = (stretch_x + 2 * stretch_w // 3, screen_y + self._size // 2)
+        left_eye = (stretch_x + stretch_w // 3, screen_y + size // 2)
+        right_eye = (stretch_x + 2 * stretch_w // 3, screen_y + size // 2)
         pygame.draw.circle(surface, COLOR_GEM_YELLOW, left_eye, 4)
         pygame.draw.circle(surface, COLOR_GEM_YELLOW, right_eye, 4)
         pygame.draw.circle(surface, (255, 80, 80), left_eye, 2)
@@ -2142,6 +4117,9 @@ class UmbraEnemy(Enemy):
 
 
 class FlareWolfEnemy(Enemy):
+    STORE_FIELDS = {"current_waypoint": int, "zigzag_timer": float, "dash_cooldown": float,
+                    "dashing": bool, "dash_timer": float, "dash_dx": float, "dash_dy": float}
+    
     def __init__(self, x: float, y: float, waypoints: List[Tuple[float, float]]):
         super().__init__(x, y, "flare_wolf")
         self._waypoints = waypoints
@@ -2150,7 +4128,9 @@ class FlareWolfEnemy(Enemy):
         self._dash_cooldown = 0.0
         self._dashing = False
         self._dash_timer = 0.0
-        self._dash_direction = (0.0, 0.0)
+        # Arah dash (vektor satuan)
+        self._dash_dx = 0.0
+        self._dash_dy = 0.0
         self._trail_particles: List[dict] = []
         self._health = 2
 
@@ -2162,6 +4142,67 @@ class FlareWolfEnemy(Enemy):
             self._dash_cooldown = 1.0
         return self._health <= 0
     
+    @classmethod
+    def batch_take_action(cls, store: EnemyStore, group: EnemyGroup,
+                          player: Player, dt: float) -> List[Tuple[int, bool]]:
+        slots = group.slots
+        x, y = store.x[slots], store.y[slots]
+        px, py = player.get_position()
+        player_dist = np.sqrt((px - x) ** 2 + (py - y) ** 2)
+        
+        dashing = store.dashing[slots]
+        start = ~dashing & (store.dash_cooldown[slots] <= 0) & (player_dist < 200)
+        if start.any():
+            start_slots = slots[start]
+            store.dash_timer[start_slots] = 0.3
+            store.dash_cooldown[start_slots] = 2.0
+            dx = px - x[start]
+            dy = py - y[start]
+            dist = np.maximum(0.1, np.sqrt(dx * dx + dy * dy))
+            store.dash_dx[start_slots] = dx / dist
+            store.dash_dy[start_slots] = dy / dist
+            store.speed[start_slots] = ENEMY_CHASE_SPEED * 1.5
+            dashing = dashing | start
+        
+        dash_slots = slots[dashing]
+        dash_timer = store.dash_timer[dash_slots] - dt[dashing]
+        store.dash_timer[dash_slots] = dash_timer
+        speed = store.speed[dash_slots]
+        store.vx[dash_slots] = store.dash_dx[dash_slots] * speed
+        store.vy[dash_slots] = store.dash_dy[dash_slots] * speed
+        ended = dash_timer <= 0
+        store.dashing[dash_slots] = ~ended
+        store.speed[dash_slots[ended]] = ENEMY_PATROL_SPEED
+        
+        patrol = ~dashing
+        patrol_slots = slots[patrol]
+        store.dash_cooldown[patrol_slots] -= dt[patrol]
+        zigzag_timer = store.zigzag_timer[patrol_slots] + dt[patrol] * 3
+        store.zigzag_timer[patrol_slots] = zigzag_timer
+        zigzag_offset = np.sin(zigzag_timer) * 20
+        
+        offsets, counts, waypoint_x, waypoint_y = group.waypoints()
+        current = store.current_waypoint[patrol_slots]
+        target = offsets[patrol] + current
+        dx = waypoint_x[target] - x[patrol]
+        dy = waypoint_y[target] - y[patrol] + zigzag_offset
+        dist = np.sqrt(dx * dx + dy * dy)
+        
+        arrived = dist < 10
+        store.current_waypoint[patrol_slots[arrived]] = (current[arrived] + 1) % counts[patrol][arrived]
+        steer = ~arrived & (dist > 0)
+        steer_slots = patrol_slots[steer]
+        speed = store.speed[steer_slots]
+        store.vx[steer_slots] = (dx[steer] / dist[steer]) * speed
+        store.vy[steer_slots] = (dy[steer] / dist[steer]) * speed
+        
+        store.alert_timer[slots[player_dist < 150]] = 0.5
+        
+        trailing = np.fromiter((bool(enemy._trail_particles) for enemy in group.enemies),
+                               dtype=bool, count=len(group))
+        pending = dashing | trailing
+        return list(zip(slots[pending].tolist(), dashing[pending].tolist()))
+    
     def take_action(self, player: Player, dt: float) -> None:
         px, py = player.get_position()
         player_dist = math.sqrt((px - self._x) ** 2 + (py - self._y) ** 2)
@@ -2174,22 +4215,16 @@ class FlareWolfEnemy(Enemy):
             dx = px - self._x
             dy = py - self._y
             dist = max(0.1, math.sqrt(dx * dx + dy * dy))
-            self._dash_direction = (dx / dist, dy / dist)
+            self._dash_dx = dx / dist
+            self._dash_dy = dy / dist
             
             self._speed = ENEMY_CHASE_SPEED * 1.5
         
-        if self._dashing:
+        dashing = self._dashing
+        if dashing:
             self._dash_timer -= dt
-            self._vx = self._dash_direction[0] * self._speed
-            self._vy = self._dash_direction[1] * self._speed
-            
-            if random.random() < 0.5:
-                self._trail_particles.append({
-                    'x': self._x + self._size // 2,
-                    'y': self._y + self._size // 2,
-                    'life': 0.6,
-                    'size': random.randint(2, 4)
-                })
+            self._vx = self._dash_dx * self._speed
+            self._vy = self._dash_dy * self._speed
             
             if self._dash_timer <= 0:
                 self._dashing = False
@@ -2214,6 +4249,18 @@ class FlareWolfEnemy(Enemy):
         if player_dist < 150:
             self._alert_timer = 0.5
         
+        self.finish_action(dt, dashing)
+    
+    # active = sedang dash di frame ini
+    def finish_action(self, dt: float, active: bool) -> None:
+        if active and RNG.ai.random() < 0.5:
+            self._trail_particles.append({
+                'x': self._x + self._size // 2,
+                'y': self._y + self._size // 2,
+                'life': 0.6,
+                'size': RNG.ai.randint(2, 4)
+            })
+        
         for p in self._trail_particles[:]:
             p['life'] -= dt
             if p['life'] <= 0:
@@ -2222,11 +4269,14 @@ class FlareWolfEnemy(Enemy):
     def draw(self, surface: pygame.Surface, camera_offset: Tuple[int, int]) -> None:
         screen_x = int(self._x - camera_offset[0])
         screen_y = int(self._y - camera_offset[1])
+        wolf_size = self._size
+        alert_timer = self._alert_timer
+        dashing = self._dashing
         
         for p in self._trail_particles:
             alpha = int(200 * (p['life'] / 0.6))
             size = p['size']
-            trail_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            trail_surf = new_surface((size * 2, size * 2), pygame.SRCALPHA)
             
             pygame.draw.circle(trail_surf, (255, 200, 0, alpha), (size, size), size)
             pygame.draw.circle(trail_surf, (255, 100, 0, alpha//2), (size, size), size//2)
@@ -2234,16 +4284,16 @@ class FlareWolfEnemy(Enemy):
             surface.blit(trail_surf, (int(p['x'] - camera_offset[0] - size), 
                                     int(p['y'] - camera_offset[1] - size)))
         
-        if self._alert_timer > 0 or self._dashing:
-            glow_color = (255, 100, 0) if self._dashing else (255, 80, 80)
-            glow_alpha = 150 if self._dashing else int(120 * (self._alert_timer / 0.5))
-            glow_surf = pygame.Surface((self._size + 16, self._size + 16), pygame.SRCALPHA)
+        if alert_timer > 0 or dashing:
+            glow_color = (255, 100, 0) if dashing else (255, 80, 80)
+            glow_alpha = 150 if dashing else int(120 * (alert_timer / 0.5))
+            glow_surf = new_surface((wolf_size + 16, wolf_size + 16), pygame.SRCALPHA)
             pygame.draw.rect(glow_surf, (*glow_color, glow_alpha),
-                           (8, 8, self._size, self._size), border_radius=12)
+                           (8, 8, wolf_size, wolf_size), border_radius=12)
             surface.blit(glow_surf, (screen_x - 8, screen_y - 8))
         
-        wolf_rect = pygame.Rect(screen_x, screen_y, self._size, self._size)
-        body_color = (255, 140, 0) if self._dashing else COLOR_FLARE_WOLF
+        wolf_rect = pygame.Rect(screen_x, screen_y, wolf_size, wolf_size)
+        body_color = (255, 140, 0) if dashing else COLOR_FLARE_WOLF
         pygame.draw.rect(surface, body_color, wolf_rect, border_radius=8)
         pygame.draw.rect(surface, (200, 80, 0), wolf_rect, width=2, border_radius=8)
         
@@ -2261,7 +4311,7 @@ class FlareWolfEnemy(Enemy):
         
         left_eye = (screen_x + 10, screen_y + 12)
         right_eye = (screen_x + 20, screen_y + 12)
-        eye_size = 4 if self._dashing else 3
+        eye_size = 4 if dashing else 3
         pygame.draw.circle(surface, COLOR_GEM_YELLOW, left_eye, eye_size + 1)
         pygame.draw.circle(surface, COLOR_GEM_YELLOW, right_eye, eye_size + 1)
         pygame.draw.circle(surface, (255, 50, 50), left_eye, eye_size - 1)
@@ -2277,7 +4327,6 @@ class ForestGuardianEnemy(Enemy):
         self._attack_cooldown = 3.0
         self._charging_attack = False
         self._charge_timer = 0.0
-        self._projectiles: List[dict] = []
         self._rune_glow_timer = 0.0
         self._hit_flash_timer = 0.0
     
@@ -2293,8 +4342,7 @@ class ForestGuardianEnemy(Enemy):
         
         return self._health <= 0
     
-    def update(self, dt: float, world_width: int, world_height: int) -> None:
-        super().update(dt, world_width, world_height)
+    def tick(self, dt: float) -> None:
         if self._hit_flash_timer > 0:
             self._hit_flash_timer -= dt
     
@@ -2326,31 +4374,19 @@ class ForestGuardianEnemy(Enemy):
                 if dist > 0:
                     proj_dx = dx / dist
                     proj_dy = dy / dist
-                    self._projectiles.append({
-                        'x': self._x + self._size // 2,
-                        'y': self._y + self._size // 2,
-                        'vx': proj_dx * 100,
-                        'vy': proj_dy * 100,
-                        'life': 3.0,
-                        'size': 12
-                    })
+                    projectile_pool.spawn("guardian", self,
+                                          self._x + self._size // 2, self._y + self._size // 2,
+                                          proj_dx * 100, proj_dy * 100, 3.0, 12)
                 self._charging_attack = False
-                self._attack_cooldown = random.uniform(2.5, 4.0)
-        
-        for proj in self._projectiles[:]:
-            proj['x'] += proj['vx'] * dt
-            proj['y'] += proj['vy'] * dt
-            proj['life'] -= dt
-            if proj['life'] <= 0:
-                self._projectiles.remove(proj)
+                self._attack_cooldown = RNG.ai.uniform(2.5, 4.0)
         
         if self._rune_glow_timer > 0:
             self._rune_glow_timer -= dt
         
         self._alert_timer = 0.3
     
-    def get_projectiles(self) -> List[dict]:
-        return self._projectiles.copy()
+    def get_projectiles(self) -> List[Projectile]:
+        return projectile_pool.owned_by(self)
     
     def draw(self, surface: pygame.Surface, camera_offset: Tuple[int, int]) -> None:
         screen_x = int(self._x - camera_offset[0])
@@ -2364,7 +4400,7 @@ class ForestGuardianEnemy(Enemy):
         rune_color = (100, 255, 200, rune_alpha)
         
         if rune_alpha > 0:
-            rune_surf = pygame.Surface((self._size, self._size), pygame.SRCALPHA)
+            rune_surf = new_surface((self._size, self._size), pygame.SRCALPHA)
             pygame.draw.polygon(rune_surf, rune_color, [
                 (10, 15), (20, 10), (30, 15), (20, 30)
             ])
@@ -2376,7 +4412,7 @@ class ForestGuardianEnemy(Enemy):
         eye_glow = 8 if self._charging_attack else 6
         
         for eye in [left_eye, right_eye]:
-            glow_surf = pygame.Surface((eye_glow * 2, eye_glow * 2), pygame.SRCALPHA)
+            glow_surf = new_surface((eye_glow * 2, eye_glow * 2), pygame.SRCALPHA)
             pygame.draw.circle(glow_surf, (100, 255, 200, 150), 
                              (eye_glow, eye_glow), eye_glow)
             surface.blit(glow_surf, (eye[0] - eye_glow, eye[1] - eye_glow))
@@ -2384,13 +4420,13 @@ class ForestGuardianEnemy(Enemy):
         pygame.draw.circle(surface, (50, 200, 150), left_eye, 4)
         pygame.draw.circle(surface, (50, 200, 150), right_eye, 4)
         
-        for proj in self._projectiles:
-            proj_x = int(proj['x'] - camera_offset[0])
-            proj_y = int(proj['y'] - camera_offset[1])
-            proj_size = proj['size']
-            alpha = int(200 * (proj['life'] / 3.0))
+        for proj in projectile_pool.owned_by(self):
+            proj_x = int(proj.x - camera_offset[0])
+            proj_y = int(proj.y - camera_offset[1])
+            proj_size = proj.size
+            alpha = int(200 * (proj.life / proj.max_life))
             
-            proj_surf = pygame.Surface((proj_size * 2, proj_size * 2), pygame.SRCALPHA)
+            proj_surf = new_surface((proj_size * 2, proj_size * 2), pygame.SRCALPHA)
             pygame.draw.circle(proj_surf, (100, 255, 255, alpha), 
                              (proj_size, proj_size), proj_size)
             pygame.draw.circle(proj_surf, (255, 255, 255, alpha), 
@@ -2412,40 +4448,443 @@ class ForestGuardianEnemy(Enemy):
 
 
 
+# ==================== AI SCHEDULER ====================
+class AIScheduler:
+    """LOD untuk AI musuh berdasarkan jarak ke viewport kamera.
+    
+    Tier pertama yang cocok menentukan seberapa sering musuh menjalankan
+    take_action()/update(): tiap frame, tiap beberapa frame (dt dikumpulkan
+    lalu dipakai sekaligus, dibatasi max_dt) atau beku. Jadwal antar musuh
+    digeser per indeks supaya tier yang jarang tidak menumpuk di satu frame.
+    counts berisi jumlah musuh yang dijalankan per tier di frame terakhir
+    (plus "skipped"), totals akumulasinya.
+    """
+    
+    def __init__(self, tiers: Sequence[Tuple[str, Optional[int], int]] = AI_LOD_TIERS,
+                 active_radius: float = AI_LOD_ACTIVE_RADIUS, max_dt: float = AI_LOD_MAX_DT):
+        if not tiers or tiers[-1][1] is not None:
+            raise ValueError("Tier terakhir harus mencakup semua jarak (margin None)")
+        self.tiers = tuple(tiers)
+        self.active_radius = active_radius
+        # dt yang terkumpul dalam satu interval tier tidak boleh terpotong
+        self.max_dt = max(max_dt, max(interval for _, _, interval in self.tiers) / FPS)
+        self.frame = 0
+        names = [name for name, _, _ in self.tiers] + ["skipped"]
+        self.counts: Dict[str, int] = dict.fromkeys(names, 0)
+        self.totals: Dict[str, int] = dict.fromkeys(names, 0)
+        if HAS_NUMPY:
+            self._intervals = np.array([interval for _, _, interval in self.tiers], dtype=np.int64)
+    
+    def _bounds(self, view: pygame.Rect) -> List[Tuple[int, int, int, int]]:
+        """Viewport yang diperluas margin tiap tier (kecuali tier terakhir)"""
+        return [(view.left - margin, view.top - margin, view.right + margin, view.bottom + margin)
+                for _, margin, _ in self.tiers[:-1]]
+    
+    def _record(self, ran: List[int], skipped: int) -> None:
+        for (name, _, _), count in zip(self.tiers, ran):
+            self.counts[name] = count
+            self.totals[name] += count
+        self.counts["skipped"] = skipped
+        self.totals["skipped"] += skipped
+        self.frame += 1
+    
+    def plan(self, enemies: List[Enemy], view: pygame.Rect, player_pos: Tuple[float, float],
+             dt: float) -> List[Optional[float]]:
+        """dt untuk tiap musuh di frame ini, atau None jika musuh dilewati"""
+        px, py = player_pos
+        radius_sq = self.active_radius ** 2
+        bounds = self._bounds(view)
+        last = len(self.tiers) - 1
+        intervals = [interval for _, _, interval in self.tiers]
+        ran = [0] * len(self.tiers)
+        steps: List[Optional[float]] = []
+        frame = self.frame
+        for index, enemy in enumerate(enemies):
+            x, y = enemy._x, enemy._y
+            tier = last
+            if (px - x) ** 2 + (py - y) ** 2 < radius_sq:
+                tier = 0
+            else:
+                size = enemy._size
+                for bound_index, (left, top, right, bottom) in enumerate(bounds):
+                    if x + size > left and x < right and y + size > top and y < bottom:
+                        tier = bound_index
+                        break
+            interval = intervals[tier]
+            if not interval:
+                steps.append(None)
+                continue
+            enemy._ai_dt += dt
+            if (frame + index) % interval:
+                steps.append(None)
+                continue
+            steps.append(min(enemy._ai_dt, self.max_dt))
+            enemy._ai_dt = 0.0
+            ran[tier] += 1
+        self._record(ran, len(enemies) - sum(ran))
+        return steps
+    
+    def plan_store(self, store: EnemyStore, view: pygame.Rect, player_pos: Tuple[float, float],
+                   dt: float) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Versi array dari plan(): (mask due per slot, dt per slot dengan 0 untuk yang dilewati)"""
+        n = store.count
+        x, y, size = store.x[:n], store.y[:n], store.size[:n]
+        px, py = player_pos
+        tier = np.full(n, len(self.tiers) - 1, dtype=np.int64)
+        pending = (px - x) ** 2 + (py - y) ** 2 >= self.active_radius ** 2
+        tier[~pending] = 0
+        for index, (left, top, right, bottom) in enumerate(self._bounds(view)):
+            inside = pending & ((x + size > left) & (x < right) & (y + size > top) & (y < bottom))
+            tier[inside] = index
+            pending &= ~inside
+        
+        intervals = self._intervals[tier]
+        live = intervals > 0
+        ai_dt = store.ai_dt[:n]
+        np.add(ai_dt, dt, out=ai_dt, where=live)
+        due = live & ((self.frame + np.arange(n)) % np.maximum(intervals, 1) == 0)
+        steps = np.where(due, np.minimum(ai_dt, self.max_dt), 0.0)
+        ai_dt[due] = 0.0
+        ran = np.bincount(tier[due], minlength=len(self.tiers)).tolist()
+        self._record(ran, n - int(due.sum()))
+        return due, steps
+
+
 # ==================== TILEMAP ====================
+class _LayerRecorder:
+    """Merekam perintah gambar satu layer tilemap supaya bisa diputar ulang per chunk"""
+    def __init__(self):
+        self.commands: List[tuple] = []
+    
+    def blit(self, source: pygame.Surface, dest: Tuple[int, int], area=None,
+             special_flags: int = 0) -> None:
+        size = pygame.Rect(area).size if area is not None else source.get_size()
+        self.commands.append(("blit", None, (source, dest, area, special_flags), (), {},
+                              pygame.Rect(dest, size)))
+
+
+class _ChunkCanvas:
+    """Surface satu chunk; koordinat dunia digeser ke koordinat lokal chunk"""
+    def __init__(self, surface: pygame.Surface, origin: Tuple[int, int]):
+        self.surface = surface
+        self.ox, self.oy = origin
+    
+    def blit(self, source: pygame.Surface, dest: Tuple[int, int], area=None,
+             special_flags: int = 0) -> None:
+        self.surface.blit(source, (dest[0] - self.ox, dest[1] - self.oy), area, special_flags)
+
+
+class _TileDrawer:
+    """Pengganti pygame.draw untuk layer tilemap.
+    
+    Target _LayerRecorder: perintah direkam beserta bounding box-nya.
+    Target _ChunkCanvas: digambar dengan koordinat yang sudah digeser.
+    Surface biasa: diteruskan langsung ke pygame.draw.
+    """
+    def rect(self, target, color, rect, *args, **kwargs) -> None:
+        self._draw("rect", target, color, pygame.Rect(rect), args, kwargs)
+    
+    def ellipse(self, target, color, rect, *args, **kwargs) -> None:
+        self._draw("ellipse", target, color, pygame.Rect(rect), args, kwargs)
+    
+    def arc(self, target, color, rect, *args, **kwargs) -> None:
+        self._draw("arc", target, color, pygame.Rect(rect), args, kwargs)
+    
+    def circle(self, target, color, center, radius, *args, **kwargs) -> None:
+        self._draw("circle", target, color, tuple(center), (radius, *args), kwargs)
+    
+    def line(self, target, color, start_pos, end_pos, width: int = 1) -> None:
+        self._draw("line", target, color, (tuple(start_pos), tuple(end_pos)), (width,), {})
+    
+    def polygon(self, target, color, points, *args, **kwargs) -> None:
+        self._draw("polygon", target, color, tuple(tuple(p) for p in points), args, kwargs)
+    
+    def replay(self, command: tuple, canvas: _ChunkCanvas) -> None:
+        op, color, geometry, args, kwargs, _ = command
+        if op == "blit":
+            canvas.blit(*geometry)
+        else:
+            self._draw(op, canvas, color, geometry, args, kwargs)
+    
+    def _draw(self, op: str, target, color, geometry, args: tuple, kwargs: dict) -> None:
+        if isinstance(target, _LayerRecorder):
+            target.commands.append((op, color, geometry, args, kwargs,
+                                    self._bounds(op, geometry, args)))
+            return
+        if isinstance(target, _ChunkCanvas):
+            geometry = self._shift(op, geometry, -target.ox, -target.oy)
+            target = target.surface
+        
+        if op == "line":
+            pygame.draw.line(target, color, geometry[0], geometry[1], *args)
+        else:
+            getattr(pygame.draw, op)(target, color, geometry, *args, **kwargs)
+    
+    @staticmethod
+    def _shift(op: str, geometry, dx: int, dy: int):
+        if isinstance(geometry, pygame.Rect):
+            return geometry.move(dx, dy)
+        if op == "circle":
+            return (geometry[0] + dx, geometry[1] + dy)
+        return tuple((x + dx, y + dy) for x, y in geometry)
+    
+    @staticmethod
+    def _bounds(op: str, geometry, args: tuple) -> pygame.Rect:
+        if isinstance(geometry, pygame.Rect):
+            return geometry.inflate(2, 2)
+        if op == "circle":
+            radius = int(args[0]) + 1
+            return pygame.Rect(int(geometry[0]) - radius, int(geometry[1]) - radius,
+                               radius * 2 + 1, radius * 2 + 1)
+        pad = (args[0] if op == "line" and args else 1) + 1
+        xs = [p[0] for p in geometry]
+        ys = [p[1] for p in geometry]
+        left, top = int(min(xs)) - pad, int(min(ys)) - pad
+        return pygame.Rect(left, top, int(max(xs)) + pad - left + 1, int(max(ys)) + pad - top + 1)
+
+
+tile_drawer = _TileDrawer()
+
+
 class TileMap:
-    def __init__(self, width: int, height: int, level: Level = Level.LEVEL_1):
+    """Tilemap ber-chunk yang digambar saat kamera mendekat.
+    
+    Objek level direkam sekali sebagai perintah gambar, tile dasar dihitung
+    per chunk dengan RNG per tile, jadi chunk yang di-evict lalu dibuat
+    ulang selalu identik.
+    """
+    GRASS_COLORS = [
+        (140, 180, 140),    # Light green
+        (130, 170, 130),    # Medium green
+        (120, 160, 120),    # Dark green
+        (150, 190, 150),    # Bright green
+    ]
+    
+    ROCK_COLORS = [
+        (130, 90, 70),    # Light brown
+        (110, 75, 55),    # Medium brown
+        (90, 60, 40),     # Dark brown
+        (120, 85, 65),    # Reddish brown
+    ]
+    
+    LAVA_COLORS = [
+        (255, 100, 50),   # Bright orange
+        (255, 80, 40),    # Medium orange
+        (255, 60, 30),    # Dark orange
+        (220, 120, 60),   # Yellow-orange
+    ]
+    
+    MARBLE_COLORS = [
+        (160, 160, 170),  # Light gray
+        (150, 150, 160),  # Medium gray
+        (140, 140, 150),  # Dark gray
+        (170, 170, 180),  # Blue-gray
+    ]
+    
+    GOLD_COLOR = (210, 180, 80)
+    
+    LAYER_NAMES = ("base", "below", "above")
+    CHUNK_PAD = 8
+    CHUNK_MAGIC = b"ELCH"
+    CHUNK_HEADER = struct.Struct("<4sHHii")
+    
+    _generator_hash: Optional[str] = None
+    
+    def __init__(self, width: int, height: int, level: Level = Level.LEVEL_1,
+                 chunk_size: int = TILEMAP_CHUNK_SIZE, seed: Optional[int] = None,
+                 max_chunks: int = TILEMAP_MAX_CHUNKS,
+                 cache_dir: Optional[str] = TILEMAP_CACHE_DIR):
         self.width = width
         self.height = height
         self.tile_size = TILE_SIZE
         self.tiles_x = width // self.tile_size
         self.tiles_y = height // self.tile_size
         self.level = level
+        # Tanpa seed eksplisit, seed diturunkan dari seed master (stabil per level)
+        self.seed = seed if seed is not None else RNG.derive_seed("tilemap", level.value, width, height) & 0x7FFFFFFF
+        self._rng = random.Random(self.seed)
+        
+        self.chunk_size = chunk_size
+        self.chunks_x = (width + chunk_size - 1) // chunk_size
+        self.chunks_y = (height + chunk_size - 1) // chunk_size
+        self.max_chunks = max_chunks
         
-        self.base_layer = pygame.Surface((width, height))
-        self.objects_below_layer = pygame.Surface((width, height), pygame.SRCALPHA)
-        self.objects_above_layer = pygame.Surface((width, height), pygame.SRCALPHA)
+        # Objek direkam dulu; pixel baru dibuat per chunk saat dibutuhkan
+        self.base_layer = _LayerRecorder()
+        self.objects_below_layer = _LayerRecorder()
+        self.objects_above_layer = _LayerRecorder()
         
         self._generate_tilemap()
+        
+        self._chunk_commands = {
+            "base": self._bucket_commands(self.base_layer),
+            "below": self._bucket_commands(self.objects_below_layer),
+            "above": self._bucket_commands(self.objects_above_layer),
+        }
+        self._chunks: "OrderedDict[Tuple[str, int, int], Optional[Tuple[pygame.Surface, Tuple[int, int]]]]" = OrderedDict()
+        self.stats = {"generated": 0, "evicted": 0, "prefetched": 0, "disk_hits": 0, "disk_writes": 0}
+        
+        # Layout dari seed acak tidak akan pernah dipakai ulang, jadi tidak perlu disimpan
+        self.cache_dir = cache_dir
+        cacheable = seed is not None or RNG.fixed
+        self._cache_path = os.path.join(cache_dir, self.cache_key()) if cache_dir and cacheable else None
+        self._cache_ready = False
+    
+    @classmethod
+    def generator_hash(cls) -> str:
+        """Hash kode generator; berubah otomatis jika cara menggambar tile berubah"""
+        if cls._generator_hash is None:
+            digest = hashlib.sha1(str(TILEMAP_CACHE_VERSION).encode())
+            members = (cls._record_level1, cls._record_level2, cls._record_level3,
+                       cls._paint_level1_tile, cls._paint_level2_tile, cls._paint_level3_tile,
+                       cls._build_chunk, _TileDrawer)
+            for member in members:
+                try:
+                    digest.update(inspect.getsource(member).encode())
+                except (OSError, TypeError):
+                    digest.update(member.__qualname__.encode())
+            cls._generator_hash = digest.hexdigest()[:12]
+        return cls._generator_hash
+    
+    def cache_key(self) -> str:
+        return (f"L{self.level.value}_{self.width}x{self.height}_s{self.seed}"
+                f"_c{self.chunk_size}_{self.generator_hash()}")
     
     def _generate_tilemap(self) -> None:
         if self.level == Level.LEVEL_2:
-            self._generate_level2()
+            self._record_level2()
+        elif self.level == Level.LEVEL_3:
+            self._record_level3()
+        else:
+            self._record_level1()
+    
+    def _paint_tile(self, layer, x: int, y: int, rng: random.Random) -> None:
+        if self.level == Level.LEVEL_2:
+            self._paint_level2_tile(layer, x, y, rng)
         elif self.level == Level.LEVEL_3:
-            self._generate_level3()
+            self._paint_level3_tile(layer, x, y, rng)
         else:
-            self._generate_level1()
+            self._paint_level1_tile(layer, x, y)
     
-    def _generate_level1(self) -> None:
+    def _paint_level1_tile(self, layer, x: int, y: int) -> None:
         """Enhanced Spirit Forest tiles"""
-        # Create tile variations
-        grass_colors = [
-            (140, 180, 140),    # Light green
-            (130, 170, 130),    # Medium green
-            (120, 160, 120),    # Dark green
-            (150, 190, 150),    # Bright green
-        ]
-        
+        # Checkerboard pattern with noise
+        noise = (x * 73 + y * 97) % 20
+        base_idx = ((x + y) % 2 + (noise > 15)) % len(self.GRASS_COLORS)
+        color = self.GRASS_COLORS[base_idx]
+        
+        # Add subtle texture
+        rect = pygame.Rect(x * self.tile_size, y * self.tile_size, 
+                         self.tile_size, self.tile_size)
+        tile_drawer.rect(layer, color, rect)
+        
+        # Texture dots
+        if noise < 3:
+            dot_size = 2
+            dot_x = x * self.tile_size + self.tile_size // 4
+            dot_y = y * self.tile_size + self.tile_size // 4
+            tile_drawer.circle(layer, 
+                             (color[0] - 20, color[1] - 20, color[2] - 20),
+                             (dot_x, dot_y), dot_size)
+        
+        if noise > 17:
+            dot_size = 1
+            dot_x = x * self.tile_size + 3 * self.tile_size // 4
+            dot_y = y * self.tile_size + 3 * self.tile_size // 4
+            tile_drawer.circle(layer, 
+                             (color[0] + 20, color[1] + 20, color[2] + 20),
+                             (dot_x, dot_y), dot_size)
+    
+    def _paint_level2_tile(self, layer, x: int, y: int, rng: random.Random) -> None:
+        """Enhanced Crimson Mountain tiles"""
+        # Volcanic terrain dengan noise
+        noise = (x * 67 + y * 89) % 30
+        base_idx = ((x // 2 + y // 2) % 2 + (noise > 20)) % len(self.ROCK_COLORS)
+        color = self.ROCK_COLORS[base_idx]
+        
+        rect = pygame.Rect(x * self.tile_size, y * self.tile_size, 
+                         self.tile_size, self.tile_size)
+        tile_drawer.rect(layer, color, rect)
+        
+        # Crack textures
+        if noise < 5:
+            crack_color = (color[0] - 30, color[1] - 30, color[2] - 30)
+            start_x = x * self.tile_size + rng.randint(2, self.tile_size - 2)
+            start_y = y * self.tile_size + rng.randint(2, self.tile_size - 2)
+            end_x = start_x + rng.randint(-8, 8)
+            end_y = start_y + rng.randint(-8, 8)
+            tile_drawer.line(layer, crack_color,
+                           (start_x, start_y), (end_x, end_y), 1)
+        
+        # Lava patches
+        if noise > 25:
+            patch_size = rng.randint(4, 8)
+            patch_x = x * self.tile_size + rng.randint(4, self.tile_size - patch_size - 4)
+            patch_y = y * self.tile_size + rng.randint(4, self.tile_size - patch_size - 4)
+            patch_color = rng.choice(self.LAVA_COLORS)
+            
+            # Lava glow
+            glow_surf = new_surface((patch_size + 4, patch_size + 4), pygame.SRCALPHA)
+            pygame.draw.circle(glow_surf, (*patch_color, 80),
+                             (patch_size//2 + 2, patch_size//2 + 2), patch_size//2 + 2)
+            layer.blit(glow_surf, (patch_x - 2, patch_y - 2))
+            
+            # Lava core
+            tile_drawer.circle(layer, patch_color,
+                             (patch_x + patch_size//2, patch_y + patch_size//2),
+                             patch_size//2)
+    
+    def _paint_level3_tile(self, layer, x: int, y: int, rng: random.Random) -> None:
+        """Enhanced Castle tiles"""
+        # Marble floor dengan veins
+        noise = (x * 71 + y * 113) % 25
+        base_idx = ((x // 3 + y // 3) % 2 + (noise > 18)) % len(self.MARBLE_COLORS)
+        color = self.MARBLE_COLORS[base_idx]
+        
+        rect = pygame.Rect(x * self.tile_size, y * self.tile_size, 
+                         self.tile_size, self.tile_size)
+        tile_drawer.rect(layer, color, rect)
+        
+        # Marble veins
+        if noise < 8:
+            vein_color = (color[0] + 20, color[1] + 20, color[2] + 20)
+            vein_width = rng.randint(1, 2)
+            
+            # Vertical vein
+            if noise % 2 == 0:
+                vein_x = x * self.tile_size + self.tile_size // 2
+                start_y = y * self.tile_size + rng.randint(2, self.tile_size // 3)
+                end_y = start_y + rng.randint(self.tile_size // 2, self.tile_size - 4)
+                tile_drawer.line(layer, vein_color,
+                               (vein_x, start_y), (vein_x, end_y), vein_width)
+            
+            # Horizontal vein
+            else:
+                vein_y = y * self.tile_size + self.tile_size // 2
+                start_x = x * self.tile_size + rng.randint(2, self.tile_size // 3)
+                end_x = start_x + rng.randint(self.tile_size // 2, self.tile_size - 4)
+                tile_drawer.line(layer, vein_color,
+                               (start_x, vein_y), (end_x, vein_y), vein_width)
+        
+        # Gold inlays
+        if noise > 22:
+            inlay_size = rng.randint(4, 8)
+            inlay_x = x * self.tile_size + rng.randint(4, self.tile_size - inlay_size - 4)
+            inlay_y = y * self.tile_size + rng.randint(4, self.tile_size - inlay_size - 4)
+            
+            # Gold glow
+            glow_surf = new_surface((inlay_size + 6, inlay_size + 6), pygame.SRCALPHA)
+            pygame.draw.circle(glow_surf, (*self.GOLD_COLOR, 60),
+                             (inlay_size//2 + 3, inlay_size//2 + 3), inlay_size//2 + 3)
+            layer.blit(glow_surf, (inlay_x - 3, inlay_y - 3))
+            
+            # Gold circle
+            tile_drawer.circle(layer, self.GOLD_COLOR,
+                             (inlay_x + inlay_size//2, inlay_y + inlay_size//2),
+                             inlay_size//2)
+    
+    def _record_level1(self) -> None:
+        """Enhanced Spirit Forest objects"""
         flower_colors = [
             (255, 200, 200),    # Pink
             (200, 220, 255),    # Blue
@@ -2453,79 +4892,50 @@ class TileMap:
             (220, 200, 255),    # Purple
         ]
         
-        for y in range(self.tiles_y):
-            for x in range(self.tiles_x):
-                # Checkerboard pattern with noise
-                noise = (x * 73 + y * 97) % 20
-                base_idx = ((x + y) % 2 + (noise > 15)) % len(grass_colors)
-                color = grass_colors[base_idx]
-                
-                # Add subtle texture
-                rect = pygame.Rect(x * self.tile_size, y * self.tile_size, 
-                                 self.tile_size, self.tile_size)
-                pygame.draw.rect(self.base_layer, color, rect)
-                
-                # Texture dots
-                if noise < 3:
-                    dot_size = 2
-                    dot_x = x * self.tile_size + self.tile_size // 4
-                    dot_y = y * self.tile_size + self.tile_size // 4
-                    pygame.draw.circle(self.base_layer, 
-                                     (color[0] - 20, color[1] - 20, color[2] - 20),
-                                     (dot_x, dot_y), dot_size)
-                
-                if noise > 17:
-                    dot_size = 1
-                    dot_x = x * self.tile_size + 3 * self.tile_size // 4
-                    dot_y = y * self.tile_size + 3 * self.tile_size // 4
-                    pygame.draw.circle(self.base_layer, 
-                                     (color[0] + 20, color[1] + 20, color[2] + 20),
-                                     (dot_x, dot_y), dot_size)
-        
         # Enhanced objects
         for _ in range(25):
-            x = random.randint(0, self.width - 60)
-            y = random.randint(0, self.height - 60)
+            x = self._rng.randint(0, self.width - 60)
+            y = self._rng.randint(0, self.height - 60)
             
             # Fallen logs dengan texture
-            log_length = random.randint(30, 50)
-            log_width = random.randint(12, 18)
+            log_length = self._rng.randint(30, 50)
+            log_width = self._rng.randint(12, 18)
             
             # Log shadow
-            pygame.draw.ellipse(self.objects_below_layer, (80, 60, 40, 150),
+            tile_drawer.ellipse(self.objects_below_layer, (80, 60, 40, 150),
                               (x + 4, y + 24, log_length, log_width))
             
             # Log main
-            pygame.draw.ellipse(self.objects_below_layer, (100, 80, 60),
+            tile_drawer.ellipse(self.objects_below_layer, (100, 80, 60),
                               (x, y + 20, log_length, log_width))
             
             # Log texture lines
             for i in range(3):
                 line_y = y + 20 + log_width // 2 + (i - 1) * 3
-                pygame.draw.line(self.objects_below_layer, (80, 60, 40),
+                tile_drawer.line(self.objects_below_layer, (80, 60, 40),
                                (x + 5, line_y), (x + log_length - 5, line_y), 1)
         
         # Flowers and plants
         for _ in range(40):
-            x = random.randint(0, self.width - 40)
-            y = random.randint(0, self.height - 40)
-            flower_type = random.choice(["small", "medium", "large"])
-            flower_color = random.choice(flower_colors)
+            x = self._rng.randint(0, self.width - 40)
+            y = self._rng.randint(0, self.height - 40)
+            flower_type = self._rng.choice(["small", "medium", "large"])
+            flower_color = self._rng.choice(flower_colors)
             
             if flower_type == "small":
                 # Small flower cluster
                 for _ in range(3):
-                    fx = x + random.randint(0, 20)
-                    fy = y + random.randint(0, 20)
-                    pygame.draw.circle(self.objects_above_layer, (*flower_color, 180),
+                    fx = x + self._rng.randint(0, 20)
+                    fy = y + self._rng.randint(0, 20)
+                    tile_drawer.circle(self.objects_above_layer, (*flower_color, 180),
                                      (fx, fy), 4)
-                    pygame.draw.circle(self.objects_above_layer, (255, 255, 255, 100),
+                    tile_drawer.circle(self.objects_above_layer, (255, 255, 255, 100),
                                      (fx, fy), 2)
             elif flower_type == "medium":
                 # Medium flower dengan leaves
-                pygame.draw.circle(self.objects_above_layer, (*flower_color, 200),
+                tile_drawer.circle(self.objects_above_layer, (*flower_color, 200),
                                  (x + 10, y + 10), 8)
-                pygame.draw.circle(self.objects_above_layer, (255, 255, 255, 150),
+                tile_drawer.circle(self.objects_above_layer, (255, 255, 255, 150),
                                  (x + 10, y + 10), 4)
                 
                 # Leaves
@@ -2535,11 +4945,11 @@ class TileMap:
                     (x + 10, y + 5),
                     (x + 15, y + 15)
                 ]
-                pygame.draw.polygon(self.objects_above_layer, leaf_color, leaf_points)
+                tile_drawer.polygon(self.objects_above_layer, leaf_color, leaf_points)
             else:
                 # Large flower dengan stem
                 stem_color = (80, 140, 80, 200)
-                pygame.draw.line(self.objects_above_layer, stem_color,
+                tile_drawer.line(self.objects_above_layer, stem_color,
                                (x + 10, y + 25), (x + 10, y + 10), 3)
                 
                 # Flower petals
@@ -2551,101 +4961,47 @@ class TileMap:
                     angle = i * 120 * math.pi / 180
                     px = x + 10 + math.cos(angle) * 10
                     py = y + 10 + math.sin(angle) * 10
-                    pygame.draw.circle(self.objects_above_layer, pcolor, (int(px), int(py)), 6)
+                    tile_drawer.circle(self.objects_above_layer, pcolor, (int(px), int(py)), 6)
                 
                 # Center
-                pygame.draw.circle(self.objects_above_layer, (255, 240, 200, 220),
+                tile_drawer.circle(self.objects_above_layer, (255, 240, 200, 220),
                                  (x + 10, y + 10), 4)
     
-    def _generate_level2(self) -> None:
-        """Enhanced Crimson Mountain tiles"""
-        # Base terrain colors
-        rock_colors = [
-            (130, 90, 70),    # Light brown
-            (110, 75, 55),    # Medium brown
-            (90, 60, 40),     # Dark brown
-            (120, 85, 65),    # Reddish brown
-        ]
-        
-        lava_colors = [
-            (255, 100, 50),   # Bright orange
-            (255, 80, 40),    # Medium orange
-            (255, 60, 30),    # Dark orange
-            (220, 120, 60),   # Yellow-orange
-        ]
-        
-        for y in range(self.tiles_y):
-            for x in range(self.tiles_x):
-                # Volcanic terrain dengan noise
-                noise = (x * 67 + y * 89) % 30
-                base_idx = ((x // 2 + y // 2) % 2 + (noise > 20)) % len(rock_colors)
-                color = rock_colors[base_idx]
-                
-                rect = pygame.Rect(x * self.tile_size, y * self.tile_size, 
-                                 self.tile_size, self.tile_size)
-                pygame.draw.rect(self.base_layer, color, rect)
-                
-                # Crack textures
-                if noise < 5:
-                    crack_color = (color[0] - 30, color[1] - 30, color[2] - 30)
-                    start_x = x * self.tile_size + random.randint(2, self.tile_size - 2)
-                    start_y = y * self.tile_size + random.randint(2, self.tile_size - 2)
-                    end_x = start_x + random.randint(-8, 8)
-                    end_y = start_y + random.randint(-8, 8)
-                    pygame.draw.line(self.base_layer, crack_color,
-                                   (start_x, start_y), (end_x, end_y), 1)
-                
-                # Lava patches
-                if noise > 25:
-                    patch_size = random.randint(4, 8)
-                    patch_x = x * self.tile_size + random.randint(4, self.tile_size - patch_size - 4)
-                    patch_y = y * self.tile_size + random.randint(4, self.tile_size - patch_size - 4)
-                    patch_color = random.choice(lava_colors)
-                    
-                    # Lava glow
-                    glow_surf = pygame.Surface((patch_size + 4, patch_size + 4), pygame.SRCALPHA)
-                    pygame.draw.circle(glow_surf, (*patch_color, 80),
-                                     (patch_size//2 + 2, patch_size//2 + 2), patch_size//2 + 2)
-                    self.base_layer.blit(glow_surf, (patch_x - 2, patch_y - 2))
-                    
-                    # Lava core
-                    pygame.draw.circle(self.base_layer, patch_color,
-                                     (patch_x + patch_size//2, patch_y + patch_size//2),
-                                     patch_size//2)
-        
+    def _record_level2(self) -> None:
+        """Enhanced Crimson Mountain objects"""
         # Burnt trees
         for _ in range(20):
-            x = random.randint(0, self.width - 80)
-            y = random.randint(0, self.height - 100)
+            x = self._rng.randint(0, self.width - 80)
+            y = self._rng.randint(0, self.height - 100)
             
             # Tree trunk dengan char effect
-            trunk_width = random.randint(14, 22)
-            trunk_height = random.randint(30, 50)
+            trunk_width = self._rng.randint(14, 22)
+            trunk_height = self._rng.randint(30, 50)
             trunk_x = x + (60 - trunk_width) // 2
             trunk_y = y + 30
             
             # Trunk shadow
-            pygame.draw.rect(self.objects_below_layer, (60, 40, 30, 150),
+            tile_drawer.rect(self.objects_below_layer, (60, 40, 30, 150),
                            (trunk_x + 3, trunk_y + 3, trunk_width, trunk_height),
                            border_radius=4)
             
             # Trunk main
             trunk_color = COLOR_BURNT_BROWN
-            pygame.draw.rect(self.objects_below_layer, trunk_color,
+            tile_drawer.rect(self.objects_below_layer, trunk_color,
                            (trunk_x, trunk_y, trunk_width, trunk_height),
                            border_radius=4)
             
             # Char marks
-            for _ in range(random.randint(2, 5)):
-                mark_x = trunk_x + random.randint(2, trunk_width - 2)
-                mark_y = trunk_y + random.randint(5, trunk_height - 5)
-                mark_width = random.randint(2, 4)
-                pygame.draw.line(self.objects_below_layer, (40, 25, 15),
+            for _ in range(self._rng.randint(2, 5)):
+                mark_x = trunk_x + self._rng.randint(2, trunk_width - 2)
+                mark_y = trunk_y + self._rng.randint(5, trunk_height - 5)
+                mark_width = self._rng.randint(2, 4)
+                tile_drawer.line(self.objects_below_layer, (40, 25, 15),
                                (mark_x, mark_y), (mark_x + mark_width, mark_y), 2)
             
             # Dead canopy
-            if random.random() < 0.8:
-                canopy_radius = random.randint(18, 28)
+            if self._rng.random() < 0.8:
+                canopy_radius = self._rng.randint(18, 28)
                 canopy_x = x + 30
                 canopy_y = y + 20
                 
@@ -2653,24 +5009,24 @@ class TileMap:
                 canopy_colors = [(50, 35, 25, 180), (60, 40, 30, 150), (70, 45, 35, 120)]
                 for i, ccolor in enumerate(canopy_colors):
                     layer_radius = canopy_radius - i * 4
-                    pygame.draw.circle(self.objects_below_layer, ccolor,
+                    tile_drawer.circle(self.objects_below_layer, ccolor,
                                      (canopy_x, canopy_y), layer_radius)
         
         # Volcanic rocks
         for _ in range(15):
-            x = random.randint(0, self.width - 80)
-            y = random.randint(0, self.height - 60)
-            rock_size = random.randint(25, 45)
+            x = self._rng.randint(0, self.width - 80)
+            y = self._rng.randint(0, self.height - 60)
+            rock_size = self._rng.randint(25, 45)
             
             # Rock shadow
-            shadow_surf = pygame.Surface((rock_size + 6, rock_size + 6), pygame.SRCALPHA)
+            shadow_surf = new_surface((rock_size + 6, rock_size + 6), pygame.SRCALPHA)
             pygame.draw.ellipse(shadow_surf, (0, 0, 0, 100),
                               (3, 3, rock_size, rock_size))
             self.objects_below_layer.blit(shadow_surf, (x - 3, y - 3))
             
             # Rock main
             rock_color = (90, 70, 60)
-            pygame.draw.ellipse(self.objects_above_layer, rock_color,
+            tile_drawer.ellipse(self.objects_above_layer, rock_color,
                               (x, y, rock_size, rock_size))
             
             # Rock highlights
@@ -2678,79 +5034,20 @@ class TileMap:
             highlight_size = rock_size // 2
             highlight_x = x + rock_size // 4
             highlight_y = y + rock_size // 4
-            pygame.draw.ellipse(self.objects_above_layer, highlight_color,
+            tile_drawer.ellipse(self.objects_above_layer, highlight_color,
                               (highlight_x, highlight_y, highlight_size, highlight_size))
             
             # Rock cracks
-            for _ in range(random.randint(2, 4)):
-                crack_start = (x + random.randint(5, rock_size - 5),
-                             y + random.randint(5, rock_size - 5))
-                crack_end = (crack_start[0] + random.randint(-10, 10),
-                           crack_start[1] + random.randint(-10, 10))
-                pygame.draw.line(self.objects_above_layer, (60, 45, 35),
+            for _ in range(self._rng.randint(2, 4)):
+                crack_start = (x + self._rng.randint(5, rock_size - 5),
+                             y + self._rng.randint(5, rock_size - 5))
+                crack_end = (crack_start[0] + self._rng.randint(-10, 10),
+                           crack_start[1] + self._rng.randint(-10, 10))
+                tile_drawer.line(self.objects_above_layer, (60, 45, 35),
                                crack_start, crack_end, 1)
     
-    def _generate_level3(self) -> None:
-        """Enhanced Castle tiles"""
-        # Marble floor colors
-        marble_colors = [
-            (160, 160, 170),  # Light gray
-            (150, 150, 160),  # Medium gray
-            (140, 140, 150),  # Dark gray
-            (170, 170, 180),  # Blue-gray
-        ]
-        
-        gold_color = (210, 180, 80)
-        
-        for y in range(self.tiles_y):
-            for x in range(self.tiles_x):
-                # Marble floor dengan veins
-                noise = (x * 71 + y * 113) % 25
-                base_idx = ((x // 3 + y // 3) % 2 + (noise > 18)) % len(marble_colors)
-                color = marble_colors[base_idx]
-                
-                rect = pygame.Rect(x * self.tile_size, y * self.tile_size, 
-                                 self.tile_size, self.tile_size)
-                pygame.draw.rect(self.base_layer, color, rect)
-                
-                # Marble veins
-                if noise < 8:
-                    vein_color = (color[0] + 20, color[1] + 20, color[2] + 20)
-                    vein_width = random.randint(1, 2)
-                    
-                    # Vertical vein
-                    if noise % 2 == 0:
-                        vein_x = x * self.tile_size + self.tile_size // 2
-                        start_y = y * self.tile_size + random.randint(2, self.tile_size // 3)
-                        end_y = start_y + random.randint(self.tile_size // 2, self.tile_size - 4)
-                        pygame.draw.line(self.base_layer, vein_color,
-                                       (vein_x, start_y), (vein_x, end_y), vein_width)
-                    
-                    # Horizontal vein
-                    else:
-                        vein_y = y * self.tile_size + self.tile_size // 2
-                        start_x = x * self.tile_size + random.randint(2, self.tile_size // 3)
-                        end_x = start_x + random.randint(self.tile_size // 2, self.tile_size - 4)
-                        pygame.draw.line(self.base_layer, vein_color,
-                                       (start_x, vein_y), (end_x, vein_y), vein_width)
-                
-                # Gold inlays
-                if noise > 22:
-                    inlay_size = random.randint(4, 8)
-                    inlay_x = x * self.tile_size + random.randint(4, self.tile_size - inlay_size - 4)
-                    inlay_y = y * self.tile_size + random.randint(4, self.tile_size - inlay_size - 4)
-                    
-                    # Gold glow
-                    glow_surf = pygame.Surface((inlay_size + 6, inlay_size + 6), pygame.SRCALPHA)
-                    pygame.draw.circle(glow_surf, (*gold_color, 60),
-                                     (inlay_size//2 + 3, inlay_size//2 + 3), inlay_size//2 + 3)
-                    self.base_layer.blit(glow_surf, (inlay_x - 3, inlay_y - 3))
-                    
-                    # Gold circle
-                    pygame.draw.circle(self.base_layer, gold_color,
-                                     (inlay_x + inlay_size//2, inlay_y + inlay_size//2),
-                                     inlay_size//2)
-        
+    def _record_level3(self) -> None:
+        """Enhanced Castle objects"""
         # Castle structure
         castle_w = min(800, self.width - 200)
         castle_h = min(480, self.height - 200)
@@ -2764,36 +5061,36 @@ class TileMap:
         
         # Main wall body
         wall_rect = pygame.Rect(castle_x, castle_y, castle_w, castle_h)
-        pygame.draw.rect(self.objects_below_layer, wall_color, wall_rect)
+        tile_drawer.rect(self.objects_below_layer, wall_color, wall_rect)
         
         # Wall shading
-        pygame.draw.rect(self.objects_below_layer, wall_shade, wall_rect, 6)
+        tile_drawer.rect(self.objects_below_layer, wall_shade, wall_rect, 6)
         
         # Wall highlights
         highlight_rect = pygame.Rect(castle_x + 4, castle_y + 4, 
                                    castle_w - 8, castle_h - 8)
-        pygame.draw.rect(self.objects_below_layer, wall_highlight, 
+        tile_drawer.rect(self.objects_below_layer, wall_highlight, 
                         highlight_rect, 2)
         
         # Battlements
         battlement_w = 26
         for bx in range(castle_x, castle_x + castle_w, battlement_w * 2):
             # Battlement shadow
-            pygame.draw.rect(self.objects_above_layer, (0, 0, 0, 100),
+            tile_drawer.rect(self.objects_above_layer, (0, 0, 0, 100),
                            (bx + 2, castle_y - 12 + 2, battlement_w, 12))
             
             # Battlement main
             battlement_rect = pygame.Rect(bx, castle_y - 12, battlement_w, 12)
-            pygame.draw.rect(self.objects_above_layer, wall_shade, battlement_rect)
+            tile_drawer.rect(self.objects_above_layer, wall_shade, battlement_rect)
             
             # Battlement highlight
-            pygame.draw.rect(self.objects_above_layer, (180, 180, 190),
+            tile_drawer.rect(self.objects_above_layer, (180, 180, 190),
                            (bx + 2, castle_y - 10, battlement_w - 4, 8))
             
             # Arrow slit
             slit_color = (60, 60, 70)
             slit_x = bx + battlement_w // 2
-            pygame.draw.rect(self.objects_above_layer, slit_color,
+            tile_drawer.rect(self.objects_above_layer, slit_color,
                            (slit_x - 2, castle_y - 8, 4, 6))
         
         # Enhanced towers
@@ -2807,17 +5104,17 @@ class TileMap:
         
         for tx, ty in towers:
             # Tower shadow
-            shadow_surf = pygame.Surface((tower_radius * 2 + 6, tower_radius * 2 + 6), pygame.SRCALPHA)
+            shadow_surf = new_surface((tower_radius * 2 + 6, tower_radius * 2 + 6), pygame.SRCALPHA)
             pygame.draw.ellipse(shadow_surf, (0, 0, 0, 120),
                               (3, 3, tower_radius * 2, tower_radius * 2))
             self.objects_below_layer.blit(shadow_surf, (tx - 3, ty - 3))
             
             # Tower main
-            pygame.draw.ellipse(self.objects_below_layer, wall_color, 
+            tile_drawer.ellipse(self.objects_below_layer, wall_color, 
                               (tx, ty, tower_radius * 2, tower_radius * 2))
             
             # Tower shading
-            pygame.draw.ellipse(self.objects_below_layer, wall_shade,
+            tile_drawer.ellipse(self.objects_below_layer, wall_shade,
                               (tx, ty, tower_radius * 2, tower_radius * 2), 4)
             
             # Tower battlements
@@ -2826,15 +5123,15 @@ class TileMap:
                 batt_w = tower_radius * 2 // 7
                 
                 # Battlement shadow
-                pygame.draw.rect(self.objects_above_layer, (0, 0, 0, 100),
+                tile_drawer.rect(self.objects_above_layer, (0, 0, 0, 100),
                                (rx + 1, ty - 14 + 1, batt_w, 14))
                 
                 # Battlement
-                pygame.draw.rect(self.objects_above_layer, wall_shade,
+                tile_drawer.rect(self.objects_above_layer, wall_shade,
                                (rx, ty - 14, batt_w, 14))
                 
                 # Battlement highlight
-                pygame.draw.rect(self.objects_above_layer, (180, 180, 190),
+                tile_drawer.rect(self.objects_above_layer, (180, 180, 190),
                                (rx + 2, ty - 12, batt_w - 4, 10))
             
             # Flag pole
@@ -2843,15 +5140,15 @@ class TileMap:
             pole_color = (80, 60, 40)
             
             # Pole shadow
-            pygame.draw.line(self.objects_above_layer, (0, 0, 0, 100),
+            tile_drawer.line(self.objects_above_layer, (0, 0, 0, 100),
                            (pole_x + 1, pole_y + 1), (pole_x + 1, pole_y - 32 + 1), 4)
             
             # Pole main
-            pygame.draw.line(self.objects_above_layer, pole_color,
+            tile_drawer.line(self.objects_above_layer, pole_color,
                            (pole_x, pole_y), (pole_x, pole_y - 32), 4)
             
             # Flag dengan animasi
-            flag_wave = math.sin(pygame.time.get_ticks() * 0.001) * 2
+            flag_wave = math.sin(game_ticks() * 0.001) * 2
             flag_points = [
                 (pole_x, pole_y - 30),
                 (pole_x + 20 + flag_wave, pole_y - 26),
@@ -2860,13 +5157,13 @@ class TileMap:
             
             # Flag shadow
             shadow_points = [(p[0] + 1, p[1] + 1) for p in flag_points]
-            pygame.draw.polygon(self.objects_above_layer, (0, 0, 0, 100), shadow_points)
+            tile_drawer.polygon(self.objects_above_layer, (0, 0, 0, 100), shadow_points)
             
             # Flag main
-            pygame.draw.polygon(self.objects_above_layer, (200, 40, 40), flag_points)
+            tile_drawer.polygon(self.objects_above_layer, (200, 40, 40), flag_points)
             
             # Flag detail
-            pygame.draw.line(self.objects_above_layer, (240, 240, 240),
+            tile_drawer.line(self.objects_above_layer, (240, 240, 240),
                            (pole_x + 4, pole_y - 28), (pole_x + 16, pole_y - 26), 1)
         
         # Enhanced entrance
@@ -2876,13 +5173,13 @@ class TileMap:
         ent_y = castle_y + castle_h - entrance_h
         
         # Entrance arch shadow
-        arch_shadow = pygame.Surface((entrance_w + 6, entrance_h + 6), pygame.SRCALPHA)
+        arch_shadow = new_surface((entrance_w + 6, entrance_h + 6), pygame.SRCALPHA)
         pygame.draw.arc(arch_shadow, (0, 0, 0, 150),
                        (3, 3, entrance_w, entrance_h), math.pi, 2*math.pi, 10)
         self.objects_above_layer.blit(arch_shadow, (ent_x - 3, ent_y - 3))
         
         # Entrance arch
-        pygame.draw.arc(self.objects_above_layer, (100, 100, 110),
+        tile_drawer.arc(self.objects_above_layer, (100, 100, 110),
                        (ent_x, ent_y, entrance_w, entrance_h), math.pi, 2*math.pi, 8)
         
         # Entrance door
@@ -2890,23 +5187,23 @@ class TileMap:
                                entrance_w - 50, entrance_h//2)
         
         # Door shadow
-        pygame.draw.rect(self.objects_below_layer, (20, 20, 20, 200), door_rect)
+        tile_drawer.rect(self.objects_below_layer, (20, 20, 20, 200), door_rect)
         
         # Door main
         door_color = (80, 60, 40)
-        pygame.draw.rect(self.objects_below_layer, door_color, door_rect)
+        tile_drawer.rect(self.objects_below_layer, door_color, door_rect)
         
         # Door details
         door_knob_x = ent_x + entrance_w - 40
         door_knob_y = ent_y + entrance_h - 60
-        pygame.draw.circle(self.objects_below_layer, (180, 160, 100),
+        tile_drawer.circle(self.objects_below_layer, (180, 160, 100),
                          (door_knob_x, door_knob_y), 6)
         
         # Door panels
         for i in range(2):
             panel_x = ent_x + 40 + i * 50
             panel_rect = pygame.Rect(panel_x, ent_y + entrance_h - 80, 40, 60)
-            pygame.draw.rect(self.objects_below_layer, 
+            tile_drawer.rect(self.objects_below_layer, 
                            (door_color[0] - 20, door_color[1] - 20, door_color[2] - 20),
                            panel_rect, 2)
         
@@ -2923,11 +5220,11 @@ class TileMap:
             for wx in range(castle_x + 40, castle_x + castle_w - 40, 130):
                 if wx + win_w < castle_x + castle_w:
                     # Window frame shadow
-                    pygame.draw.rect(self.objects_above_layer, (0, 0, 0, 150),
+                    tile_drawer.rect(self.objects_above_layer, (0, 0, 0, 150),
                                    (wx + 2, wy + 2, win_w, win_h))
                     
                     # Window frame
-                    pygame.draw.rect(self.objects_above_layer, (60, 50, 40),
+                    tile_drawer.rect(self.objects_above_layer, (60, 50, 40),
                                    (wx, wy, win_w, win_h))
                     
                     # Stained glass
@@ -2944,14 +5241,14 @@ class TileMap:
                         for sx in range(2):
                             seg_x = glass_x + sx * segment_w
                             seg_y = glass_y + sy * segment_h
-                            seg_color = random.choice(stained_colors)
+                            seg_color = self._rng.choice(stained_colors)
                             
                             # Glass segment
-                            seg_surf = pygame.Surface((segment_w, segment_h), pygame.SRCALPHA)
+                            seg_surf = new_surface((segment_w, segment_h), pygame.SRCALPHA)
                             seg_surf.fill(seg_color)
                             
                             # Glass highlight
-                            highlight = pygame.Surface((segment_w, segment_h), pygame.SRCALPHA)
+                            highlight = new_surface((segment_w, segment_h), pygame.SRCALPHA)
                             pygame.draw.rect(highlight, (255, 255, 255, 60),
                                            (0, 0, segment_w, segment_h), 1)
                             pygame.draw.line(highlight, (255, 255, 255, 40),
@@ -2964,12 +5261,12 @@ class TileMap:
                     
                     # Window arch
                     arch_rect = pygame.Rect(wx, wy - 8, win_w, win_h // 2)
-                    pygame.draw.arc(self.objects_above_layer, (80, 70, 50),
+                    tile_drawer.arc(self.objects_above_layer, (80, 70, 50),
                                    arch_rect, math.pi, 2*math.pi, 4)
                     
                     # Window arch highlight
                     highlight_rect = pygame.Rect(wx + 2, wy - 6, win_w - 4, win_h // 2 - 4)
-                    pygame.draw.arc(self.objects_above_layer, (180, 160, 140),
+                    tile_drawer.arc(self.objects_above_layer, (180, 160, 140),
                                    highlight_rect, math.pi, 2*math.pi, 2)
         
         # Pathway dengan cobblestones
@@ -2987,18 +5284,18 @@ class TileMap:
             # Row of stones
             for j in range(path_w // 12):
                 stone_x = path_x + j * 12 + (i % 2) * 6
-                stone_color = random.choice(stone_colors)
+                stone_color = self._rng.choice(stone_colors)
                 
                 # Stone shadow
-                pygame.draw.circle(self.objects_below_layer, (0, 0, 0, 100),
+                tile_drawer.circle(self.objects_below_layer, (0, 0, 0, 100),
                                  (stone_x + 6, stone_y + 2), 4)
                 
                 # Stone
-                pygame.draw.circle(self.objects_below_layer, stone_color,
+                tile_drawer.circle(self.objects_below_layer, stone_color,
                                  (stone_x + 5, stone_y), 4)
                 
                 # Stone highlight
-                pygame.draw.circle(self.objects_below_layer, 
+                tile_drawer.circle(self.objects_below_layer, 
                                  (stone_color[0] + 20, stone_color[1] + 20, stone_color[2] + 20),
                                  (stone_x + 5, stone_y - 1), 2)
         
@@ -3010,11 +5307,11 @@ class TileMap:
             ty = ent_y + oy
             
             # Torch pole shadow
-            pygame.draw.rect(self.objects_above_layer, (0, 0, 0, 150),
+            tile_drawer.rect(self.objects_above_layer, (0, 0, 0, 150),
                            (tx + 1, ty + 1, 8, 28))
             
             # Torch pole
-            pole_gradient = pygame.Surface((8, 28), pygame.SRCALPHA)
+            pole_gradient = new_surface((8, 28), pygame.SRCALPHA)
             for py in range(28):
                 alpha = 255 - py * 8
                 pygame.draw.line(pole_gradient, (100, 80, 60, alpha),
@@ -3023,7 +5320,7 @@ class TileMap:
             
             # Torch bracket
             bracket_y = ty - 4
-            pygame.draw.rect(self.objects_above_layer, (80, 60, 40),
+            tile_drawer.rect(self.objects_above_layer, (80, 60, 40),
                            (tx - 2, bracket_y, 12, 4))
             
             # Flame
@@ -3032,7 +5329,7 @@ class TileMap:
             flame_y = ty - 12
             
             # Flame glow
-            glow_surf = pygame.Surface((flame_size * 2, flame_size * 2), pygame.SRCALPHA)
+            glow_surf = new_surface((flame_size * 2, flame_size * 2), pygame.SRCALPHA)
             pygame.draw.circle(glow_surf, (255, 200, 100, 80),
                              (flame_size, flame_size), flame_size)
             self.objects_above_layer.blit(glow_surf, (flame_x - flame_size, flame_y - flame_size),
@@ -3045,7 +5342,7 @@ class TileMap:
                 (flame_x, flame_y + 12),
                 (flame_x - 6, flame_y)
             ]
-            pygame.draw.polygon(self.objects_above_layer, (255, 180, 60), flame_points)
+            tile_drawer.polygon(self.objects_above_layer, (255, 180, 60), flame_points)
             
             # Flame highlight
             highlight_points = [
@@ -3054,7 +5351,7 @@ class TileMap:
                 (flame_x, flame_y + 8),
                 (flame_x - 4, flame_y)
             ]
-            pygame.draw.polygon(self.objects_above_layer, (255, 220, 140), highlight_points)
+            tile_drawer.polygon(self.objects_above_layer, (255, 220, 140), highlight_points)
         
         # Enhanced altar
         altar_x = castle_x + castle_w//2 - 70
@@ -3062,13 +5359,13 @@ class TileMap:
         altar_size = 140
         
         # Altar shadow
-        altar_shadow = pygame.Surface((altar_size + 10, altar_size + 10), pygame.SRCALPHA)
+        altar_shadow = new_surface((altar_size + 10, altar_size + 10), pygame.SRCALPHA)
         pygame.draw.rect(altar_shadow, (0, 0, 0, 100),
                         (5, 5, altar_size, altar_size), border_radius=15)
         self.objects_below_layer.blit(altar_shadow, (altar_x - 5, altar_y - 5))
         
         # Altar base
-        altar_base = pygame.Surface((altar_size, altar_size), pygame.SRCALPHA)
+        altar_base = new_surface((altar_size, altar_size), pygame.SRCALPHA)
         
         # Altar gradient
         for y in range(altar_size):
@@ -3093,7 +5390,7 @@ class TileMap:
         center_y = altar_size // 2 - center_size // 2
         
         # Center glow
-        center_glow = pygame.Surface((center_size, center_size), pygame.SRCALPHA)
+        center_glow = new_surface((center_size, center_size), pygame.SRCALPHA)
         pygame.draw.circle(center_glow, (255, 240, 200, 100),
                          (center_size//2, center_size//2), center_size//2)
         altar_base.blit(center_glow, (center_x, center_y),
@@ -3120,14 +5417,245 @@ class TileMap:
                     castle_y + castle_h//2 - altar_size//2)
         return None
     
+    def _bucket_commands(self, recorder: _LayerRecorder) -> Dict[Tuple[int, int], List[tuple]]:
+        """Kelompokkan perintah rekaman ke setiap chunk yang disentuh bounding box-nya"""
+        size = self.chunk_size
+        buckets: Dict[Tuple[int, int], List[tuple]] = {}
+        for command in recorder.commands:
+            bounds = command[-1]
+            for cy in range(max(0, bounds.top // size), min(self.chunks_y - 1, (bounds.bottom - 1) // size) + 1):
+                for cx in range(max(0, bounds.left // size), min(self.chunks_x - 1, (bounds.right - 1) // size) + 1):
+                    buckets.setdefault((cx, cy), []).append(command)
+        return buckets
+    
+    def _tile_seed(self, x: int, y: int) -> int:
+        return (self.seed * 1000003 + x * 7919 + y * 104729) & 0x7FFFFFFF
+    
+    def _build_chunk(self, name: str, cx: int, cy: int) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Gambar satu chunk dari nol (deterministik untuk seed yang sama)"""
+        rect = pygame.Rect(cx * self.chunk_size, cy * self.chunk_size,
+                           self.chunk_size, self.chunk_size).clip(0, 0, self.width, self.height)
+        commands = self._chunk_commands[name].get((cx, cy), ())
+        if name != "base" and not commands:
+            return None
+        
+        # Digambar dengan padding: garis tebal yang jangkarnya tepat di luar
+        # chunk akan dibuang pygame sebelum ditebalkan kalau tidak ada padding
+        pad = self.CHUNK_PAD
+        flags = 0 if name == "base" else pygame.SRCALPHA
+        padded = new_surface((rect.width + pad * 2, rect.height + pad * 2), flags)
+        canvas = _ChunkCanvas(padded, (rect.x - pad, rect.y - pad))
+        
+        if name == "base":
+            # Tile tetangga ikut digambar karena retakan/glow bisa melewati batas tile
+            rng = random.Random()
+            ts = self.tile_size
+            for ty in range(max(0, rect.top // ts - 1), min(self.tiles_y, (rect.bottom - 1) // ts + 2)):
+                for tx in range(max(0, rect.left // ts - 1), min(self.tiles_x, (rect.right - 1) // ts + 2)):
+                    rng.seed(self._tile_seed(tx, ty))
+                    self._paint_tile(canvas, tx, ty, rng)
+        for command in commands:
+            tile_drawer.replay(command, canvas)
+        
+        surf = padded.subsurface((pad, pad, rect.width, rect.height))
+        if name == "base":
+            return surf.copy(), rect.topleft
+        
+        # Pangkas ke area yang benar-benar berisi
+        bounds = surf.get_bounding_rect()
+        if bounds.width == 0 or bounds.height == 0:
+            return None
+        return surf.subsurface(bounds).copy(), (rect.x + bounds.x, rect.y + bounds.y)
+    
+    def get_chunk(self, name: str, cx: int, cy: int) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Ambil chunk dari cache LRU, buat jika belum ada"""
+        if name != "base" and (cx, cy) not in self._chunk_commands[name]:
+            return None
+        key = (name, cx, cy)
+        chunk = self._chunks.get(key)
+        if chunk is not None or key in self._chunks:
+            self._chunks.move_to_end(key)
+            return chunk
+        
+        chunk = self._load_chunk(name, cx, cy)
+        if chunk is False:
+            chunk = self._build_chunk(name, cx, cy)
+            self._store_chunk(name, cx, cy, chunk)
+            self.stats["generated"] += 1
+        else:
+            self.stats["disk_hits"] += 1
+        self._chunks[key] = chunk
+        while len(self._chunks) > self.max_chunks:
+            self._chunks.popitem(last=False)
+            self.stats["evicted"] += 1
+        return chunk
+    
+    def _chunk_file(self, name: str, cx: int, cy: int) -> str:
+        return os.path.join(self._cache_path, f"{name}_{cx}_{cy}.chunk")
+    
+    def _load_chunk(self, name: str, cx: int, cy: int):
+        """Baca chunk dari cache disk; False jika tidak ada atau rusak"""
+        if self._cache_path is None:
+            return False
+        try:
+            with open(self._chunk_file(name, cx, cy), "rb") as f:
+                data = f.read()
+            magic, w, h, x, y = self.CHUNK_HEADER.unpack_from(data)
+            if magic != self.CHUNK_MAGIC:
+                return False
+            if w == 0 or h == 0:
+                return None
+            pixels = zlib.decompress(data[self.CHUNK_HEADER.size:])
+            loaded = pygame.image.frombytes(pixels, (w, h), "BGRA")
+        except (OSError, struct.error, zlib.error, ValueError):
+            return False
+        
+        if name == "base":
+            # Layer dasar tidak butuh alpha per pixel
+            surf = new_surface((w, h))
+            surf.blit(loaded, (0, 0))
+            loaded = surf
+        return loaded, (x, y)
+    
+    def _store_chunk(self, name: str, cx: int, cy: int,
+                     chunk: Optional[Tuple[pygame.Surface, Tuple[int, int]]]) -> None:
+        if self._cache_path is None:
+            return
+        if chunk is None:
+            data = self.CHUNK_HEADER.pack(self.CHUNK_MAGIC, 0, 0, 0, 0)
+        else:
+            surf, (x, y) = chunk
+            data = (self.CHUNK_HEADER.pack(self.CHUNK_MAGIC, surf.get_width(), surf.get_height(), x, y)
+                    + zlib.compress(pygame.image.tobytes(surf, "BGRA"), 1))
+        
+        path = self._chunk_file(name, cx, cy)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            if not self._cache_ready:
+                os.makedirs(self._cache_path, exist_ok=True)
+                self._prune_cache()
+                self._cache_ready = True
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            # Tulis atomik supaya proses lain tidak pernah membaca chunk setengah jadi
+            os.replace(tmp_path, path)
+            self.stats["disk_writes"] += 1
+        except OSError:
+            # Cache hanya optimasi; disk read-only/penuh tidak boleh menghentikan game
+            self._cache_path = None
+    
+    def _prune_cache(self) -> None:
+        """Simpan hanya beberapa map terbaru di direktori cache"""
+        try:
+            entries = [os.path.join(self.cache_dir, entry) for entry in os.listdir(self.cache_dir)]
+            entries = [entry for entry in entries if os.path.isdir(entry) and entry != self._cache_path]
+            entries.sort(key=os.path.getmtime, reverse=True)
+        except OSError:
+            return
+        for entry in entries[TILEMAP_CACHE_MAX_MAPS - 1:]:
+            shutil.rmtree(entry, ignore_errors=True)
+    
+    def _chunk_range(self, view: pygame.Rect) -> Tuple[range, range]:
+        size = self.chunk_size
+        return (range(max(0, view.left // size), min(self.chunks_x - 1, (view.right - 1) // size) + 1),
+                range(max(0, view.top // size), min(self.chunks_y - 1, (view.bottom - 1) // size) + 1))
+    
+    def prefetch(self, camera_offset: Tuple[int, int], view_size: Tuple[int, int],
+                 budget: int = TILEMAP_PREFETCH_BUDGET) -> int:
+        """Siapkan chunk di sekitar viewport sebelum kamera sampai ke sana"""
+        margin = self.chunk_size * TILEMAP_PREFETCH_MARGIN
+        view = pygame.Rect(camera_offset, view_size).inflate(margin * 2, margin * 2)
+        xs, ys = self._chunk_range(view)
+        built = 0
+        for cy in ys:
+            for cx in xs:
+                for name in self.LAYER_NAMES:
+                    if built >= budget:
+                        return built
+                    if (name, cx, cy) in self._chunks:
+                        continue
+                    if name != "base" and (cx, cy) not in self._chunk_commands[name]:
+                        continue
+                    self.get_chunk(name, cx, cy)
+                    built += 1
+        self.stats["prefetched"] += built
+        return built
+    
+    def memory_bytes(self) -> int:
+        """Perkiraan memori chunk yang sedang di-cache"""
+        total = 0
+        for chunk in self._chunks.values():
+            if chunk is not None:
+                surf = chunk[0]
+                total += surf.get_width() * surf.get_height() * surf.get_bytesize()
+        return total
+    
+    def _draw_layer(self, surface: pygame.Surface, name: str,
+                    camera_offset: Tuple[int, int]) -> None:
+        """Blit hanya chunk yang berpotongan dengan viewport"""
+        ox, oy = camera_offset
+        xs, ys = self._chunk_range(surface.get_clip().move(ox, oy))
+        items = []
+        for cy in ys:
+            for cx in xs:
+                chunk = self.get_chunk(name, cx, cy)
+                if chunk is not None:
+                    items.append((chunk[0], (chunk[1][0] - ox, chunk[1][1] - oy)))
+        if items:
+            surface.blits(items, doreturn=False)
+    
     def draw_base(self, surface: pygame.Surface, camera_offset: Tuple[int, int]) -> None:
-        surface.blit(self.base_layer, (-camera_offset[0], -camera_offset[1]))
+        self._draw_layer(surface, "base", camera_offset)
     
     def draw_objects_below(self, surface: pygame.Surface, camera_offset: Tuple[int, int]) -> None:
-        surface.blit(self.objects_below_layer, (-camera_offset[0], -camera_offset[1]))
+        self._draw_layer(surface, "below", camera_offset)
     
     def draw_objects_above(self, surface: pygame.Surface, camera_offset: Tuple[int, int]) -> None:
-        surface.blit(self.objects_above_layer, (-camera_offset[0], -camera_offset[1]))
+        self._draw_layer(surface, "above", camera_offset)
+
+
+def get_level_world_size(level: Level) -> Tuple[int, int]:
+    if level == Level.LEVEL_2:
+        return LEVEL2_WORLD_WIDTH, LEVEL2_WORLD_HEIGHT
+    if level == Level.LEVEL_3:
+        return LEVEL3_WORLD_WIDTH, LEVEL3_WORLD_HEIGHT
+    return 1920, 1080
+
+
+class LevelLoader:
+    """Bangun TileMap level di worker thread supaya frame loop tidak tersendat"""
+    def __init__(self, view_size: Tuple[int, int] = (RENDER_WIDTH, RENDER_HEIGHT)):
+        self.view_size = view_size
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="elion-level")
+        self._futures: Dict[Level, Future] = {}
+    
+    def prefetch(self, level: Level) -> None:
+        """Mulai membangun level di background (no-op jika sudah berjalan)"""
+        if level not in self._futures:
+            self._futures[level] = self._executor.submit(self._build, level, self.view_size)
+    
+    def is_ready(self, level: Level) -> bool:
+        future = self._futures.get(level)
+        return future is not None and future.done()
+    
+    def take(self, level: Level) -> TileMap:
+        """Ambil TileMap yang sudah jadi (menunggu jika masih dibangun)"""
+        self.prefetch(level)
+        return self._futures.pop(level).result()
+    
+    def shutdown(self) -> None:
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        self._executor.shutdown(wait=False)
+    
+    @staticmethod
+    def _build(level: Level, view_size: Tuple[int, int]) -> TileMap:
+        width, height = get_level_world_size(level)
+        tilemap = TileMap(width, height, level, seed=TILEMAP_SEED)
+        # Chunk di sekitar titik spawn langsung disiapkan
+        tilemap.prefetch((0, 0), view_size, budget=tilemap.max_chunks)
+        return tilemap
 
 
 # ==================== COLLECTIBLES ====================
@@ -3197,7 +5725,7 @@ class Gem:
         screen_x = int(self._x - camera_offset[0])
         screen_y = int(self._y - camera_offset[1])
         
-        if random.random() < 0.05:
+        if RNG.particles.random() < 0.05:
             cx, cy = self.get_center()
             if self._floating_to_altar:
                 particle_system.emit(cx, cy, self._color, count=2, spread=20, life=0.8)
@@ -3205,7 +5733,7 @@ class Gem:
                 particle_system.emit(cx, cy, self._color, count=1, spread=10, life=0.5)
         
         glow_size = int(self._size * self._pulse_scale)
-        glow_surf = pygame.Surface((glow_size + 20, glow_size + 20), pygame.SRCALPHA)
+        glow_surf = new_surface((glow_size + 20, glow_size + 20), pygame.SRCALPHA)
         pygame.draw.circle(glow_surf, (*self._color, 80), 
                          (glow_size // 2 + 10, glow_size // 2 + 10), glow_size // 2 + 10)
         surface.blit(glow_surf, (screen_x - 10, screen_y - 10))
@@ -3279,8 +5807,8 @@ class Portal:
             portal_color = (100, 200, 255)
             particle_color = COLOR_SPIRIT_CYAN
         
-        if random.random() < 0.2:
-            angle = random.uniform(0, math.pi * 2)
+        if RNG.particles.random() < 0.2:
+            angle = RNG.particles.uniform(0, math.pi * 2)
             radius = self._size // 2
             px = center_x + math.cos(angle) * radius
             py = center_y + math.sin(angle) * radius
@@ -3289,7 +5817,7 @@ class Portal:
         for i in range(3, 0, -1):
             radius = int(self._size * 0.6 * pulse + i * 8)
             alpha = 100 - i * 30
-            glow_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            glow_surf = new_surface((radius * 2, radius * 2), pygame.SRCALPHA)
             pygame.draw.circle(glow_surf, (*portal_color, alpha), 
                              (radius, radius), radius)
             surface.blit(glow_surf, (center_x - radius, center_y - radius))
@@ -3306,7 +5834,6 @@ class Portal:
             dot_size = int(6 + math.sin(self._swirl_timer * 2 + i) * 2)
             pygame.draw.circle(surface, portal_color, (int(sx), int(sy)), dot_size)
         
-        font = pygame.font.Font(None, 20)
         if self._portal_type == "red":
             text = "LEVEL 2"
         elif self._portal_type == "victory":
@@ -3314,7 +5841,7 @@ class Portal:
         else:
             text = "EXIT"
         
-        text_surf = font.render(text, True, COLOR_BLACK)
+        text_surf = render_text(text, 20, COLOR_BLACK)
         text_rect = text_surf.get_rect(center=(center_x, center_y))
         surface.blit(text_surf, text_rect)
 
@@ -3387,7 +5914,7 @@ class SpiritAltar:
         if self._activated:
             pulse = (math.sin(self._activation_timer * 3) + 1) * 0.5
             glow_radius = int(self._size * 0.8 + pulse * 40)
-            glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+            glow_surf = new_surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
             glow_alpha = int(100 + pulse * 80)
             pygame.draw.circle(glow_surf, (100, 255, 200, glow_alpha), 
                              (glow_radius, glow_radius), glow_radius)
@@ -3398,7 +5925,7 @@ class SpiritAltar:
             gem_x = int(gem_pos[0] - camera_offset[0])
             gem_y = int(gem_pos[1] - camera_offset[1])
             
-            gem_glow = pygame.Surface((40, 40), pygame.SRCALPHA)
+            gem_glow = new_surface((40, 40), pygame.SRCALPHA)
             pulse = (math.sin(self._activation_timer * 4 + i) + 1) * 0.5
             glow_alpha = int(150 + pulse * 105)
             
@@ -3412,7 +5939,7 @@ class SpiritAltar:
             pygame.draw.circle(gem_glow, gem_color, (20, 20), 20)
             surface.blit(gem_glow, (gem_x - 20, gem_y - 20))
             
-            if random.random() < 0.1:
+            if RNG.particles.random() < 0.1:
                 particle_system.emit(gem_pos[0], gem_pos[1], gem_color[:3], 
                                    count=1, spread=15, life=0.7, particle_type="light_flower")
         
@@ -3432,324 +5959,99 @@ class SpiritAltar:
                 layer_radius = int(tree_width * 0.6 * (1 - layer * 0.2))
                 layer_alpha = int(180 * (1 - layer * 0.3) * self._tree_height)
                 
-                canopy_surf = pygame.Surface((layer_radius * 2, layer_radius * 2), pygame.SRCALPHA)
+                canopy_surf = new_surface((layer_radius * 2, layer_radius * 2), pygame.SRCALPHA)
                 pygame.draw.circle(canopy_surf, (100, 255, 200, layer_alpha), 
                                  (layer_radius, layer_radius), layer_radius)
                 surface.blit(canopy_surf, (center_x - layer_radius, layer_y - layer_radius))
             
-            if random.random() < 0.2:
-                blossom_x = center_x + random.randint(-40, 40)
-                blossom_y = center_y - tree_height + random.randint(50, 100)
+            if RNG.particles.random() < 0.2:
+                blossom_x = center_x + RNG.particles.randint(-40, 40)
+                blossom_y = center_y - tree_height + RNG.particles.randint(50, 100)
                 particle_system.emit(blossom_x, blossom_y, (200, 255, 220), 
                                    count=3, spread=30, life=1.5, particle_type="light_flower")
 
 
 # ==================== UI ====================
-class UI:
-    @staticmethod
-    def draw_hud(surface: pygame.Surface, player: Player, elapsed_time: float, current_level: Level) -> None:
-        # Enhanced HUD panel with better layout
-        panel_width = 230
-        panel_height = 150
-        panel_surf = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+class HUDLayer:
+    """HUD yang di-retain: panel, teks dan sprite heart hanya dibangun ulang saat berubah.
+    
+    Per frame yang tersisa hanya blit layer + sprite heart sesuai fase
+    pulse/beat dan jarum jam.
+    """
+    PANEL_POS = (20, 20)
+    PANEL_SIZE = (230, 150)
+    TIME_SIZE = (160, 55)
+    LIVES_Y = 65
+    GEMS_Y = 95
+    SCORE_Y = 125
+    HEART_X = 105
+    HEART_SPACING = 28
+    HEART_SIZE = 18
+    PIXEL_SIZE = 2
+    # Sprite heart menyertakan outline di kolom/baris -1
+    HEART_ORIGIN = (-1, -1)
+    HEART_CELLS = (10, 11)
+    
+    def __init__(self):
+        self._panel: Optional[pygame.Surface] = None
+        self._time_panel: Optional[pygame.Surface] = None
+        self._content: Optional[pygame.Surface] = None
+        self._content_key: Optional[tuple] = None
+        self._time_content: Optional[pygame.Surface] = None
+        self._time_key: Optional[tuple] = None
+        self._full_hearts: Dict[bool, pygame.Surface] = {}
+        self._empty_heart: Optional[pygame.Surface] = None
+        self._heart_glows: Dict[int, pygame.Surface] = {}
+        self.rebuilds = 0
+    
+    def draw(self, surface: pygame.Surface, player: Player, elapsed_time: float, current_level: Level) -> None:
+        if self._panel is None:
+            self._bake_panels()
+        
+        lives = player.get_lives()
+        key = (current_level.value, lives, player.get_gem_count(), player.get_score())
+        if key != self._content_key:
+            self._content = self._build_content(*key)
+            self._content_key = key
+            self.rebuilds += 1
+        
+        surface.blit(self._panel, self.PANEL_POS)
+        surface.blit(self._content, (0, 0))
+        self._draw_hearts(surface, lives)
+        self._draw_time(surface, elapsed_time)
+    
+    # -------- Layer statis --------
+    def _bake_panels(self) -> None:
+        panel_width, panel_height = self.PANEL_SIZE
+        panel_surf = new_surface((panel_width, panel_height), pygame.SRCALPHA)
         
         # Glass effect background
         pygame.draw.rect(panel_surf, (0, 0, 0, 140), (0, 0, panel_width, panel_height), border_radius=15)
         pygame.draw.rect(panel_surf, (120, 200, 255, 80), (0, 0, panel_width, panel_height), 3, border_radius=15)
         
         # Inner glow
-        inner_glow = pygame.Surface((panel_width - 20, panel_height - 20), pygame.SRCALPHA)
+        inner_glow = new_surface((panel_width - 20, panel_height - 20), pygame.SRCALPHA)
         pygame.draw.rect(inner_glow, (255, 255, 255, 25), (0, 0, panel_width - 20, panel_height - 20), border_radius=12)
         panel_surf.blit(inner_glow, (10, 10))
+        self._panel = panel_surf
         
-        surface.blit(panel_surf, (20, 20))
-        
-        # Fonts
-        font_title = pygame.font.Font(None, 24)
-        font_text = pygame.font.Font(None, 20)
+        time_width, time_height = self.TIME_SIZE
+        time_surf = new_surface((time_width, time_height), pygame.SRCALPHA)
+        pygame.draw.rect(time_surf, (0, 0, 0, 140), (0, 0, time_width, time_height), border_radius=12)
+        pygame.draw.rect(time_surf, (120, 200, 255, 80), (0, 0, time_width, time_height), 3, border_radius=12)
+        self._time_panel = time_surf
+    
+    def _build_content(self, level_value: int, lives: int, gem_count: int, score: int) -> pygame.Surface:
+        """Teks dan ikon gem di atas panel (layer transparan seukuran area panel)"""
+        width = self.PANEL_POS[0] + self.PANEL_SIZE[0]
+        height = self.PANEL_POS[1] + self.PANEL_SIZE[1]
+        layer = new_surface((width, height), pygame.SRCALPHA)
         
-        # Level
-        level_text = font_title.render(f"LEVEL {current_level.value}", True, COLOR_GEM_YELLOW)
-        surface.blit(level_text, (35, 35))
+        layer.blit(render_text(f"LEVEL {level_value}", 24, COLOR_GEM_YELLOW), (35, 35))
+        layer.blit(render_text("LIVES:", 20, (220, 220, 220)), (35, self.LIVES_Y))
         
-        # Lives
-        lives_y = 65
-        lives_text = font_text.render("LIVES:", True, (220, 220, 220))
-        surface.blit(lives_text, (35, lives_y))
-
-        # Pixel art heart colors
-        heart_red = (255, 90, 90)        # Main red
-        heart_dark_red = (200, 60, 60)   # Dark red for shading
-        heart_light_red = (255, 130, 130) # Light red for highlight
-        heart_outline = (80, 30, 30)     # Outline color
-        heart_glow = (255, 120, 120, 60) # Glow color with alpha
-
-        # Heart size and spacing
-        heart_size = 18  # Pixel size for each heart
-        heart_spacing = 28
-
-        for i in range(3):
-            heart_x = 105 + i * heart_spacing
-            
-            if i < player.get_lives():
-                # === FULL HEART - Detailed Pixel Art dengan bentuk lebih realistis ===
-                
-                # 1. Outer glow effect (pulsing)
-                pulse = (math.sin(pygame.time.get_ticks() * 0.003 + i) + 1) * 0.3 + 0.7
-                glow_size = int(heart_size * pulse)
-                glow_surf = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
-                
-                # Glow layers
-                for layer in range(3, 0, -1):
-                    layer_size = glow_size - layer * 2
-                    layer_alpha = 40 // (layer + 1)
-                    # Draw pixelated glow (diamond shape)
-                    for gy in range(layer_size):
-                        for gx in range(layer_size):
-                            # Diamond mask
-                            if abs(gx - layer_size//2) + abs(gy - layer_size//2) <= layer_size//2:
-                                glow_surf.set_at((gx + layer, gy + layer), (*heart_red[:3], layer_alpha))
-                
-                surface.blit(glow_surf, (heart_x - glow_size//2, lives_y - glow_size//2 + 2))
-                
-                # 2. Main heart shape (9x8 pixel grid) - bentuk heart yang lebih realistis
-                heart_pixels = [
-                    # Row 0 (dua lobus atas terpisah)
-                    (1, 0, heart_red), (2, 0, heart_red), (5, 0, heart_red), (6, 0, heart_red),
-                    
-                    # Row 1 (lobus membesar)
-                    (0, 1, heart_red), (1, 1, heart_red), (2, 1, heart_red), (3, 1, heart_red), 
-                    (4, 1, heart_red), (5, 1, heart_red), (6, 1, heart_red), (7, 1, heart_red),
-                    
-                    # Row 2 (lebar penuh)
-                    (0, 2, heart_red), (1, 2, heart_red), (2, 2, heart_red), (3, 2, heart_red), 
-                    (4, 2, heart_red), (5, 2, heart_red), (6, 2, heart_red), (7, 2, heart_red),
-                    
-                    # Row 3 (mulai menyempit)
-                    (0, 3, heart_red), (1, 3, heart_red), (2, 3, heart_red), (3, 3, heart_red), 
-                    (4, 3, heart_red), (5, 3, heart_red), (6, 3, heart_red), (7, 3, heart_red),
-                    
-                    # Row 4 (menyempit)
-                    (1, 4, heart_red), (2, 4, heart_red), (3, 4, heart_red), (4, 4, heart_red), 
-                    (5, 4, heart_red), (6, 4, heart_red),
-                    
-                    # Row 5 (lebih sempit)
-                    (2, 5, heart_red), (3, 5, heart_red), (4, 5, heart_red), (5, 5, heart_red),
-                    
-                    # Row 6 (menuju titik)
-                    (3, 6, heart_red), (4, 6, heart_red),
-                    
-                    # Row 7 (titik bawah)
-                    (3, 7, heart_red), (4, 7, heart_red),
-                    
-                    # Row 8 (ujung lancip)
-                    (4, 8, heart_red),
-                ]
-                
-                # 3. Heart shading (darker pixels on left/bottom)
-                shading_pixels = [
-                    # Left lobe shading
-                    (0, 1, heart_dark_red), (1, 1, heart_dark_red),
-                    (0, 2, heart_dark_red), (1, 2, heart_dark_red),
-                    (0, 3, heart_dark_red), (1, 3, heart_dark_red),
-                    (1, 4, heart_dark_red), (2, 4, heart_dark_red),
-                    (2, 5, heart_dark_red), (3, 5, heart_dark_red),
-                    (3, 6, heart_dark_red), (3, 7, heart_dark_red),
-                    (4, 8, heart_dark_red),
-                ]
-                
-                # 4. Heart highlights (lighter pixels on right/top)
-                highlight_pixels = [
-                    # Right lobe highlights
-                    (6, 0, heart_light_red), (5, 0, heart_light_red),
-                    (7, 1, heart_light_red), (6, 1, heart_light_red),
-                    (7, 2, heart_light_red), (6, 2, heart_light_red),
-                    (7, 3, heart_light_red), (6, 3, heart_light_red),
-                    (6, 4, heart_light_red), (5, 4, heart_light_red),
-                    (5, 5, heart_light_red), (4, 6, heart_light_red),
-                ]
-                
-                # 5. Draw all heart pixels (scaled up)
-                pixel_size = 2  # Scale factor
-                
-                # Draw main heart shape
-                for px, py, color in heart_pixels:
-                    pygame.draw.rect(surface, color, 
-                                (heart_x + px * pixel_size, 
-                                    lives_y + py * pixel_size, 
-                                    pixel_size, pixel_size))
-                
-                # Overlay shading
-                for px, py, color in shading_pixels:
-                    pygame.draw.rect(surface, color, 
-                                (heart_x + px * pixel_size, 
-                                    lives_y + py * pixel_size, 
-                                    pixel_size, pixel_size))
-                
-                # Overlay highlights
-                for px, py, color in highlight_pixels:
-                    pygame.draw.rect(surface, color, 
-                                (heart_x + px * pixel_size, 
-                                    lives_y + py * pixel_size, 
-                                    pixel_size, pixel_size))
-                
-                # 6. Outline (pixelated outline)
-                outline_pixels = [
-                    # Top outline (dua lobus)
-                    (0, 0, heart_outline), (1, -1, heart_outline), (2, -1, heart_outline), (3, 0, heart_outline),
-                    (4, 0, heart_outline), (5, -1, heart_outline), (6, -1, heart_outline), (7, 0, heart_outline),
-                    
-                    # Left side
-                    (-1, 1, heart_outline), (-1, 2, heart_outline), (-1, 3, heart_outline),
-                    (0, 4, heart_outline), (1, 5, heart_outline), (2, 6, heart_outline),
-                    (2, 7, heart_outline), (3, 8, heart_outline),
-                    
-                    # Right side
-                    (8, 1, heart_outline), (8, 2, heart_outline), (8, 3, heart_outline),
-                    (7, 4, heart_outline), (6, 5, heart_outline), (5, 6, heart_outline),
-                    (5, 7, heart_outline), (5, 8, heart_outline),
-                    
-                    # Bottom point
-                    (4, 9, heart_outline),
-                ]
-                
-                # Draw outline (1 pixel thick)
-                for px, py, color in outline_pixels:
-                    draw_x = heart_x + px * pixel_size
-                    draw_y = lives_y + py * pixel_size
-                    pygame.draw.rect(surface, color, 
-                                (draw_x, draw_y, pixel_size, pixel_size))
-                
-                # 7. Inner glow (for beating effect)
-                beat = abs(math.sin(pygame.time.get_ticks() * 0.005 + i * 1.5))
-                inner_glow_alpha = int(100 * beat)
-                
-                if inner_glow_alpha > 20:
-                    # Center glow pixels
-                    center_pixels = [(3, 2), (4, 2), (3, 3), (4, 3), (3, 4), (4, 4)]
-                    for cx, cy in center_pixels:
-                        glow_rect = pygame.Rect(
-                            heart_x + cx * pixel_size,
-                            lives_y + cy * pixel_size,
-                            pixel_size, pixel_size
-                        )
-                        # Draw with additive blending
-                        glow_surf = pygame.Surface((pixel_size, pixel_size), pygame.SRCALPHA)
-                        glow_surf.fill((255, 180, 180, inner_glow_alpha))
-                        surface.blit(glow_surf, glow_rect.topleft, 
-                                special_flags=pygame.BLEND_ADD)
-                
-                # 8. Reflection highlight (top lobes)
-                reflection_pixels = [(1, 0), (2, 0), (5, 0), (6, 0), (1, 1), (2, 1)]
-                for rx, ry in reflection_pixels:
-                    reflect_surf = pygame.Surface((pixel_size, pixel_size), pygame.SRCALPHA)
-                    reflect_surf.fill((255, 255, 255, 80))
-                    surface.blit(reflect_surf, 
-                            (heart_x + rx * pixel_size, 
-                                lives_y + ry * pixel_size))
-                
-            else:
-                # === EMPTY HEART ===
-                empty_gray = (100, 100, 100)
-                empty_dark = (70, 70, 70)
-                empty_outline = (50, 50, 50)
-                crack_color = (60, 60, 60)
-                
-                # 1. Empty heart shape (outline only dengan bentuk baru)
-                empty_pixels = [
-                    # Row 0
-                    (1, 0, empty_gray), (2, 0, empty_gray), (5, 0, empty_gray), (6, 0, empty_gray),
-                    # Row 1 (outline sides)
-                    (0, 1, empty_gray), (7, 1, empty_gray),
-                    # Row 2
-                    (0, 2, empty_gray), (7, 2, empty_gray),
-                    # Row 3
-                    (0, 3, empty_gray), (7, 3, empty_gray),
-                    # Row 4
-                    (1, 4, empty_gray), (6, 4, empty_gray),
-                    # Row 5
-                    (2, 5, empty_gray), (5, 5, empty_gray),
-                    # Row 6
-                    (3, 6, empty_gray), (4, 6, empty_gray),
-                    # Row 7
-                    (3, 7, empty_gray), (4, 7, empty_gray),
-                    # Row 8
-                    (4, 8, empty_gray),
-                ]
-                
-                # 2. Darker shading for empty heart
-                empty_shading = [
-                    (0, 1, empty_dark), (0, 2, empty_dark), (0, 3, empty_dark),
-                    (1, 4, empty_dark), (2, 5, empty_dark), (3, 6, empty_dark),
-                    (3, 7, empty_dark), (4, 8, empty_dark),
-                ]
-                
-                # 3. Crack effect (interior)
-                crack_pixels = [
-                    (1, 1, crack_color), (2, 1, crack_color), (3, 1, crack_color),
-                    (4, 1, crack_color), (5, 1, crack_color), (6, 1, crack_color),
-                    (1, 2, crack_color), (3, 2, crack_color), (4, 2, crack_color), (6, 2, crack_color),
-                    (2, 3, crack_color), (3, 3, crack_color), (5, 3, crack_color),
-                    (3, 4, crack_color), (4, 4, crack_color),
-                ]
-                
-                # 4. Draw empty heart
-                pixel_size = 2
-                
-                for px, py, color in empty_pixels:
-                    pygame.draw.rect(surface, color, 
-                                (heart_x + px * pixel_size, 
-                                    lives_y + py * pixel_size, 
-                                    pixel_size, pixel_size))
-                
-                for px, py, color in empty_shading:
-                    pygame.draw.rect(surface, color, 
-                                (heart_x + px * pixel_size, 
-                                    lives_y + py * pixel_size, 
-                                    pixel_size, pixel_size))
-                
-                # Draw cracks
-                for px, py, color in crack_pixels:
-                    pygame.draw.rect(surface, color, 
-                                (heart_x + px * pixel_size, 
-                                    lives_y + py * pixel_size, 
-                                    pixel_size, pixel_size))
-                
-                # 5. Outline for empty heart
-                empty_outline_pixels = [
-                    (0, 0, empty_outline), (1, -1, empty_outline), (2, -1, empty_outline),
-                    (3, 0, empty_outline), (4, 0, empty_outline), (5, -1, empty_outline),
-                    (6, -1, empty_outline), (7, 0, empty_outline),
-                    (-1, 1, empty_outline), (-1, 2, empty_outline), (-1, 3, empty_outline),
-                    (8, 1, empty_outline), (8, 2, empty_outline), (8, 3, empty_outline),
-                    (0, 4, empty_outline), (7, 4, empty_outline),
-                    (1, 5, empty_outline), (6, 5, empty_outline),
-                    (2, 6, empty_outline), (5, 6, empty_outline),
-                    (2, 7, empty_outline), (5, 7, empty_outline),
-                    (3, 8, empty_outline), (5, 8, empty_outline),
-                    (4, 9, empty_outline),
-                ]
-                
-                for px, py, color in empty_outline_pixels:
-                    pygame.draw.rect(surface, color, 
-                                (heart_x + px * pixel_size, 
-                                    lives_y + py * pixel_size, 
-                                    pixel_size, pixel_size))
-                
-                # 6. Faded shadow effect
-                shadow_alpha = 30
-                shadow_pixels = [(2, 2), (3, 2), (4, 2), (3, 3), (4, 3), (3, 4)]
-                for sx, sy in shadow_pixels:
-                    shadow_surf = pygame.Surface((pixel_size, pixel_size), pygame.SRCALPHA)
-                    shadow_surf.fill((0, 0, 0, shadow_alpha))
-                    surface.blit(shadow_surf, 
-                            (heart_x + sx * pixel_size, 
-                                lives_y + sy * pixel_size))
-            
-        # Gems
-        gems_y = 95
-        gems_text = font_text.render(f"GEMS: {player.get_gem_count()}/3", True, COLOR_GEM_GREEN)
-        surface.blit(gems_text, (35, gems_y))
+        gems_y = self.GEMS_Y
+        layer.blit(render_text(f"GEMS: {gem_count}/3", 20, COLOR_GEM_GREEN), (35, gems_y))
         
         # Gem icons
         gem_types = [COLOR_GEM_GREEN, COLOR_GEM_BLUE, COLOR_GEM_YELLOW]
@@ -3757,131 +6059,321 @@ class UI:
             gem_x = 120 + i * 22
             gem_center = (gem_x, gems_y + 8)
             
-            if i < player.get_gem_count():
+            if i < gem_count:
                 # Collected gem with glow
-                gem_glow = pygame.Surface((14, 14), pygame.SRCALPHA)
+                gem_glow = new_surface((14, 14), pygame.SRCALPHA)
                 pygame.draw.circle(gem_glow, (*gem_color, 120), (7, 7), 7)
-                surface.blit(gem_glow, (gem_x - 7, gems_y + 1))
+                layer.blit(gem_glow, (gem_x - 7, gems_y + 1))
                 
-                pygame.draw.circle(surface, gem_color, gem_center, 5)
-                pygame.draw.circle(surface, (255, 255, 255), gem_center, 5, 1)
-                pygame.draw.circle(surface, (255, 255, 255, 150), (gem_x - 2, gems_y + 6), 2)
+                pygame.draw.circle(layer, gem_color, gem_center, 5)
+                pygame.draw.circle(layer, (255, 255, 255), gem_center, 5, 1)
+                pygame.draw.circle(layer, (255, 255, 255), (gem_x - 2, gems_y + 6), 2)
             else:
                 # Empty gem slot
-                pygame.draw.circle(surface, (60, 60, 60), gem_center, 5, 1)
+                pygame.draw.circle(layer, (60, 60, 60), gem_center, 5, 1)
+        
+        layer.blit(render_text(f"SCORE: {score}", 20, COLOR_WHITE), (35, self.SCORE_Y))
+        return layer
+    
+    # -------- Hearts --------
+    def _draw_hearts(self, surface: pygame.Surface, lives: int) -> None:
+        lives_y = self.LIVES_Y
+        ticks = game_ticks()
+        origin_x = self.HEART_ORIGIN[0] * self.PIXEL_SIZE
+        origin_y = self.HEART_ORIGIN[1] * self.PIXEL_SIZE
+        for i in range(3):
+            heart_x = self.HEART_X + i * self.HEART_SPACING
+            if i < lives:
+                # Outer glow (pulsing)
+                pulse = (math.sin(ticks * 0.003 + i) + 1) * 0.3 + 0.7
+                glow_size = int(self.HEART_SIZE * pulse)
+                surface.blit(self._heart_glow(glow_size),
+                             (heart_x - glow_size // 2, lives_y - glow_size // 2 + 2))
+                
+                # Inner glow (beating) hanya terlihat di atas ambang alpha
+                beat = abs(math.sin(ticks * 0.005 + i * 1.5))
+                sprite = self._full_heart(int(100 * beat) > 20)
+            else:
+                sprite = self._empty()
+            surface.blit(sprite, (heart_x + origin_x, lives_y + origin_y))
+    
+    def _heart_glow(self, glow_size: int) -> pygame.Surface:
+        glow_surf = self._heart_glows.get(glow_size)
+        if glow_surf is not None:
+            return glow_surf
+        heart_red = (255, 90, 90)
+        glow_surf = new_surface((max(glow_size, 0), max(glow_size, 0)), pygame.SRCALPHA)
+        for layer in range(3, 0, -1):
+            layer_size = glow_size - layer * 2
+            layer_alpha = 40 // (layer + 1)
+            # Pixelated glow (diamond shape)
+            for gy in range(layer_size):
+                for gx in range(layer_size):
+                    if abs(gx - layer_size//2) + abs(gy - layer_size//2) <= layer_size//2:
+                        glow_surf.set_at((gx + layer, gy + layer), (*heart_red[:3], layer_alpha))
+        self._heart_glows[glow_size] = glow_surf
+        return glow_surf
+    
+    def _new_heart_sprite(self) -> pygame.Surface:
+        cells_x, cells_y = self.HEART_CELLS
+        return new_surface((cells_x * self.PIXEL_SIZE, cells_y * self.PIXEL_SIZE), pygame.SRCALPHA)
+    
+    def _plot(self, sprite: pygame.Surface, pixels: Iterable[Tuple[int, int, Tuple[int, ...]]]) -> None:
+        pixel_size = self.PIXEL_SIZE
+        ox, oy = self.HEART_ORIGIN
+        for px, py, color in pixels:
+            pygame.draw.rect(sprite, color, ((px - ox) * pixel_size, (py - oy) * pixel_size,
+                                             pixel_size, pixel_size))
+    
+    def _overlay(self, sprite: pygame.Surface, cells: Iterable[Tuple[int, int]],
+                 color: Tuple[int, int, int, int], special_flags: int = 0) -> None:
+        pixel_size = self.PIXEL_SIZE
+        ox, oy = self.HEART_ORIGIN
+        cell = new_surface((pixel_size, pixel_size), pygame.SRCALPHA)
+        cell.fill(color)
+        for px, py in cells:
+            sprite.blit(cell, ((px - ox) * pixel_size, (py - oy) * pixel_size), special_flags=special_flags)
+    
+    def _full_heart(self, beating: bool) -> pygame.Surface:
+        sprite = self._full_hearts.get(beating)
+        if sprite is not None:
+            return sprite
+        
+        # Pixel art heart colors
+        heart_red = (255, 90, 90)        # Main red
+        heart_dark_red = (200, 60, 60)   # Dark red for shading
+        heart_light_red = (255, 130, 130) # Light red for highlight
+        heart_outline = (80, 30, 30)     # Outline color
+        
+        # Main heart shape (9x8 pixel grid)
+        heart_rows = {0: (1, 2, 5, 6), 1: range(8), 2: range(8), 3: range(8),
+                      4: range(1, 7), 5: range(2, 6), 6: (3, 4), 7: (3, 4), 8: (4,)}
+        heart_pixels = [(px, py, heart_red) for py, row in heart_rows.items() for px in row]
+        
+        # Heart shading (darker pixels on left/bottom)
+        shading_pixels = [
+            (0, 1, heart_dark_red), (1, 1, heart_dark_red),
+            (0, 2, heart_dark_red), (1, 2, heart_dark_red),
+            (0, 3, heart_dark_red), (1, 3, heart_dark_red),
+            (1, 4, heart_dark_red), (2, 4, heart_dark_red),
+            (2, 5, heart_dark_red), (3, 5, heart_dark_red),
+            (3, 6, heart_dark_red), (3, 7, heart_dark_red),
+            (4, 8, heart_dark_red),
+        ]
+        
+        # Heart highlights (lighter pixels on right/top)
+        highlight_pixels = [
+            (6, 0, heart_light_red), (5, 0, heart_light_red),
+            (7, 1, heart_light_red), (6, 1, heart_light_red),
+            (7, 2, heart_light_red), (6, 2, heart_light_red),
+            (7, 3, heart_light_red), (6, 3, heart_light_red),
+            (6, 4, heart_light_red), (5, 4, heart_light_red),
+            (5, 5, heart_light_red), (4, 6, heart_light_red),
+        ]
+        
+        # Outline (pixelated)
+        outline_pixels = [
+            # Top outline (dua lobus)
+            (0, 0, heart_outline), (1, -1, heart_outline), (2, -1, heart_outline), (3, 0, heart_outline),
+            (4, 0, heart_outline), (5, -1, heart_outline), (6, -1, heart_outline), (7, 0, heart_outline),
+            # Left side
+            (-1, 1, heart_outline), (-1, 2, heart_outline), (-1, 3, heart_outline),
+            (0, 4, heart_outline), (1, 5, heart_outline), (2, 6, heart_outline),
+            (2, 7, heart_outline), (3, 8, heart_outline),
+            # Right side
+            (8, 1, heart_outline), (8, 2, heart_outline), (8, 3, heart_outline),
+            (7, 4, heart_outline), (6, 5, heart_outline), (5, 6, heart_outline),
+            (5, 7, heart_outline), (5, 8, heart_outline),
+            # Bottom point
+            (4, 9, heart_outline),
+        ]
+        
+        sprite = self._new_heart_sprite()
+        self._plot(sprite, heart_pixels)
+        self._plot(sprite, shading_pixels)
+        self._plot(sprite, highlight_pixels)
+        self._plot(sprite, outline_pixels)
+        
+        if beating:
+            # Inner glow, additive: alpha tidak berpengaruh pada BLEND_ADD
+            center_pixels = [(3, 2), (4, 2), (3, 3), (4, 3), (3, 4), (4, 4)]
+            self._overlay(sprite, center_pixels, (255, 180, 180, 255), pygame.BLEND_ADD)
+        
+        # Reflection highlight (top lobes)
+        reflection_pixels = [(1, 0), (2, 0), (5, 0), (6, 0), (1, 1), (2, 1)]
+        self._overlay(sprite, reflection_pixels, (255, 255, 255, 80))
+        
+        self._full_hearts[beating] = sprite
+        return sprite
+    
+    def _empty(self) -> pygame.Surface:
+        if self._empty_heart is not None:
+            return self._empty_heart
+        
+        empty_gray = (100, 100, 100)
+        empty_dark = (70, 70, 70)
+        empty_outline = (50, 50, 50)
+        crack_color = (60, 60, 60)
+        
+        # Empty heart shape (outline only)
+        empty_pixels = [
+            (1, 0, empty_gray), (2, 0, empty_gray), (5, 0, empty_gray), (6, 0, empty_gray),
+            (0, 1, empty_gray), (7, 1, empty_gray),
+            (0, 2, empty_gray), (7, 2, empty_gray),
+            (0, 3, empty_gray), (7, 3, empty_gray),
+            (1, 4, empty_gray), (6, 4, empty_gray),
+            (2, 5, empty_gray), (5, 5, empty_gray),
+            (3, 6, empty_gray), (4, 6, empty_gray),
+            (3, 7, empty_gray), (4, 7, empty_gray),
+            (4, 8, empty_gray),
+        ]
+        
+        # Darker shading for empty heart
+        empty_shading = [
+            (0, 1, empty_dark), (0, 2, empty_dark), (0, 3, empty_dark),
+            (1, 4, empty_dark), (2, 5, empty_dark), (3, 6, empty_dark),
+            (3, 7, empty_dark), (4, 8, empty_dark),
+        ]
+        
+        # Crack effect (interior)
+        crack_pixels = [
+            (1, 1, crack_color), (2, 1, crack_color), (3, 1, crack_color),
+            (4, 1, crack_color), (5, 1, crack_color), (6, 1, crack_color),
+            (1, 2, crack_color), (3, 2, crack_color), (4, 2, crack_color), (6, 2, crack_color),
+            (2, 3, crack_color), (3, 3, crack_color), (5, 3, crack_color),
+            (3, 4, crack_color), (4, 4, crack_color),
+        ]
+        
+        empty_outline_pixels = [
+            (0, 0, empty_outline), (1, -1, empty_outline), (2, -1, empty_outline),
+            (3, 0, empty_outline), (4, 0, empty_outline), (5, -1, empty_outline),
+            (6, -1, empty_outline), (7, 0, empty_outline),
+            (-1, 1, empty_outline), (-1, 2, empty_outline), (-1, 3, empty_outline),
+            (8, 1, empty_outline), (8, 2, empty_outline), (8, 3, empty_outline),
+            (0, 4, empty_outline), (7, 4, empty_outline),
+            (1, 5, empty_outline), (6, 5, empty_outline),
+            (2, 6, empty_outline), (5, 6, empty_outline),
+            (2, 7, empty_outline), (5, 7, empty_outline),
+            (3, 8, empty_outline), (5, 8, empty_outline),
+            (4, 9, empty_outline),
+        ]
+        
+        sprite = self._new_heart_sprite()
+        self._plot(sprite, empty_pixels)
+        self._plot(sprite, empty_shading)
+        self._plot(sprite, crack_pixels)
+        self._plot(sprite, empty_outline_pixels)
         
-        # Score
-        score_y = 125
-        score_text = font_text.render(f"SCORE: {player.get_score()}", True, COLOR_WHITE)
-        surface.blit(score_text, (35, score_y))
+        # Faded shadow effect
+        shadow_pixels = [(2, 2), (3, 2), (4, 2), (3, 3), (4, 3), (3, 4)]
+        self._overlay(sprite, shadow_pixels, (0, 0, 0, 30))
         
-        # Time panel (separate from main HUD)
-        time_width = 160
-        time_height = 55
+        self._empty_heart = sprite
+        return sprite
+    
+    # -------- Time panel --------
+    def _draw_time(self, surface: pygame.Surface, elapsed_time: float) -> None:
+        time_width = self.TIME_SIZE[0]
         time_x = surface.get_width() - time_width - 20
-        time_surf = pygame.Surface((time_width, time_height), pygame.SRCALPHA)
-
-        # Time panel background
-        pygame.draw.rect(time_surf, (0, 0, 0, 140), (0, 0, time_width, time_height), border_radius=12)
-        pygame.draw.rect(time_surf, (120, 200, 255, 80), (0, 0, time_width, time_height), 3, border_radius=12)
-
-        surface.blit(time_surf, (time_x, 20))
-
-        # Calculate time
+        
         minutes = int(elapsed_time // 60)
         seconds = int(elapsed_time % 60)
-        time_str = f"{minutes:02d}:{seconds:02d}"
-
-        # Clock icon (positioned left with more spacing)
+        key = (minutes, seconds, time_x)
+        if key != self._time_key:
+            self._time_content = self._build_time_content(minutes, seconds)
+            self._time_key = key
+        
+        surface.blit(self._time_panel, (time_x, 20))
+        surface.blit(self._time_content, (time_x, 20))
+        
+        # Clock hands bergerak kontinu, jadi tetap digambar per frame
         clock_center = (time_x + 30, 47)
-        pygame.draw.circle(surface, (100, 200, 255), clock_center, 10)
-        pygame.draw.circle(surface, (255, 255, 255), clock_center, 10, 2)
-
-        # Clock hands
         second_angle = (elapsed_time % 60) * 6 - 90
         minute_angle = ((elapsed_time / 60) % 60) * 6 - 90
-
+        
         second_x = clock_center[0] + math.cos(math.radians(second_angle)) * 7
         second_y = clock_center[1] + math.sin(math.radians(second_angle)) * 7
         pygame.draw.line(surface, (255, 100, 100), clock_center, (second_x, second_y), 1)
-
+        
         minute_x = clock_center[0] + math.cos(math.radians(minute_angle)) * 6
         minute_y = clock_center[1] + math.sin(math.radians(minute_angle)) * 6
         pygame.draw.line(surface, (255, 255, 255), clock_center, (minute_x, minute_y), 2)
-
+        
         pygame.draw.circle(surface, (255, 255, 255), clock_center, 2)
+    
+    def _build_time_content(self, minutes: int, seconds: int) -> pygame.Surface:
+        """Ikon jam, label dan teks waktu, relatif terhadap pojok panel waktu"""
+        time_width, time_height = self.TIME_SIZE
+        layer = new_surface((time_width, time_height), pygame.SRCALPHA)
+        
+        # Clock icon
+        clock_center = (30, 27)
+        pygame.draw.circle(layer, (100, 200, 255), clock_center, 10)
+        pygame.draw.circle(layer, (255, 255, 255), clock_center, 10, 2)
+        
+        time_label = render_text("TIME", 20, (200, 220, 240))
+        label_x = 70
+        layer.blit(time_label, (label_x, 8))
+        
+        time_text = render_text(f"{minutes:02d}:{seconds:02d}", 28, COLOR_GEM_YELLOW)
+        time_text_x = label_x + (time_label.get_width() - time_text.get_width()) // 2  # Center align with label
+        layer.blit(time_text, (time_text_x, 28))
+        return layer
 
-        # Time label (positioned right side with better spacing)
-        time_label = font_text.render("TIME", True, (200, 220, 240))
-        label_x = time_x + 70
-        surface.blit(time_label, (label_x, 28))
 
-        # Time text (positioned below label with better vertical spacing)
-        font_time = pygame.font.Font(None, 28)
-        time_text = font_time.render(time_str, True, COLOR_GEM_YELLOW)
-        time_text_x = label_x + (time_label.get_width() - time_text.get_width()) // 2  # Center align with label
-        surface.blit(time_text, (time_text_x, 48))
+hud_layer = HUDLayer()
+
+
+class UI:
+    @staticmethod
+    def draw_hud(surface: pygame.Surface, player: Player, elapsed_time: float, current_level: Level) -> None:
+        hud_layer.draw(surface, player, elapsed_time, current_level)
     
     @staticmethod
     def draw_hint_box(surface: pygame.Surface, text: str, y_position: int = 500) -> None:
         if not text:
             return
         
-        font = pygame.font.Font(None, 24)
-        text_surf = font.render(text, True, COLOR_WHITE)
+        text_surf = render_text(text, 24, COLOR_WHITE)
         text_rect = text_surf.get_rect(center=(surface.get_width() // 2, y_position))
         
         bg_rect = text_rect.inflate(20, 10)
-        bg_surf = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
+        bg_surf = new_surface(bg_rect.size, pygame.SRCALPHA)
         bg_surf.fill((0, 0, 0, 150))
         pygame.draw.rect(bg_surf, (100, 200, 255, 100), (0, 0, bg_rect.width, bg_rect.height), 
                         width=2, border_radius=8)
         surface.blit(bg_surf, bg_rect.topleft)
         surface.blit(text_surf, text_rect)
     
+    # Layer statis menu (judul, tombol, instruksi), di-bake sekali per ukuran surface
+    _menu_layer: Optional[Tuple[Tuple[int, int], pygame.Surface]] = None
+    
     @staticmethod
-    def draw_menu(surface: pygame.Surface, menu_particle_timer: float) -> None:
-        for y in range(surface.get_height()):
-            ratio = y / surface.get_height()
-            r = int(30 * (1 - ratio) + 15 * ratio)
-            g = int(80 * (1 - ratio) + 40 * ratio)
-            b = int(50 * (1 - ratio) + 25 * ratio)
-            pygame.draw.line(surface, (r, g, b), (0, y), (surface.get_width(), y))
-        
-        for i in range(15):
-            x = (menu_particle_timer * 30 + i * 80) % surface.get_width()
-            y = surface.get_height() // 2 + math.sin(menu_particle_timer * 2 + i) * 60
-            pygame.draw.circle(surface, (*COLOR_SPIRIT_CYAN, 150), (int(x), int(y)), 3)
-        
-        font_title = pygame.font.Font(None, 120)
-        title_shadow = font_title.render("ELION", True, (0, 150, 150))
-        title = font_title.render("ELION", True, COLOR_SPIRIT_CYAN)
+    def _menu_static_layer(size: Tuple[int, int]) -> pygame.Surface:
+        if UI._menu_layer is not None and UI._menu_layer[0] == size:
+            return UI._menu_layer[1]
         
-        title_rect = title.get_rect(center=(surface.get_width() // 2, 120))
-        surface.blit(title_shadow, (title_rect.x + 3, title_rect.y + 3))
-        surface.blit(title, title_rect)
+        width = size[0]
+        layer = new_surface(size, pygame.SRCALPHA)
+        title_shadow = render_text("ELION", 120, (0, 150, 150))
+        title = render_text("ELION", 120, COLOR_SPIRIT_CYAN)
         
-        font_sub = pygame.font.Font(None, 40)
-        subtitle = font_sub.render("The Last Lightkeeper", True, COLOR_WHISPER_GREEN)
-        subtitle_rect = subtitle.get_rect(center=(surface.get_width() // 2, 200))
-        surface.blit(subtitle, subtitle_rect)
-        
-        pulse = abs(math.sin(menu_particle_timer * 2)) * 0.2 + 0.8
-        button_rect = pygame.Rect(0, 0, 200, 60)
-        button_rect.center = (surface.get_width() // 2, 300)
+        title_rect = title.get_rect(center=(width // 2, 120))
+        layer.blit(title_shadow, (title_rect.x + 3, title_rect.y + 3))
+        layer.blit(title, title_rect)
         
-        glow_surf = pygame.Surface((220, 80), pygame.SRCALPHA)
-        glow_surf.fill((*COLOR_SPIRIT_CYAN, int(60 * pulse)))
-        surface.blit(glow_surf, (button_rect.x - 10, button_rect.y - 10))
+        subtitle = render_text("The Last Lightkeeper", 40, COLOR_WHISPER_GREEN)
+        subtitle_rect = subtitle.get_rect(center=(width // 2, 200))
+        layer.blit(subtitle, subtitle_rect)
         
-        pygame.draw.rect(surface, (40, 100, 120), button_rect, border_radius=10)
-        pygame.draw.rect(surface, COLOR_SPIRIT_CYAN, button_rect, width=3, border_radius=10)
+        button_rect = UI._menu_button_rect(size)
+        pygame.draw.rect(layer, (40, 100, 120), button_rect, border_radius=10)
+        pygame.draw.rect(layer, COLOR_SPIRIT_CYAN, button_rect, width=3, border_radius=10)
         
-        play_text = font_sub.render("PLAY", True, COLOR_WHITE)
+        play_text = render_text("PLAY", 40, COLOR_WHITE)
         play_rect = play_text.get_rect(center=button_rect.center)
-        surface.blit(play_text, play_rect)
+        layer.blit(play_text, play_rect)
         
-        font_small = pygame.font.Font(None, 22)
         instructions = [
             "Press ENTER to Start",
             "WASD or Arrow Keys to Move",
@@ -3891,9 +6383,64 @@ class UI:
         ]
         
         for i, inst in enumerate(instructions):
-            inst_text = font_small.render(inst, True, (200, 230, 200))
-            inst_rect = inst_text.get_rect(center=(surface.get_width() // 2, 400 + i * 30))
-            surface.blit(inst_text, inst_rect)
+            inst_text = render_text(inst, 22, (200, 230, 200))
+            inst_rect = inst_text.get_rect(center=(width // 2, 400 + i * 30))
+            layer.blit(inst_text, inst_rect)
+        
+        UI._menu_layer = (size, layer)
+        return layer
+    
+    @staticmethod
+    def _menu_button_rect(size: Tuple[int, int]) -> pygame.Rect:
+        button_rect = pygame.Rect(0, 0, 200, 60)
+        button_rect.center = (size[0] // 2, 300)
+        return button_rect
+    
+    @staticmethod
+    def _menu_particles(size: Tuple[int, int], menu_particle_timer: float) -> List[Tuple[int, int]]:
+        width, height = size
+        points = []
+        for i in range(15):
+            x = (menu_particle_timer * 30 + i * 80) % width
+            y = height // 2 + math.sin(menu_particle_timer * 2 + i) * 60
+            points.append((int(x), int(y)))
+        return points
+    
+    @staticmethod
+    def menu_rects(size: Tuple[int, int], menu_particle_timer: float) -> List[pygame.Rect]:
+        """Rect elemen menu yang bergerak (partikel dan glow tombol), untuk dirty rect"""
+        moving = [pygame.Rect(x - 4, y - 4, 9, 9) for x, y in UI._menu_particles(size, menu_particle_timer)]
+        moving.append(UI._menu_button_rect(size).inflate(20, 20))
+        return moving
+    
+    @staticmethod
+    def draw_menu(surface: pygame.Surface, menu_particle_timer: float,
+                  rects: Optional[Sequence[pygame.Rect]] = None) -> List[pygame.Rect]:
+        """Gambar menu; return rect elemen yang bergerak (untuk dirty rect).
+        
+        Dengan `rects`, hanya area itu yang digambar ulang: gradien dan layer
+        statis diambil dari cache, partikel dan glow tombol digambar di atasnya.
+        """
+        size = surface.get_size()
+        background = vertical_gradient(size, (30, 80, 50), (15, 40, 25))
+        layer = UI._menu_static_layer(size)
+        points = UI._menu_particles(size, menu_particle_timer)
+        
+        pulse = abs(math.sin(menu_particle_timer * 2)) * 0.2 + 0.8
+        glow_rect = UI._menu_button_rect(size).inflate(20, 20)
+        glow_surf = new_surface(glow_rect.size, pygame.SRCALPHA)
+        glow_surf.fill((*COLOR_SPIRIT_CYAN, int(60 * pulse)))
+        
+        clip = surface.get_clip()
+        for area in (surface.get_rect(),) if rects is None else rects:
+            surface.set_clip(area)
+            surface.blit(background, area.topleft, area)
+            for x, y in points:
+                pygame.draw.circle(surface, (*COLOR_SPIRIT_CYAN, 150), (x, y), 3)
+            surface.blit(glow_surf, glow_rect.topleft)
+            surface.blit(layer, area.topleft, area)
+        surface.set_clip(clip)
+        return UI.menu_rects(size, menu_particle_timer)
     
     @staticmethod
     def draw_attack_hint(surface: pygame.Surface, player: Player) -> None:
@@ -3901,14 +6448,13 @@ class UI:
             return
         
         hint_text = "Press SPACE to release Spirit Burst"
-        font = pygame.font.Font(None, 20)
-        text_surf = font.render(hint_text, True, COLOR_SPIRIT_CYAN)
+        text_surf = render_text(hint_text, 20, COLOR_SPIRIT_CYAN)
         
         text_rect = text_surf.get_rect(center=(surface.get_width() // 2, 
                                               surface.get_height() - 30))
         
         bg_rect = text_rect.inflate(15, 8)
-        bg_surf = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
+        bg_surf = new_surface(bg_rect.size, pygame.SRCALPHA)
         bg_surf.fill((0, 0, 0, 150))
         pygame.draw.rect(bg_surf, (100, 200, 255, 100), 
                         (0, 0, bg_rect.width, bg_rect.height), 
@@ -3919,19 +6465,12 @@ class UI:
     
     @staticmethod
     def draw_win_screen(surface: pygame.Surface, elapsed_time: float, score: int) -> None:
-        for y in range(surface.get_height()):
-            ratio = y / surface.get_height()
-            r = int(20 * (1 - ratio) + 10 * ratio)
-            g = int(80 * (1 - ratio) + 40 * ratio)
-            b = int(60 * (1 - ratio) + 30 * ratio)
-            pygame.draw.line(surface, (r, g, b), (0, y), (surface.get_width(), y))
+        surface.blit(vertical_gradient(surface.get_size(), (20, 80, 60), (10, 40, 30)), (0, 0))
         
-        font_title = pygame.font.Font(None, 100)
-        font_text = pygame.font.Font(None, 36)
         
-        title = font_title.render("VICTORY!", True, COLOR_GEM_YELLOW)
+        title = render_text("VICTORY!", 100, COLOR_GEM_YELLOW)
         title_rect = title.get_rect(center=(surface.get_width() // 2, 120))
-        shadow = font_title.render("VICTORY!", True, (100, 100, 0))
+        shadow = render_text("VICTORY!", 100, (100, 100, 0))
         surface.blit(shadow, (title_rect.x + 3, title_rect.y + 3))
         surface.blit(title, title_rect)
         
@@ -3947,7 +6486,7 @@ class UI:
         
         for i, stat in enumerate(stats):
             color = COLOR_WHITE if i < 2 else (150, 150, 150)
-            text = font_text.render(stat, True, color)
+            text = render_text(stat, 36, color)
             text_rect = text.get_rect(center=(surface.get_width() // 2, 250 + i * 50))
             surface.blit(text, text_rect)
     
@@ -3964,23 +6503,21 @@ class UI:
             fade_color = (0, 0, 0, 0)
         
         if fade_alpha > 0:
-            fade_surf = pygame.Surface((surface.get_width(), surface.get_height()), pygame.SRCALPHA)
+            fade_surf = new_surface((surface.get_width(), surface.get_height()), pygame.SRCALPHA)
             fade_surf.fill(fade_color)
             surface.blit(fade_surf, (0, 0))
         
-        font_large = pygame.font.Font(None, 48)
-        font_medium = pygame.font.Font(None, 36)
         
         if sequence_timer >= 3.0:
             text1_alpha = min(255, int(255 * (sequence_timer - 3.0)))
-            text1 = font_large.render("The Last Lightkeeper is restored…", True, COLOR_BLACK)
+            text1 = render_text("The Last Lightkeeper is restored…", 48, COLOR_BLACK).copy()
             text1.set_alpha(text1_alpha)
             text1_rect = text1.get_rect(center=(surface.get_width() // 2, surface.get_height() // 2 - 30))
             surface.blit(text1, text1_rect)
         
         if sequence_timer >= 4.0:
             text2_alpha = min(255, int(255 * (sequence_timer - 4.0)))
-            text2 = font_medium.render("Thank you, young guardian.", True, COLOR_BLACK)
+            text2 = render_text("Thank you, young guardian.", 36, COLOR_BLACK).copy()
             text2.set_alpha(text2_alpha)
             text2_rect = text2.get_rect(center=(surface.get_width() // 2, surface.get_height() // 2 + 30))
             surface.blit(text2, text2_rect)
@@ -3988,17 +6525,46 @@ class UI:
         if sequence_timer >= 6.0:
             pulse = (math.sin(sequence_timer * 3) + 1) * 0.5
             prompt_alpha = int(200 * pulse)
-            prompt = font_medium.render("Press ENTER to return to menu", True, COLOR_WHITE)
+            prompt = render_text("Press ENTER to return to menu", 36, COLOR_WHITE).copy()
             prompt.set_alpha(prompt_alpha)
             prompt_rect = prompt.get_rect(center=(surface.get_width() // 2, surface.get_height() - 50))
             surface.blit(prompt, prompt_rect)
+    
+    @staticmethod
+    def draw_loading_transition(surface: pygame.Surface, loading_timer: float, target_level: Level) -> None:
+        """Efek portal selama level berikutnya dibangun"""
+        width, height = surface.get_width(), surface.get_height()
+        
+        fade_alpha = min(220, int(220 * loading_timer / LEVEL_LOADING_MIN_TIME))
+        fade_surf = new_surface((width, height), pygame.SRCALPHA)
+        fade_surf.fill((10, 15, 30, fade_alpha))
+        surface.blit(fade_surf, (0, 0))
+        
+        # Cincin cahaya yang mengembang dari tengah
+        center = (width // 2, height // 2)
+        for i in range(4):
+            phase = (loading_timer * 1.5 + i * 0.25) % 1.0
+            radius = int(20 + phase * max(width, height) * 0.5)
+            ring_alpha = int(180 * (1 - phase))
+            ring_surf = new_surface((radius * 2 + 4, radius * 2 + 4), pygame.SRCALPHA)
+            pygame.draw.circle(ring_surf, (*COLOR_SPIRIT_CYAN, ring_alpha),
+                             (radius + 2, radius + 2), radius, 3)
+            surface.blit(ring_surf, (center[0] - radius - 2, center[1] - radius - 2),
+                        special_flags=pygame.BLEND_ADD)
+        
+        pulse = (math.sin(loading_timer * 4) + 1) * 0.5
+        text = render_text(f"LEVEL {target_level.value}", 36, COLOR_WHITE).copy()
+        text.set_alpha(int(155 + 100 * pulse))
+        text_rect = text.get_rect(center=(center[0], height - 50))
+        surface.blit(text, text_rect)
 
 # ==================== OPENING GAME ====================
 class OpeningCutscene:
     def __init__(self, screen):
         self.screen = screen
-        self.font_title = pygame.font.Font(None, 64)
-        self.font_text = pygame.font.Font(None, 32)
+        # Ukuran font mengikuti tinggi target (window atau render_surface)
+        self.scale = screen.get_height() / WINDOW_HEIGHT
+        self.font_text = get_font(max(1, round(32 * self.scale)))
         
         # Teks cutscene berurutan
         self.lines = [
@@ -4060,17 +6626,29 @@ class OpeningCutscene:
         self.screen.fill((10, 10, 10))  # Background hitam lembut
 
         if not self.finished:
-            rect = self.text_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2))
+            rect = self.text_surface.get_rect(center=(self.screen.get_width()//2, self.screen.get_height()//2))
             self.screen.blit(self.text_surface, rect)
         else:
             # Teks Judul Besar setelah cutscene selesai
-            title = self.font_title.render("ELION – THE LAST LIGHTKEEPER", True, (255, 255, 180))
-            title_rect = title.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2))
+            title = render_text("ELION – THE LAST LIGHTKEEPER", max(1, round(64 * self.scale)), (255, 255, 180))
+            title_rect = title.get_rect(center=(self.screen.get_width()//2, self.screen.get_height()//2))
             self.screen.blit(title, title_rect)
 
+    def draw_dirty(self) -> List[pygame.Rect]:
+        """Hanya area teks yang berubah (alpha fade); ganti baris = redraw penuh"""
+        if self.finished:
+            return []
+        rect = self.text_surface.get_rect(center=(self.screen.get_width()//2, self.screen.get_height()//2))
+        self.screen.fill((10, 10, 10), rect)
+        self.screen.blit(self.text_surface, rect)
+        return [rect]
+
 # ==================== ENHANCED ENDING REFLECTION ====================
 class EndingReflection:
-    def __init__(self):
+    def __init__(self, size: Tuple[int, int] = (WINDOW_WIDTH, WINDOW_HEIGHT)):
+        # Layout ditulis untuk 1280x720; scale menyesuaikan ke resolusi target
+        self.size = size
+        self.scale = size[1] / WINDOW_HEIGHT
         self.sequence_timer = 0.0
         self.stages = []
         self.current_stage = 0
@@ -4107,6 +6685,7 @@ class EndingReflection:
         # Visual elements
         self.particles = []
         self.light_beam_height = 0
+        self._beam: Optional[pygame.Surface] = None
         self.silhouette_alpha = 0
         self.concept_glow = {"encapsulation": 0, "inheritance": 0, "polymorphism": 0}
         
@@ -4137,7 +6716,7 @@ class EndingReflection:
         # Update concept glow
         if self.current_stage >= 13:  # During concepts stage
             for concept in self.concept_glow:
-                self.concept_glow[concept] = (math.sin(pygame.time.get_ticks() * 0.002) + 1) * 0.5
+                self.concept_glow[concept] = (math.sin(game_ticks() * 0.002) + 1) * 0.5
         
         # Update particles
         for p in self.particles[:]:
@@ -4147,25 +6726,21 @@ class EndingReflection:
                 self.particles.remove(p)
         
         # Add new particles
-        if random.random() < 0.3:
+        if RNG.ui.random() < 0.3:
+            width, height = self.size
             self.particles.append({
-                'x': random.randint(0, WINDOW_WIDTH),
-                'y': WINDOW_HEIGHT + 10,
-                'speed': random.uniform(50, 150),
-                'size': random.uniform(2, 5),
+                'x': RNG.ui.randint(0, width),
+                'y': height + 10 * self.scale,
+                'speed': RNG.ui.uniform(50, 150) * self.scale,
+                'size': max(1.0, RNG.ui.uniform(2, 5) * self.scale),
                 'color': (100, 255, 200),
-                'life': random.uniform(2, 4)
+                'life': RNG.ui.uniform(2, 4)
             })
     
     def draw(self, surface: pygame.Surface) -> None:
         """Draw ending reflection"""
         # Background - dark blue gradient
-        for y in range(surface.get_height()):
-            ratio = y / surface.get_height()
-            r = int(5 * (1 - ratio) + 10 * ratio)
-            g = int(10 * (1 - ratio) + 30 * ratio)
-            b = int(20 * (1 - ratio) + 50 * ratio)
-            pygame.draw.line(surface, (r, g, b), (0, y), (surface.get_width(), y))
+        surface.blit(vertical_gradient(surface.get_size(), (5, 10, 20), (10, 30, 50)), (0, 0))
         
         # Particles
         for p in self.particles:
@@ -4176,30 +6751,30 @@ class EndingReflection:
         # Light beam from top
         if self.light_beam_height > 0:
             beam_height = int(surface.get_height() * self.light_beam_height)
-            beam_surf = pygame.Surface((surface.get_width(), beam_height), pygame.SRCALPHA)
             
-            # Gradient beam
-            for y in range(beam_height):
-                alpha = int(30 * (1 - y/beam_height))
-                pygame.draw.line(beam_surf, (255, 255, 255, alpha), 
-                                (0, y), (surface.get_width(), y))
+            # Gradient beam; hanya dibangun ulang selama tingginya masih bertambah
+            beam_size = (surface.get_width(), beam_height)
+            if self._beam is None or self._beam.get_size() != beam_size:
+                self._beam = render_vertical_gradient(beam_size, (255, 255, 255, 30), (255, 255, 255, 0))
             
-            surface.blit(beam_surf, (0, 0))
+            surface.blit(self._beam, (0, 0))
         
         # Silhouette of Elion and Companion
         if self.current_stage >= 4:  # After first few texts
-            silhouette_surf = pygame.Surface((300, 400), pygame.SRCALPHA)
+            k = self.scale
+            silhouette_surf = new_surface((int(300 * k), int(400 * k)), pygame.SRCALPHA)
             
             # Elion silhouette
             pygame.draw.rect(silhouette_surf, (0, 0, 0, 200), 
-                           (100, 100, 60, 120), border_radius=10)
+                           (int(100 * k), int(100 * k), int(60 * k), int(120 * k)),
+                           border_radius=max(1, int(10 * k)))
             # Companion silhouette
             pygame.draw.circle(silhouette_surf, (0, 0, 0, 200), 
-                             (200, 160), 30)
+                             (int(200 * k), int(160 * k)), int(30 * k))
             
             surface.blit(silhouette_surf, 
-                        (surface.get_width()//2 - 150, 
-                         surface.get_height()//2 - 100))
+                        (surface.get_width()//2 - int(150 * k), 
+                         surface.get_height()//2 - int(100 * k)))
         
         # Draw current text
         if self.current_stage < len(self.stages):
@@ -4218,13 +6793,13 @@ class EndingReflection:
                 if "Encapsulation" in text or "Lightkeeper" in text:
                     # Special styling for key texts
                     font_size = 48 if "Encapsulation" in text else 36
-                    font = pygame.font.Font(None, font_size)
                     color = (255, 255, 100) if "Encapsulation" in text else (200, 200, 255)
                 else:
-                    font = pygame.font.Font(None, 42)
+                    font_size = 42
                     color = (220, 240, 255)
                 
-                text_surf = font.render(text, True, color)
+                # Salinan: set_alpha tidak boleh mengubah surface di text_cache
+                text_surf = render_text(text, max(1, round(font_size * self.scale)), color).copy()
                 text_surf.set_alpha(alpha)
                 text_rect = text_surf.get_rect(center=(surface.get_width()//2, 
                                                       surface.get_height()//2))
@@ -4232,46 +6807,66 @@ class EndingReflection:
                 # Draw glow for concepts
                 if "Encapsulation" in text:
                     glow_alpha = int(100 * self.concept_glow.get("encapsulation", 0))
-                    glow_surf = pygame.Surface((text_rect.width + 40, text_rect.height + 20), 
+                    pad_x, pad_y = int(20 * self.scale), int(10 * self.scale)
+                    glow_surf = new_surface((text_rect.width + 2 * pad_x, text_rect.height + 2 * pad_y), 
                                               pygame.SRCALPHA)
                     pygame.draw.rect(glow_surf, (100, 255, 200, glow_alpha), 
                                    (0, 0, glow_surf.get_width(), glow_surf.get_height()), 
-                                   border_radius=10)
-                    surface.blit(glow_surf, (text_rect.x - 20, text_rect.y - 10))
+                                   border_radius=max(1, int(10 * self.scale)))
+                    surface.blit(glow_surf, (text_rect.x - pad_x, text_rect.y - pad_y))
                 
                 surface.blit(text_surf, text_rect)
         
         # Draw continue prompt
         if self.finished or self.current_stage >= len(self.stages) - 3:
-            pulse = (math.sin(pygame.time.get_ticks() * 0.003) + 1) * 0.5
+            pulse = (math.sin(game_ticks() * 0.003) + 1) * 0.5
             alpha = int(200 * pulse)
             
-            font = pygame.font.Font(None, 32)
-            prompt = font.render("Tekan ENTER untuk kembali ke menu", True, (255, 255, 255))
+            prompt = render_text("Tekan ENTER untuk kembali ke menu", max(1, round(32 * self.scale)),
+                                 (255, 255, 255)).copy()
             prompt.set_alpha(alpha)
             prompt_rect = prompt.get_rect(center=(surface.get_width()//2, 
-                                                 surface.get_height() - 50))
+                                                 surface.get_height() - int(50 * self.scale)))
             surface.blit(prompt, prompt_rect)
 
 
 # ==================== GAME CLASS ====================
+REDRAW_EVENTS = (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE, pygame.WINDOWEXPOSED,
+                 pygame.WINDOWSHOWN, pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED)
+
+
 class Game:
-    def __init__(self):
+    def __init__(self, render_size: Optional[Tuple[int, int]] = None,
+                 scaler: str = RENDER_SCALER, lowres_screens: bool = LOWRES_SCREENS):
         # Setup window dengan vsync
         self.window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), 
                                               pygame.HWSURFACE | pygame.DOUBLEBUF)
         pygame.display.set_caption("ELION – The Last Lightkeeper (Enhanced Visual Edition)")
         
-        self.render_surface = pygame.Surface((RENDER_WIDTH, RENDER_HEIGHT))
+        # Resolusi internal; semua gameplay digambar di sini lalu di-scale ke window
+        self.render_surface = new_surface(render_size or (RENDER_WIDTH, RENDER_HEIGHT))
         self.screen = self.window
+        self.lowres_screens = lowres_screens
+        self._init_scaler(scaler)
+        # Kunci layar statis yang terakhir digambar penuh (lihat _dirty_key)
+        self._present_key: Optional[Hashable] = None
+        self._menu_rects: List[pygame.Rect] = []
+        self._codex_close_button: Optional[pygame.Rect] = None
+        # Peta di bawah panel codex (di luar layar), dianimasikan lewat dirty rect
+        self._codex_map: Optional[pygame.Surface] = None
         
         # Initialize systems
         self.cutscene = None
-        self.world_map = WorldMap()
+        self.world_map = WorldMap(self._screen_target().get_height() / WINDOW_HEIGHT)
         self.ending_reflection = None
         self.companion: Optional[MentorCompanion] = None
         
         self.clock = pygame.time.Clock()
+        self.profiler = FrameProfiler(PROFILER_ENABLED)
+        # Grid tabrakan/proximity; diisi ulang setiap update level
+        self.spatial = SpatialHash()
+        # Sumber input keyboard: pygame.key, atau ScriptedInput saat simulasi
+        self.input = pygame.key
         self.running = True
         self.state = GameState.MENU
         
@@ -4280,14 +6875,23 @@ class Game:
         self.world_width = 1920
         self.world_height = 1080
         
+        # Level berikutnya dibangun di background
+        self.level_loader = LevelLoader(self.render_surface.get_size())
+        self.loading_level: Optional[Level] = None
+        self.loading_timer = 0.0
+        
         # Enhanced systems
-        self.particle_system = ParticleSystem()
-        self.camera = Camera(RENDER_WIDTH, RENDER_HEIGHT, self.world_width, self.world_height)
-        self.tilemap = TileMap(self.world_width, self.world_height, self.current_level)
+        self.particle_system = create_particle_system()
+        self.camera = Camera(*self.render_surface.get_size(), self.world_width, self.world_height)
+        self.tilemap = TileMap(self.world_width, self.world_height, self.current_level, seed=TILEMAP_SEED)
         
         # Game objects
         self.player: Optional[Player] = None
         self.enemies: List[Enemy] = []
+        # Opsional: posisi/kecepatan/kesehatan musuh dalam array (ELION_ENEMY_BACKEND=store)
+        self.enemy_store = create_enemy_store()
+        # Opsional: musuh jauh dari layar di-update lebih jarang (ELION_AI_LOD=1)
+        self.ai_scheduler: Optional[AIScheduler] = AIScheduler() if AI_LOD_ENABLED else None
         self.gems: List[Gem] = []
         self.portal: Optional[Portal] = None
         self.altar: Optional[SpiritAltar] = None
@@ -4296,6 +6900,7 @@ class Game:
         self.level2_miniboss_defeated = False
         self.level2_cutscene_played = False
         self.level3_gems_floating: List[Gem] = []
+        self._background_frames: Dict[Level, List[pygame.Surface]] = {}
         
         # Timers
         self.start_time = 0.0
@@ -4350,23 +6955,17 @@ class Game:
         if os.path.isfile(worldmap_bgm_path):
             self._worldmap_bgm_path = worldmap_bgm_path
     
-    def _init_level(self, level: Level) -> None:
+    def _init_level(self, level: Level, tilemap: Optional[TileMap] = None) -> None:
         self.current_level = level
+        self.world_width, self.world_height = get_level_world_size(level)
         
-        if level == Level.LEVEL_2:
-            self.world_width = LEVEL2_WORLD_WIDTH
-            self.world_height = LEVEL2_WORLD_HEIGHT
-        elif level == Level.LEVEL_3:
-            self.world_width = LEVEL3_WORLD_WIDTH
-            self.world_height = LEVEL3_WORLD_HEIGHT
-        else:
-            self.world_width = 1920
-            self.world_height = 1080
-        
-        self.camera = Camera(RENDER_WIDTH, RENDER_HEIGHT, self.world_width, self.world_height)
-        self.tilemap = TileMap(self.world_width, self.world_height, level)
+        self.camera = Camera(*self.render_surface.get_size(), self.world_width, self.world_height)
+        if tilemap is None:
+            tilemap = TileMap(self.world_width, self.world_height, level, seed=TILEMAP_SEED)
+        self.tilemap = tilemap
         
-        self.enemies = []
+        self._set_enemies([])
+        projectile_pool.clear()
         self.gems = []
         self.portal = None
         self.altar = None
@@ -4412,12 +7011,12 @@ class Game:
             self._init_level3()
     
     def _init_level1(self) -> None:
-        self.enemies = [
+        self._set_enemies([
             GlimpEnemy(400, 300, [(400, 300), (700, 300), (700, 500), (400, 500)]),
             GlimpEnemy(900, 400, [(900, 400), (1200, 400)]),
             UmbraEnemy(600, 600),
             UmbraEnemy(1000, 700)
-        ]
+        ])
         
         self.gems = [
             Gem(500, 250, "gem_green", COLOR_GEM_GREEN),
@@ -4425,22 +7024,22 @@ class Game:
             Gem(1500, 800, "gem_yellow", COLOR_GEM_YELLOW)
         ]
         
-        self.portal = Portal(1700, 900, "red", Level.LEVEL_2)
+        self._spawn_portal(Portal(1700, 900, "red", Level.LEVEL_2))
     
     def _init_level2(self) -> None:
         self.level2_miniboss_defeated = False
         self.level2_cutscene_played = False
         
-        self.enemies = [
+        self._set_enemies([
             FlareWolfEnemy(400, 300, [(400, 300), (600, 300), (600, 500), (400, 500)]),
             FlareWolfEnemy(800, 400, [(800, 400), (1000, 400), (1000, 600), (800, 600)]),
             FlareWolfEnemy(1200, 200, [(1200, 200), (1400, 200), (1400, 400), (1200, 400)]),
             ForestGuardianEnemy(1800, 500)
-        ]
+        ])
         
         for _ in range(5):
-            x = random.randint(100, self.world_width - 100)
-            y = random.randint(100, self.world_height - 100)
+            x = RNG.tilemap.randint(100, self.world_width - 100)
+            y = RNG.tilemap.randint(100, self.world_height - 100)
             crystal = Gem(x, y, "crystal_decor", (200, 150, 100))
             crystal._collected = True
             self.gems.append(crystal)
@@ -4448,7 +7047,7 @@ class Game:
         self.portal = None
     
     def _init_level3(self) -> None:
-        self.enemies = []
+        self._set_enemies([])
         self.gems = []
         
         altar_pos = self.tilemap.get_altar_position()
@@ -4457,15 +7056,47 @@ class Game:
         
         self.portal = None
     
+    def _set_enemies(self, enemies: List[Enemy]) -> None:
+        """Ganti daftar musuh level (sekaligus isi EnemyStore jika aktif)"""
+        self.enemies = enemies
+        if self.enemy_store is not None:
+            self.enemy_store.assign(enemies)
+    
+    def _add_enemy(self, enemy: Enemy) -> None:
+        self.enemies.append(enemy)
+        if self.enemy_store is not None:
+            self.enemy_store.add(enemy)
+    
+    def _remove_enemies(self, removed: List[Enemy]) -> None:
+        gone = set(map(id, removed))
+        self.enemies = [enemy for enemy in self.enemies if id(enemy) not in gone]
+        projectile_pool.clear(removed)
+        if self.enemy_store is not None:
+            self.enemy_store.remove(removed)
+    
+    def _spawn_portal(self, portal: Portal) -> None:
+        """Pasang portal dan mulai prefetch level tujuannya"""
+        self.portal = portal
+        target_level = portal.get_target_level()
+        if target_level:
+            self.level_loader.prefetch(target_level)
+    
     def handle_events(self) -> None:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
             
+            # Isi window bisa hilang (expose/restore); frame berikutnya redraw penuh
+            if event.type in REDRAW_EVENTS:
+                self._present_key = None
+            
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
                 
+                if event.key == pygame.K_F3:
+                    self.profiler.toggle()
+                
                 # MENU: Enter goes to World Map instead of directly to cutscene
                 if self.state == GameState.MENU:
                     if event.key == pygame.K_RETURN:
@@ -4507,8 +7138,9 @@ class Game:
             
             # Mouse clicks for World Map
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                pos = self._screen_pos(event.pos)
                 if self.state == GameState.WORLD_MAP:
-                    result = self.world_map.handle_click(event.pos)
+                    result = self.world_map.handle_click(pos)
                     
                     if result == "start_journey":
                         # Start the game journey
@@ -4517,23 +7149,23 @@ class Game:
                                 self.play_sfx('start')
                         except Exception:
                             pass
-                        self.cutscene = OpeningCutscene(self.screen)
+                        self.cutscene = OpeningCutscene(self._screen_target())
                         self.change_state(GameState.CUTSCENE)
                     
                     elif isinstance(result, CodexPanel):
                         self.state = GameState.CODEX_VIEW
                 
                 elif self.state == GameState.CODEX_VIEW:
-                    # Check if close button clicked
-                    close_button = self.world_map.codex_panel.draw(self.window)
-                    if close_button and close_button.collidepoint(event.pos):
+                    # Check if close button clicked (rect dari draw terakhir; window tidak digambar ulang)
+                    close_button = self._codex_close_button
+                    if close_button and close_button.collidepoint(pos):
                         self.world_map.mark_codex_read()
                         self.state = GameState.WORLD_MAP
             
             # Mouse motion for World Map hover
             if event.type == pygame.MOUSEMOTION:
                 if self.state == GameState.WORLD_MAP:
-                    self.world_map.check_hover(event.pos)
+                    self.world_map.check_hover(self._screen_pos(event.pos))
     
     def update(self, dt: float) -> None:
         if self.state == GameState.MENU:
@@ -4554,6 +7186,17 @@ class Game:
                     self.change_state(GameState.PLAYING)
             return
         
+        elif self.state == GameState.LOADING:
+            self.loading_timer += dt
+            self.camera.update(dt)
+            self.particle_system.update(dt)
+            if self.loading_timer >= LEVEL_LOADING_MIN_TIME and \
+               self.level_loader.is_ready(self.loading_level):
+                self._init_level(self.loading_level, self.level_loader.take(self.loading_level))
+                self.loading_level = None
+                self.state = GameState.PLAYING
+            return
+        
         elif self.state == GameState.ENDING:
             if self.ending_reflection:
                 self.ending_reflection.update(dt)
@@ -4571,10 +7214,11 @@ class Game:
                 self._ending2_played = True
             return
 
-        self.elapsed_time = pygame.time.get_ticks() / 1000.0 - self.start_time
+        self.elapsed_time = game_ticks() / 1000.0 - self.start_time
         
-        keys = pygame.key.get_pressed()
-        self.player.handle_input(keys, dt, self.world_width, self.world_height)
+        keys = self.input.get_pressed()
+        with self.profiler.section("input"):
+            self.player.handle_input(keys, dt, self.world_width, self.world_height)
         self.player.update(dt)
         
         self.companion.follow_player(self.player)
@@ -4597,43 +7241,93 @@ class Game:
         else:
             self._update_default_level(dt)
         
-        self.particle_system.update(dt)
+        with self.profiler.section("particles_update"):
+            self.particle_system.update(dt)
+    
+    def _step_enemies(self, dt: float, on_contact: Callable[[Enemy], None]) -> List[pygame.Rect]:
+        """take_action + update semua musuh, panggil on_contact untuk yang menyentuh pemain.
+        
+        Mengembalikan rect musuh (urut daftar). Dengan EnemyStore, integrasi dan
+        cek tabrakan dengan pemain dijalankan batch setelah semua take_action.
+        Dengan AIScheduler, musuh yang dilewati frame ini tidak bergerak tetapi
+        tetap diperiksa tabrakannya. Musuh yang berpindah lebih dari
+        SWEPT_MIN_STEP juga kena bila lintasannya menyapu pemain.
+        """
+        profiler = self.profiler
+        player_rect = self.player.get_rect()
+        store = self.enemy_store
+        scheduler = self.ai_scheduler
+        if scheduler is not None:
+            view = self.camera.get_view_rect()
+            player_pos = self.player.get_position()
+        if store is not None:
+            with profiler.section("enemies"):
+                if scheduler is not None:
+                    due, steps = scheduler.plan_store(store, view, player_pos, dt)
+                    store.take_actions(self.player, steps, due)
+                    store.integrate(steps, self.world_width, self.world_height)
+                else:
+                    store.take_actions(self.player, dt)
+                    store.integrate(dt, self.world_width, self.world_height)
+                enemy_rects = store.rects()
+            with profiler.section("collisions"):
+                for index in store.contacts(player_rect):
+                    on_contact(self.enemies[index])
+            return enemy_rects
+        
+        steps: Optional[List[Optional[float]]] = None
+        if scheduler is not None:
+            with profiler.section("enemies"):
+                steps = scheduler.plan(self.enemies, view, player_pos, dt)
+        enemy_rects = []
+        # Satu section untuk seluruh loop; kontak tetap diproses berurutan per
+        # musuh (urutan RNG), jadi waktunya ikut terhitung di "enemies"
+        with profiler.section("enemies"):
+            for index, enemy in enumerate(self.enemies):
+                step = dt if steps is None else steps[index]
+                if step is not None:
+                    enemy.take_action(self.player, step)
+                    enemy.update(step, self.world_width, self.world_height)
+                enemy_rect = enemy.get_rect()
+                enemy_rects.append(enemy_rect)
+                
+                if enemy_rect.colliderect(player_rect) or (step is not None and enemy.sweeps(player_rect)):
+                    on_contact(enemy)
+        return enemy_rects
     
     def _update_default_level(self, dt: float) -> None:
-        for enemy in self.enemies[:]:
-            enemy.take_action(self.player, dt)
-            enemy.update(dt, self.world_width, self.world_height)
-            
-            if enemy.collides_with(self.player.get_rect()):
-                if self.player.take_damage():
-                    try:
-                        self.play_sfx('damage')
-                    except Exception:
-                        pass
-                    self.camera.shake(8, 0.3)
-                    cx, cy = self.player.get_center()
-                    self.particle_system.emit(cx, cy, (255, 80, 80), count=20, spread=60, life=0.8)
-                    
-                    if self.player.get_lives() <= 0:
-                        self.state = GameState.GAMEOVER
-
+        spatial = self.spatial
+        spatial.clear()
+        player_rect = self.player.get_rect()
+        enemy_rects = self._step_enemies(dt, self._enemy_contact_default)
+        spatial.insert_many("enemy", zip(self.enemies, enemy_rects))
+        projectile_pool.update(dt)
+        
         # Add mentor wisdom for events
         enemy_encountered = False
-        for enemy in self.enemies:
-            # Check if player is near enemy
-            px, py = self.player.get_position()
-            ex, ey = enemy.get_position()
-            dist = math.sqrt((px - ex)**2 + (py - ey)**2)
-            
-            if dist < 150 and not enemy_encountered:
-                if self.companion and random.random() < 0.01:  # 1% chance per frame
+        px, py = self.player.get_position()
+        if self.enemy_store is not None:
+            near = [self.enemies[index] for index in
+                    np.flatnonzero(self.enemy_store.distances_to(px, py) < 150).tolist()]
+        else:
+            near = []
+            for enemy in spatial.nearby(px, py, 150, "enemy"):
+                # Check if player is near enemy
+                ex, ey = enemy.get_position()
+                if math.sqrt((px - ex)**2 + (py - ey)**2) < 150:
+                    near.append(enemy)
+        for enemy in near:
+            if not enemy_encountered:
+                if self.companion and RNG.ai.random() < 0.01:  # 1% chance per frame
                     self.companion.give_wisdom("enemy_encounter")
                     enemy_encountered = True
         
-        for gem in self.gems[:]:
+        for gem in self.gems:
             gem.update(dt)
-            
-            if not gem.is_collected() and gem.get_rect().colliderect(self.player.get_rect()):
+        spatial.insert_many("gem", ((gem, gem.get_rect()) for gem in self.gems))
+        
+        for gem in spatial.query(player_rect, "gem"):
+            if not gem.is_collected():
                 gem_type, gem_color = gem.collect()
                 self.player.collect_gem(gem_type, gem_color)
                 
@@ -4657,8 +7351,9 @@ class Game:
         
         if self.portal:
             self.portal.update(dt, self.player)
+            spatial.insert("portal", self.portal, self.portal.get_rect())
             
-            if self.portal.get_rect().colliderect(self.player.get_rect()):
+            if spatial.query(player_rect, "portal"):
                 target_level = self.portal.get_target_level()
                 if target_level:
                     try:
@@ -4676,102 +7371,62 @@ class Game:
                     self.particle_system.emit(cx, cy, COLOR_SPIRIT_CYAN, count=50, spread=100, life=2.0)
                     self.change_state(GameState.WIN)
     
+    def _enemy_contact_default(self, enemy: Enemy) -> None:
+        if self.player.take_damage():
+            try:
+                self.play_sfx('damage')
+            except Exception:
+                pass
+            self.camera.shake(8, 0.3)
+            cx, cy = self.player.get_center()
+            self.particle_system.emit(cx, cy, (255, 80, 80), count=20, spread=60, life=0.8)
+            
+            if self.player.get_lives() <= 0:
+                self.state = GameState.GAMEOVER
+    
+    def _enemy_contact_level2(self, enemy: Enemy) -> None:
+        if self.player.take_damage():
+            self.camera.shake(8, 0.3)
+            cx, cy = self.player.get_center()
+            
+            if enemy._type == "flare_wolf":
+                self.particle_system.emit(cx, cy, (255, 100, 0), count=25, spread=70, life=0.9)
+            else:
+                self.particle_system.emit(cx, cy, (255, 80, 80), count=20, spread=60, life=0.8)
+            
+            if self.player.get_lives() <= 0:
+                self.state = GameState.GAMEOVER
+            
+            if self.companion and RNG.ai.random() < 0.3:  # 30% chance on damage
+                self.companion.give_wisdom("damage_taken")
+    
     def _update_level2(self, dt: float) -> None:
         if not self.level2_cutscene_played:
             self.level2_cutscene_played = True
             self._play_level2_cutscene()
         
-        for enemy in self.enemies[:]:
-            enemy.take_action(self.player, dt)
-            enemy.update(dt, self.world_width, self.world_height)
-            
-            for burst in self.player.get_spirit_bursts()[:]:
-                burst_rect = pygame.Rect(
-                    int(burst['x'] - burst['size']//2),
-                    int(burst['y'] - burst['size']//2),
-                    burst['size'], burst['size']
-                )
-                
-                if enemy.collides_with(burst_rect):
-                    if enemy.take_damage():
-                        self.enemies.remove(enemy)
-                        
-                        ex, ey = enemy.get_position()
-                        cx = ex + enemy._size // 2
-                        cy = ey + enemy._size // 2
-                        
-                        if enemy._type == "flare_wolf":
-                            self.particle_system.emit(cx, cy, (255, 140, 0), 
-                                                    count=25, spread=70, life=1.0)
-                        elif enemy._type == "forest_guardian":
-                            try:
-                                self.play_sfx('attack')
-                            except Exception:
-                                pass
-                            self.particle_system.emit(cx, cy, (100, 255, 100), 
-                                                    count=40, spread=100, life=1.5)
-                            self.level2_miniboss_defeated = True
-                            self.portal = Portal(1900, 500, "victory", Level.LEVEL_3)
-                        else:
-                            self.particle_system.emit(cx, cy, COLOR_SPIRIT_CYAN, 
-                                                    count=20, spread=60, life=0.8)
-                        
-                        self.camera.shake(5, 0.2)
-                        self.player._score += 50 if enemy._type == "forest_guardian" else 30
-                        self.player.remove_spirit_burst(burst)
-                        break
-                    else:
-                        if enemy._type == "forest_guardian":
-                            self.camera.shake(3, 0.1)
-                            ex, ey = enemy.get_position()
-                            cx = ex + enemy._size // 2
-                            cy = ey + enemy._size // 2
-                            self.particle_system.emit(cx, cy, COLOR_SPIRIT_CYAN,
-                                                    count=15, spread=40, life=0.5)
-                        
-                        self.player.remove_spirit_burst(burst)
-                        break
-            
-            if enemy.collides_with(self.player.get_rect()):
-                if self.player.take_damage():
-                    self.camera.shake(8, 0.3)
-                    cx, cy = self.player.get_center()
-                    
-                    if enemy._type == "flare_wolf":
-                        self.particle_system.emit(cx, cy, (255, 100, 0), count=25, spread=70, life=0.9)
-                    else:
-                        self.particle_system.emit(cx, cy, (255, 80, 80), count=20, spread=60, life=0.8)
-                    
-                    if self.player.get_lives() <= 0:
-                        self.state = GameState.GAMEOVER
-
-                    if self.companion and random.random() < 0.3:  # 30% chance on damage
-                        self.companion.give_wisdom("damage_taken")
+        profiler = self.profiler
+        spatial = self.spatial
+        spatial.clear()
+        player_rect = self.player.get_rect()
+        enemy_rects = self._step_enemies(dt, self._enemy_contact_level2)
         
-        for enemy in self.enemies:
-            if enemy._type == "forest_guardian":
-                for proj in enemy.get_projectiles():
-                    proj_rect = pygame.Rect(int(proj['x'] - proj['size']//2), 
-                                        int(proj['y'] - proj['size']//2),
-                                        proj['size'], proj['size'])
-                    
-                    if proj_rect.colliderect(self.player.get_rect()):
-                        if self.player.take_damage():
-                            self.camera.shake(6, 0.2)
-                            cx, cy = self.player.get_center()
-                            self.particle_system.emit(cx, cy, (100, 200, 255), count=15, spread=40, life=0.7)
-        
-        if random.random() < 0.1:
-            ember_x = random.randint(0, self.world_width)
-            ember_y = random.randint(0, 100)
+        with profiler.section("collisions"):
+            spatial.insert_many("enemy", zip(self.enemies, enemy_rects))
+            self._resolve_projectiles(dt, player_rect)
+        
+        if RNG.particles.random() < 0.1:
+            ember_x = RNG.particles.randint(0, self.world_width)
+            ember_y = RNG.particles.randint(0, 100)
             self.particle_system.emit(ember_x, ember_y, COLOR_EMBER_ORANGE, 
-                                    count=random.randint(1, 3), spread=30, life=2.0,
+                                    count=RNG.particles.randint(1, 3), spread=30, life=2.0,
                                     particle_type="ember")
         
         if self.portal:
             self.portal.update(dt, self.player)
+            spatial.insert("portal", self.portal, self.portal.get_rect())
             
-            if self.portal.get_rect().colliderect(self.player.get_rect()):
+            if spatial.query(player_rect, "portal"):
                 target_level = self.portal.get_target_level()
                 if target_level:
                     try:
@@ -4780,6 +7435,79 @@ class Game:
                         pass
                     self._transition_to_level(target_level)
     
+    def _resolve_projectiles(self, dt: float, player_rect: pygame.Rect) -> None:
+        """Satu lintasan integrasi+tabrakan untuk semua proyektil di pool.
+        
+        Tabrakan tersapu sepanjang lintasan frame ini. Proyektil pemain terpakai
+        pada musuh pertama yang disapunya (seri: urut daftar) dan belum terkena
+        frame ini; proyektil musuh melukai pemain tanpa terpakai.
+        """
+        query = self.spatial.query
+        struck = set()
+        killed = []
+        
+        def collide(proj: Projectile) -> bool:
+            if proj.owner == "player":
+                target = None
+                first = 2.0
+                for enemy in query(proj.swept_rect(), "enemy"):
+                    if id(enemy) in struck:
+                        continue
+                    t = proj.sweep(enemy.get_rect())
+                    if t is not None and t < first:
+                        target, first = enemy, t
+                if target is None:
+                    return False
+                struck.add(id(target))
+                if self._burst_hit(target):
+                    killed.append(target)
+                return True
+            if proj.sweep(player_rect) is not None and self.player.take_damage():
+                self.camera.shake(6, 0.2)
+                cx, cy = self.player.get_center()
+                self.particle_system.emit(cx, cy, (100, 200, 255), count=15, spread=40, life=0.7)
+            return False
+        
+        projectile_pool.update(dt, collide)
+        if killed:
+            self._remove_enemies(killed)
+    
+    def _burst_hit(self, enemy: Enemy) -> bool:
+        """Efek Spirit Burst mengenai musuh; True jika musuh mati"""
+        if enemy.take_damage():
+            ex, ey = enemy.get_position()
+            cx = ex + enemy._size // 2
+            cy = ey + enemy._size // 2
+            
+            if enemy._type == "flare_wolf":
+                self.particle_system.emit(cx, cy, (255, 140, 0), 
+                                        count=25, spread=70, life=1.0)
+            elif enemy._type == "forest_guardian":
+                try:
+                    self.play_sfx('attack')
+                except Exception:
+                    pass
+                self.particle_system.emit(cx, cy, (100, 255, 100), 
+                                        count=40, spread=100, life=1.5)
+                self.level2_miniboss_defeated = True
+                self._spawn_portal(Portal(1900, 500, "victory", Level.LEVEL_3))
+            else:
+                self.particle_system.emit(cx, cy, COLOR_SPIRIT_CYAN, 
+                                        count=20, spread=60, life=0.8)
+            
+            self.camera.shake(5, 0.2)
+            self.player._score += 50 if enemy._type == "forest_guardian" else 30
+            return True
+        
+        if enemy._type == "forest_guardian":
+            self.camera.shake(3, 0.1)
+            ex, ey = enemy.get_position()
+            cx = ex + enemy._size // 2
+            cy = ey + enemy._size // 2
+            self.particle_system.emit(cx, cy, COLOR_SPIRIT_CYAN,
+                                    count=15, spread=40, life=0.5)
+        return False
+    
     def _play_level2_cutscene(self) -> None:
         self.companion.give_hint("ELION... The path ahead is dangerous.")
         self.player.unlock_spirit_lantern()
@@ -4791,24 +7519,30 @@ class Game:
         self.camera.shake(10, 0.5)
     
     def _update_level3(self, dt: float) -> None:
-        if random.random() < 0.05:
-            mist_x = random.randint(0, self.world_width)
-            mist_y = random.randint(self.world_height//2, self.world_height)
+        projectile_pool.update(dt)
+        
+        if RNG.particles.random() < 0.05:
+            mist_x = RNG.particles.randint(0, self.world_width)
+            mist_y = RNG.particles.randint(self.world_height//2, self.world_height)
             self.particle_system.emit(mist_x, mist_y, COLOR_MIST_WHITE, 
-                                    count=random.randint(1, 2), spread=40, life=3.0,
+                                    count=RNG.particles.randint(1, 2), spread=40, life=3.0,
                                     particle_type="mist")
         
-        if random.random() < 0.03:
-            flower_x = random.randint(0, self.world_width)
-            flower_y = random.randint(0, self.world_height)
+        if RNG.particles.random() < 0.03:
+            flower_x = RNG.particles.randint(0, self.world_width)
+            flower_y = RNG.particles.randint(0, self.world_height)
             self.particle_system.emit(flower_x, flower_y, (200, 255, 220), 
                                     count=1, spread=5, life=2.5,
                                     particle_type="light_flower")
         
+        spatial = self.spatial
+        spatial.clear()
+        player_rect = self.player.get_rect()
         if self.altar:
             self.altar.update(dt)
+            spatial.insert("altar", self.altar, self.altar.get_rect())
             
-            if not self.altar.is_activated() and self.altar.get_rect().colliderect(self.player.get_rect()):
+            if not self.altar.is_activated() and spatial.query(player_rect, "altar"):
                 if self.player.get_gem_count() >= 3 and not self.player.is_placing_gems():
                     self.player.start_gem_placement()
                     
@@ -4831,9 +7565,9 @@ class Game:
             
             if self.altar.is_activated() and not self.portal:
                 altar_center = self.altar.get_center()
-                self.portal = Portal(altar_center[0] - PORTAL_SIZE//2, 
-                           altar_center[1] - 100,
-                           "victory", None)
+                self._spawn_portal(Portal(altar_center[0] - PORTAL_SIZE//2, 
+                                          altar_center[1] - 100,
+                                          "victory", None))
         
         for gem in self.level3_gems_floating[:]:
             gem.update(dt)
@@ -4847,7 +7581,9 @@ class Game:
                 
                 self.level3_gems_floating.remove(gem)
         
-        if self.portal and self.portal.get_rect().colliderect(self.player.get_rect()):
+        if self.portal:
+            spatial.insert("portal", self.portal, self.portal.get_rect())
+        if spatial.query(player_rect, "portal"):
             # play portal SFX
             try:
                 self.play_sfx('portal')
@@ -4860,38 +7596,56 @@ class Game:
         cx, cy = self.player.get_center()
         self.particle_system.emit(cx, cy, COLOR_SPIRIT_CYAN, count=50, spread=100, life=2.0)
         
-        self._init_level(target_level)
+        # Level dibangun di worker thread; LOADING menampilkan transisi sampai siap
+        self.level_loader.prefetch(target_level)
+        self.loading_level = target_level
+        self.loading_timer = 0.0
+        self.state = GameState.LOADING
     
     def draw(self) -> None:
+        # Layar statis: redraw penuh hanya saat kuncinya berubah, selain itu dirty rect saja
+        key = self._dirty_key()
+        if key is not None and key == self._present_key:
+            self._draw_dirty()
+            return
+        self._present_key = key
+        
         if self.state == GameState.MENU:
-            UI.draw_menu(self.render_surface, self.menu_particle_timer)
+            self._menu_rects = UI.draw_menu(self.render_surface, self.menu_particle_timer)
 
         elif self.state == GameState.WORLD_MAP:
-            self.world_map.draw(self.window)
-            pygame.display.flip()
-            return
+            self.world_map.draw(self._screen_target())
+            if not self.lowres_screens:
+                self._present()
+                return
         
         elif self.state == GameState.CODEX_VIEW:
-            self.world_map.draw(self.window)
-            close_button = self.world_map.codex_panel.draw(self.window)
-            pygame.display.flip()
-            return
+            target = self._screen_target()
+            if self._codex_map is None or self._codex_map.get_size() != target.get_size():
+                self._codex_map = new_surface(target.get_size(), 0, target)
+            self.world_map.draw(self._codex_map)
+            target.blit(self._codex_map, (0, 0))
+            self._codex_close_button = self.world_map.codex_panel.draw(target)
+            if not self.lowres_screens:
+                self._present()
+                return
         
         elif self.state == GameState.CUTSCENE:
             self.cutscene.draw()
-            pygame.display.flip()
-            return
+            if self.cutscene.screen is self.window:
+                self._present()
+                return
         
         elif self.state == GameState.ENDING:
             if self.ending_reflection:
-                self.ending_reflection.draw(self.window)
+                self.ending_reflection.draw(self._screen_target())
+                if not self.lowres_screens:
+                    self._present()
+                    return
             else:
                 # Fallback to old ending if reflection not initialized
                 self._draw_game_scene()
                 UI.draw_ending_sequence(self.render_surface, self.ending_sequence_timer)
-            
-            pygame.display.flip()
-            return
         
         elif self.state == GameState.WIN:
             UI.draw_win_screen(self.render_surface, self.elapsed_time, self.player.get_score())
@@ -4900,17 +7654,188 @@ class Game:
         elif self.state == GameState.PLAYING:
             self._draw_game_scene()
         
+        elif self.state == GameState.LOADING:
+            self._draw_game_scene()
+            UI.draw_loading_transition(self.render_surface, self.loading_timer, self.loading_level)
+        
         # Scale and display
-        scaled_surface = pygame.transform.scale(self.render_surface, (WINDOW_WIDTH, WINDOW_HEIGHT))
-        self.window.blit(scaled_surface, (0, 0))
-        pygame.display.flip()
+        with self.profiler.section("scale"):
+            self._scale_to_window()
+        self._present()
+    
+    def _init_scaler(self, scaler: str) -> None:
+        """Siapkan buffer tujuan scale sekali, supaya tidak ada alokasi per frame"""
+        if scaler not in RENDER_SCALERS:
+            raise ValueError(f"Unknown scaler {scaler!r}, expected one of {RENDER_SCALERS}")
+        self.scaler = scaler
+        src_w, src_h = self.render_surface.get_size()
+        win_w, win_h = self.window.get_size()
+        if scaler == "integer":
+            factor = max(1, min(win_w // src_w, win_h // src_h))
+            size = (src_w * factor, src_h * factor)
+        else:
+            size = (win_w, win_h)
+        self._scale_rect = pygame.Rect((0, 0), size)
+        self._scale_rect.center = (win_w // 2, win_h // 2)
+        # Bar letterbox di sekitar hasil scale (hanya untuk mode integer)
+        rect = self._scale_rect
+        self._letterbox = [r for r in (
+            pygame.Rect(0, 0, win_w, rect.top),
+            pygame.Rect(0, rect.bottom, win_w, win_h - rect.bottom),
+            pygame.Rect(0, rect.top, rect.left, rect.height),
+            pygame.Rect(rect.right, rect.top, win_w - rect.right, rect.height),
+        ) if r.width > 0 and r.height > 0]
+        if size == (src_w, src_h):
+            self._scale_buffer = None
+        elif scaler == "smooth":
+            # smoothscale butuh surface 24/32-bit
+            self._scale_buffer = new_surface(size, 0, 32)
+        else:
+            self._scale_buffer = new_surface(size, 0, self.render_surface)
+    
+    def _scale_to_window(self) -> None:
+        """Scale render_surface ke buffer yang sudah dialokasikan lalu blit ke window"""
+        for bar in self._letterbox:
+            self.window.fill((0, 0, 0), bar)
+        if self._scale_buffer is None:
+            self.window.blit(self.render_surface, self._scale_rect)
+            return
+        size = self._scale_rect.size
+        if self.scaler == "smooth":
+            pygame.transform.smoothscale(self.render_surface, size, self._scale_buffer)
+        else:
+            pygame.transform.scale(self.render_surface, size, self._scale_buffer)
+        self.window.blit(self._scale_buffer, self._scale_rect)
+    
+    def _screen_target(self) -> pygame.Surface:
+        """Surface untuk world map, codex, cutscene dan ending: render_surface jika lowres_screens aktif"""
+        return self.render_surface if self.lowres_screens else self.window
+    
+    def _screen_pos(self, pos: Tuple[int, int]) -> Tuple[int, int]:
+        """Posisi mouse (window) ke koordinat _screen_target(); kebalikan _window_rects"""
+        if not self.lowres_screens:
+            return pos
+        src_w, src_h = self.render_surface.get_size()
+        dest = self._scale_rect
+        return (int((pos[0] - dest.x) * src_w / dest.width),
+                int((pos[1] - dest.y) * src_h / dest.height))
+    
+    def _dirty_key(self) -> Optional[Hashable]:
+        """Kunci layar yang mendukung dirty rect; None berarti selalu redraw penuh + flip"""
+        if self.profiler.enabled:
+            return None
+        if self.state == GameState.MENU:
+            return (self.state,)
+        if self.state == GameState.WORLD_MAP:
+            return (self.state, self.world_map.layout_key())
+        if self.state == GameState.CODEX_VIEW:
+            # Panel disimpan (bukan id-nya) agar panel baru selalu berbeda
+            panel = self.world_map.codex_panel
+            return (self.state, panel, panel.scroll_offset, self.world_map.layout_key())
+        if self.state == GameState.CUTSCENE and self.cutscene.screen is self.window:
+            return (self.state, self.cutscene, self.cutscene.index, self.cutscene.finished)
+        return None
+    
+    def _draw_dirty(self) -> None:
+        """Gambar ulang area yang berubah saja lalu display.update(rects)"""
+        if self.state == GameState.MENU:
+            current = UI.menu_rects(self.render_surface.get_size(), self.menu_particle_timer)
+            screen_rect = self.render_surface.get_rect()
+            rects = [rect.clip(screen_rect) for rect in dirty_rects(self._menu_rects, current)]
+            rects = [rect for rect in rects if rect.width and rect.height]
+            UI.draw_menu(self.render_surface, self.menu_particle_timer, rects)
+            self._menu_rects = current
+            with self.profiler.section("scale"):
+                rects = self._scale_rects(rects)
+        elif self.state == GameState.WORLD_MAP:
+            rects = self.world_map.draw_dirty(self._screen_target())
+            if self.lowres_screens:
+                with self.profiler.section("scale"):
+                    rects = self._scale_rects(rects)
+        elif self.state == GameState.CUTSCENE:
+            rects = self.cutscene.draw_dirty()
+        else:
+            # CODEX_VIEW: panel tetap sampai panel/scroll berubah, tetapi peta di
+            # bawahnya (titik jalur, denyut tombol) beranimasi lewat dirty rect
+            target = self._screen_target()
+            rects = self.world_map.draw_dirty(self._codex_map)
+            self.world_map.codex_panel.redraw(target, self._codex_map, rects)
+            if self.lowres_screens:
+                with self.profiler.section("scale"):
+                    rects = self._scale_rects(rects)
+        if rects:
+            with self.profiler.section("flip"):
+                pygame.display.update(rects)
+    
+    def _scale_rects(self, rects: Iterable[pygame.Rect]) -> List[pygame.Rect]:
+        """_scale_to_window untuk rect render_surface saja; return rect window yang berubah"""
+        dest = self._scale_rect
+        if self._scale_buffer is None:
+            for rect in rects:
+                self.window.blit(self.render_surface, rect.move(dest.topleft), rect)
+            return [rect.move(dest.topleft) for rect in rects]
+        if self.scaler == "smooth":
+            # Filter smoothscale bergantung pada ukuran sumber, jadi potongan yang
+            # di-scale sendiri tidak sama dengan hasil scale penuh: scale semuanya
+            self._scale_to_window()
+            return self._window_rects(rects)
+        
+        # Potongan sama persis dengan scale penuh hanya jika tepinya jatuh pada
+        # kelipatan periode rasio (mis. 1 untuk 2x, 15 untuk 600 -> 1280)
+        src_w, src_h = self.render_surface.get_size()
+        period_x = src_w // math.gcd(src_w, dest.width)
+        period_y = src_h // math.gcd(src_h, dest.height)
+        sources = []
+        for rect in rects:
+            left = rect.left // period_x * period_x
+            top = rect.top // period_y * period_y
+            right = min(src_w, -(-rect.right // period_x) * period_x)
+            bottom = min(src_h, -(-rect.bottom // period_y) * period_y)
+            if right > left and bottom > top:
+                sources.append(pygame.Rect(left, top, right - left, bottom - top))
+        updated = []
+        for source in merge_rects(sources):
+            left, top = source.left * dest.width // src_w, source.top * dest.height // src_h
+            scaled = pygame.Rect(left, top, source.right * dest.width // src_w - left,
+                                 source.bottom * dest.height // src_h - top)
+            pygame.transform.scale(self.render_surface.subsurface(source), scaled.size,
+                                   self._scale_buffer.subsurface(scaled))
+            window_rect = scaled.move(dest.topleft)
+            self.window.blit(self._scale_buffer, window_rect, scaled)
+            updated.append(window_rect)
+        return updated
+    
+    def _window_rects(self, rects: Iterable[pygame.Rect]) -> List[pygame.Rect]:
+        """Petakan rect render_surface ke koordinat window setelah scaling"""
+        src_w, src_h = self.render_surface.get_size()
+        dest = self._scale_rect
+        scale_x, scale_y = dest.width / src_w, dest.height / src_h
+        # smoothscale mencampur piksel tetangga, jadi beri margin satu piksel sumber
+        margin_x, margin_y = math.ceil(scale_x), math.ceil(scale_y)
+        window_rect = self.window.get_rect()
+        mapped = []
+        for rect in rects:
+            left = dest.x + int(rect.left * scale_x) - margin_x
+            top = dest.y + int(rect.top * scale_y) - margin_y
+            right = dest.x + math.ceil(rect.right * scale_x) + margin_x
+            bottom = dest.y + math.ceil(rect.bottom * scale_y) + margin_y
+            clipped = pygame.Rect(left, top, right - left, bottom - top).clip(window_rect)
+            if clipped.width and clipped.height:
+                mapped.append(clipped)
+        return mapped
+    
+    def _present(self) -> None:
+        """Overlay profiler (jika aktif) lalu flip ke layar"""
+        self.profiler.draw(self.window)
+        with self.profiler.section("flip"):
+            pygame.display.flip()
 
     def change_state(self, new_state: GameState) -> None:
         """Handle high-level state transitions."""
         self.state = new_state
         if new_state == GameState.PLAYING:
             # start gameplay timer and initialize level
-            self.start_time = pygame.time.get_ticks() / 1000.0
+            self.start_time = game_ticks() / 1000.0
             if not self.current_level:
                 self.current_level = Level.LEVEL_1
             self._init_level(self.current_level)
@@ -4937,7 +7862,7 @@ class Game:
 
         elif new_state == GameState.ENDING:
             # Initialize ending reflection
-            self.ending_reflection = EndingReflection()
+            self.ending_reflection = EndingReflection(self._screen_target().get_size())
             self.ending_sequence_active = True
             self._ending2_played = False
             # fade out bgm and play ending SFX
@@ -4992,95 +7917,127 @@ class Game:
         """Enhanced game scene drawing"""
         camera_offset = self.camera.get_offset()
         
+        profiler = self.profiler
+        with profiler.section("background"):
+            self._draw_background()
+        
+        # Draw tilemap layers
+        with profiler.section("tilemap"):
+            self.tilemap.draw_base(self.render_surface, camera_offset)
+            self.tilemap.draw_objects_below(self.render_surface, camera_offset)
+        
+        with profiler.section("entities"):
+            self._draw_entities(camera_offset)
+        
+        # Draw particles
+        with profiler.section("particles_draw"):
+            self.particle_system.draw(self.render_surface, camera_offset)
+        
+        # Draw objects above entities (trees, etc.)
+        with profiler.section("tilemap"):
+            self.tilemap.draw_objects_above(self.render_surface, camera_offset)
+            # Siapkan chunk di sekitar kamera untuk frame berikutnya
+            self.tilemap.prefetch(camera_offset, self.render_surface.get_size())
+        
+        # Draw UI jika sedang playing
+        if self.state == GameState.PLAYING:
+            with profiler.section("hud"):
+                self._draw_playing_ui()
+    
+    def _draw_background(self) -> None:
+        # Latar level di-bake sekali; noise/bintang memakai beberapa varian yang diputar per frame
+        frames = self._background_frames.get(self.current_level)
+        if frames is None:
+            frames = self._bake_background(self.current_level)
+            self._background_frames[self.current_level] = frames
+        index = (game_ticks() // BACKGROUND_VARIANT_MS) % len(frames)
+        self.render_surface.blit(frames[index], (0, 0))
+        
+        if self.current_level not in (Level.LEVEL_2, Level.LEVEL_3):
+            # Cloud effect
+            if RNG.ui.random() < 0.01:
+                width, height = self.render_surface.get_size()
+                cloud_x = RNG.ui.randint(0, width)
+                cloud_y = RNG.ui.randint(0, height // 3)
+                cloud_width = RNG.ui.randint(40, 80)
+                cloud_height = RNG.ui.randint(20, 40)
+                
+                cloud_surf = new_surface((cloud_width, cloud_height), pygame.SRCALPHA)
+                pygame.draw.ellipse(cloud_surf, (255, 255, 255, 60),
+                                  (0, 0, cloud_width, cloud_height))
+                self.render_surface.blit(cloud_surf, (cloud_x, cloud_y))
+    
+    def _bake_background(self, level: Level) -> List[pygame.Surface]:
+        """Varian latar (ukuran render) untuk satu level"""
+        size = width, height = self.render_surface.get_size()
         # Dynamic background berdasarkan level
-        if self.current_level == Level.LEVEL_2:
+        if level == Level.LEVEL_2:
             # Sunset background dengan gradien lebih smooth
-            for y in range(RENDER_HEIGHT):
-                ratio = y / RENDER_HEIGHT
-                # Gradien dari orange ke merah
-                r = int(COLOR_SUNSET_ORANGE[0] * (1 - ratio) + COLOR_SUNSET_RED[0] * ratio)
-                g = int(COLOR_SUNSET_ORANGE[1] * (1 - ratio) + COLOR_SUNSET_RED[1] * ratio)
-                b = int(COLOR_SUNSET_ORANGE[2] * (1 - ratio) + COLOR_SUNSET_RED[2] * ratio)
-                
-                # Tambahkan noise untuk texture
-                noise = random.randint(-5, 5)
-                r = max(0, min(255, r + noise))
-                g = max(0, min(255, g + noise))
-                b = max(0, min(255, b + noise))
-                
-                pygame.draw.line(self.render_surface, (r, g, b), (0, y), (RENDER_WIDTH, y))
+            gradient = vertical_gradient(size, COLOR_SUNSET_ORANGE, COLOR_SUNSET_RED)
             
             # Sun/moon
             sun_radius = 40
-            sun_x = RENDER_WIDTH // 4
-            sun_y = RENDER_HEIGHT // 3
+            sun_x = width // 4
+            sun_y = height // 3
             
             # Sun glow
-            sun_glow = pygame.Surface((sun_radius * 4, sun_radius * 4), pygame.SRCALPHA)
+            sun_glow = new_surface((sun_radius * 4, sun_radius * 4), pygame.SRCALPHA)
             for i in range(3, 0, -1):
                 layer_radius = sun_radius + i * 10
                 layer_alpha = 40 // (i + 1)
                 pygame.draw.circle(sun_glow, (255, 200, 100, layer_alpha),
                                  (sun_radius * 2, sun_radius * 2), layer_radius)
-            self.render_surface.blit(sun_glow, (sun_x - sun_radius * 2, sun_y - sun_radius * 2),
-                                    special_flags=pygame.BLEND_ADD)
             
-            # Sun core
-            pygame.draw.circle(self.render_surface, (255, 220, 140), (sun_x, sun_y), sun_radius)
-            pygame.draw.circle(self.render_surface, (255, 200, 100), (sun_x, sun_y), sun_radius - 5)
-            
-        elif self.current_level == Level.LEVEL_3:
-            # Celestial background untuk castle
-            for y in range(RENDER_HEIGHT):
-                ratio = y / RENDER_HEIGHT
-                # Gradien dari dark blue ke light purple
-                r = int(30 * (1 - ratio) + 120 * ratio)
-                g = int(40 * (1 - ratio) + 100 * ratio)
-                b = int(70 * (1 - ratio) + 180 * ratio)
-                pygame.draw.line(self.render_surface, (r, g, b), (0, y), (RENDER_WIDTH, y))
-            
-            # Stars
-            for _ in range(20):
-                star_x = random.randint(0, RENDER_WIDTH)
-                star_y = random.randint(0, RENDER_HEIGHT // 2)
-                star_size = random.randint(1, 3)
-                star_brightness = random.randint(150, 255)
-                pygame.draw.circle(self.render_surface, (star_brightness, star_brightness, star_brightness),
-                                 (star_x, star_y), star_size)
+            frames = []
+            for _ in range(BACKGROUND_VARIANTS):
+                frame = gradient.copy()
+                # Tambahkan noise per baris untuk texture
+                for y in range(height):
+                    noise = RNG.ui.randint(-5, 5)
+                    r, g, b = gradient.get_at((0, y))[:3]
+                    color = (max(0, min(255, r + noise)),
+                             max(0, min(255, g + noise)),
+                             max(0, min(255, b + noise)))
+                    pygame.draw.line(frame, color, (0, y), (width, y))
                 
-                # Star twinkle
-                if random.random() < 0.1:
-                    star_glow = pygame.Surface((star_size * 4, star_size * 4), pygame.SRCALPHA)
-                    pygame.draw.circle(star_glow, (255, 255, 255, 100),
-                                     (star_size * 2, star_size * 2), star_size * 2)
-                    self.render_surface.blit(star_glow, (star_x - star_size * 2, star_y - star_size * 2))
-        
-        else:  # Level 1 - Forest
-            # Forest sky dengan gradien
-            for y in range(RENDER_HEIGHT):
-                ratio = y / RENDER_HEIGHT
-                # Gradien dari light blue ke green
-                r = int(100 * (1 - ratio) + 60 * ratio)
-                g = int(160 * (1 - ratio) + 120 * ratio)
-                b = int(200 * (1 - ratio) + 100 * ratio)
-                pygame.draw.line(self.render_surface, (r, g, b), (0, y), (RENDER_WIDTH, y))
-            
-            # Cloud effect
-            if random.random() < 0.01:
-                cloud_x = random.randint(0, RENDER_WIDTH)
-                cloud_y = random.randint(0, RENDER_HEIGHT // 3)
-                cloud_width = random.randint(40, 80)
-                cloud_height = random.randint(20, 40)
+                frame.blit(sun_glow, (sun_x - sun_radius * 2, sun_y - sun_radius * 2),
+                           special_flags=pygame.BLEND_ADD)
                 
-                cloud_surf = pygame.Surface((cloud_width, cloud_height), pygame.SRCALPHA)
-                pygame.draw.ellipse(cloud_surf, (255, 255, 255, 60),
-                                  (0, 0, cloud_width, cloud_height))
-                self.render_surface.blit(cloud_surf, (cloud_x, cloud_y))
-        
-        # Draw tilemap layers
-        self.tilemap.draw_base(self.render_surface, camera_offset)
-        self.tilemap.draw_objects_below(self.render_surface, camera_offset)
-        
+                # Sun core
+                pygame.draw.circle(frame, (255, 220, 140), (sun_x, sun_y), sun_radius)
+                pygame.draw.circle(frame, (255, 200, 100), (sun_x, sun_y), sun_radius - 5)
+                frames.append(frame)
+            return frames
+        
+        if level == Level.LEVEL_3:
+            # Celestial background untuk castle: gradien dark blue ke light purple
+            gradient = vertical_gradient(size, (30, 40, 70), (120, 100, 180))
+            
+            frames = []
+            for _ in range(BACKGROUND_VARIANTS):
+                frame = gradient.copy()
+                # Stars
+                for _ in range(20):
+                    star_x = RNG.ui.randint(0, width)
+                    star_y = RNG.ui.randint(0, height // 2)
+                    star_size = RNG.ui.randint(1, 3)
+                    star_brightness = RNG.ui.randint(150, 255)
+                    pygame.draw.circle(frame, (star_brightness, star_brightness, star_brightness),
+                                     (star_x, star_y), star_size)
+                    
+                    # Star twinkle
+                    if RNG.ui.random() < 0.1:
+                        star_glow = new_surface((star_size * 4, star_size * 4), pygame.SRCALPHA)
+                        pygame.draw.circle(star_glow, (255, 255, 255, 100),
+                                         (star_size * 2, star_size * 2), star_size * 2)
+                        frame.blit(star_glow, (star_x - star_size * 2, star_y - star_size * 2))
+                frames.append(frame)
+            return frames
+        
+        # Level 1 - Forest sky: gradien dari light blue ke green
+        return [vertical_gradient(size, (100, 160, 200), (60, 120, 100))]
+    
+    def _draw_entities(self, camera_offset: Tuple[int, int]) -> None:
         # Draw collectibles
         for gem in self.gems:
             gem.draw(self.render_surface, camera_offset, self.particle_system)
@@ -5103,8 +8060,12 @@ class Game:
             entities_to_sort.append((self.player.get_position()[1], 'player', self.player))
         if self.companion:
             entities_to_sort.append((self.companion.get_position()[1], 'companion', self.companion))
-        for enemy in self.enemies:
-            entities_to_sort.append((enemy.get_position()[1], 'enemy', enemy))
+        if self.enemy_store is not None:
+            enemy_ys = self.enemy_store.y[:self.enemy_store.count].tolist()
+            entities_to_sort.extend((y, 'enemy', enemy) for y, enemy in zip(enemy_ys, self.enemies))
+        else:
+            for enemy in self.enemies:
+                entities_to_sort.append((enemy.get_position()[1], 'enemy', enemy))
         
         entities_to_sort.sort(key=lambda x: x[0])
         
@@ -5116,30 +8077,24 @@ class Game:
                 entity.draw(self.render_surface, camera_offset)
             elif entity_type == 'enemy':
                 entity.draw(self.render_surface, camera_offset)
+    
+    def _draw_playing_ui(self) -> None:
+        """HUD dan hint saat PLAYING"""
+        UI.draw_hud(self.render_surface, self.player, self.elapsed_time, self.current_level)
         
-        # Draw particles
-        self.particle_system.draw(self.render_surface, camera_offset)
+        # Level-specific UI
+        if self.current_level == Level.LEVEL_2:
+            UI.draw_attack_hint(self.render_surface, self.player)
         
-        # Draw objects above entities (trees, etc.)
-        self.tilemap.draw_objects_above(self.render_surface, camera_offset)
+        # Companion hints
+        if self.companion._hint_timer > 0:
+            UI.draw_hint_box(self.render_surface, self.companion._hint_text)
         
-        # Draw UI jika sedang playing
-        if self.state == GameState.PLAYING:
-            UI.draw_hud(self.render_surface, self.player, self.elapsed_time, self.current_level)
-            
-            # Level-specific UI
-            if self.current_level == Level.LEVEL_2:
-                UI.draw_attack_hint(self.render_surface, self.player)
-            
-            # Companion hints
-            if self.companion._hint_timer > 0:
-                UI.draw_hint_box(self.render_surface, self.companion._hint_text)
-            
-            # Altar hint
-            if self.current_level == Level.LEVEL_3 and self.altar:
-                if not self.altar.is_activated() and self.player.get_gem_count() >= 3:
-                    if self.altar.get_rect().colliderect(self.player.get_rect()):
-                        UI.draw_hint_box(self.render_surface, "Place the spirit gems on the altar", 100)
+        # Altar hint
+        if self.current_level == Level.LEVEL_3 and self.altar:
+            if not self.altar.is_activated() and self.player.get_gem_count() >= 3:
+                if self.altar.get_rect().colliderect(self.player.get_rect()):
+                    UI.draw_hint_box(self.render_surface, "Place the spirit gems on the altar", 100)
 
     def run(self) -> None:
         """Enhanced main game loop"""
@@ -5158,16 +8113,409 @@ class Game:
         while self.running:
             dt = self.clock.tick(FPS) / 1000.0
             
-            self.handle_events()
+            self.profiler.begin_frame()
+            with self.profiler.section("events"):
+                self.handle_events()
             self.update(dt)
             self.draw()
+            self.profiler.end_frame()
         
+        self.level_loader.shutdown()
         pygame.quit()
         sys.exit()
+    
+    def start_level(self, level: Level) -> None:
+        """Langsung masuk ke level tertentu (melewati menu dan cutscene)"""
+        self.current_level = level
+        self.change_state(GameState.PLAYING)
+    
+    def run_headless(self, frames: int, dt: float = 1.0 / FPS, draw: bool = False,
+                     script: Optional[ScriptedInput] = None,
+                     on_frame: Optional[Callable[["Game", int], None]] = None,
+                     record_timings: bool = False) -> Dict[str, object]:
+        """Jalankan simulasi dengan dt tetap, jam simulasi dan input terskrip.
+        
+        Memakai jam simulasi yang sudah dipasang pemanggil (sebaiknya sebelum
+        Game() dan setup level, supaya timer level ikut deterministik), atau
+        memasang SimulationClock(0) baru.
+        """
+        previous = _simulation_clock
+        clock = previous if previous is not None else SimulationClock(0)
+        set_simulation_clock(clock)
+        if script is not None:
+            self.input = script
+        
+        update_times: List[float] = []
+        draw_times: List[float] = []
+        completed = 0
+        start = time.perf_counter()
+        try:
+            for frame in range(frames):
+                if not self.running:
+                    break
+                clock.advance(dt)
+                if isinstance(self.input, ScriptedInput):
+                    self.input.advance()
+                if on_frame is not None:
+                    on_frame(self, frame)
+                
+                self.profiler.begin_frame()
+                with self.profiler.section("events"):
+                    self.handle_events()
+                frame_start = time.perf_counter()
+                self.update(dt)
+                update_end = time.perf_counter()
+                if draw:
+                    self.draw()
+                self.profiler.end_frame()
+                if record_timings:
+                    update_times.append(update_end - frame_start)
+                    draw_times.append(time.perf_counter() - update_end)
+                completed += 1
+        finally:
+            set_simulation_clock(previous)
+        
+        wall_time = time.perf_counter() - start
+        result: Dict[str, object] = {
+            "frames": completed,
+            "simulated_seconds": completed * dt,
+            "wall_seconds": wall_time,
+            "fps": completed / wall_time if wall_time > 0 else 0.0,
+        }
+        if record_timings:
+            result["update_times"] = update_times
+            result["draw_times"] = draw_times
+        if self.ai_scheduler is not None:
+            result["ai_ticks"] = dict(self.ai_scheduler.totals)
+        return result
+
+
+# ==================== BENCHMARK ====================
+BENCHMARK_SWARM_SIZE = 300
+BENCHMARK_GLIMP_SWARM_SIZE = 600
+BENCHMARK_SWARM_SEED = 2024
+
+
+@dataclass
+class BenchmarkScenario:
+    name: str
+    frames: int
+    setup: Callable[[Game], None]
+    script: Sequence[Tuple[int, Iterable[int]]] = ()
+    on_frame: Optional[Callable[[Game, int], None]] = None
+
+
+def _keep_player_alive(game: Game, frame: int) -> None:
+    # Benchmark mengukur frame, bukan game over
+    if game.player:
+        game.player._lives = 3
+
+
+def _setup_level1(game: Game) -> None:
+    game.start_level(Level.LEVEL_1)
+
+
+def _level1_gem_run(game: Game, frame: int) -> None:
+    """Pindahkan pemain ke gem berikutnya setiap detik, lalu ke portal"""
+    _keep_player_alive(game, frame)
+    if game.state != GameState.PLAYING or game.current_level != Level.LEVEL_1 or frame % FPS:
+        return
+    remaining = [gem for gem in game.gems if not gem.is_collected()]
+    if remaining:
+        game.player._x, game.player._y = remaining[0].get_position()
+    elif game.portal:
+        game.player._x, game.player._y = game.portal.get_rect().topleft
+
+
+def _setup_level2_guardian(game: Game) -> None:
+    game.start_level(Level.LEVEL_2)
+    for enemy in game.enemies:
+        if enemy._type == "forest_guardian":
+            gx, gy = enemy.get_position()
+            game.player._x, game.player._y = gx - 140, gy
+
+
+def _setup_level1_swarm(game: Game) -> None:
+    """Level 1 dengan ratusan Glimp: beban take_action/update murni interpreter"""
+    game.start_level(Level.LEVEL_1)
+    rng = random.Random(BENCHMARK_SWARM_SEED)
+    for _ in range(BENCHMARK_GLIMP_SWARM_SIZE):
+        x = rng.randint(100, game.world_width - 250)
+        y = rng.randint(100, game.world_height - 250)
+        game._add_enemy(GlimpEnemy(x, y, [(x, y), (x + 200, y), (x + 200, y + 120), (x, y + 120)]))
+    game.player._x, game.player._y = game.world_width // 2, game.world_height // 2
+
+
+def _setup_level2_swarm(game: Game) -> None:
+    """Level 2 dengan ratusan Flare Wolf untuk mengukur skala update/tabrakan"""
+    game.start_level(Level.LEVEL_2)
+    rng = random.Random(BENCHMARK_SWARM_SEED)
+    for _ in range(BENCHMARK_SWARM_SIZE):
+        x = rng.randint(100, game.world_width - 250)
+        y = rng.randint(100, game.world_height - 250)
+        game._add_enemy(FlareWolfEnemy(x, y, [(x, y), (x + 150, y), (x + 150, y + 150), (x, y + 150)]))
+    game.player._x, game.player._y = game.world_width // 2, game.world_height // 2
+
+
+def _setup_level3_altar(game: Game) -> None:
+    game.start_level(Level.LEVEL_3)
+    game.player._x, game.player._y = game.altar.get_center()
+
+
+def _setup_world_map(game: Game) -> None:
+    game.change_state(GameState.WORLD_MAP)
+
+
+def _setup_ending(game: Game) -> None:
+    game.start_level(Level.LEVEL_3)
+    game.change_state(GameState.ENDING)
+
+
+BENCHMARK_SCENARIOS = [
+    BenchmarkScenario("level1_gems", 600, _setup_level1,
+                      script=[(600, (pygame.K_d,))], on_frame=_level1_gem_run),
+    BenchmarkScenario("level1_swarm", 600, _setup_level1_swarm,
+                      script=[(90, (pygame.K_d,)), (90, (pygame.K_s,)), (90, (pygame.K_a,)), (90, (pygame.K_w,))],
+                      on_frame=_keep_player_alive),
+    BenchmarkScenario("level2_guardian", 600, _setup_level2_guardian,
+                      script=[(2, (pygame.K_d,)), (28, (pygame.K_SPACE,))],
+                      on_frame=_keep_player_alive),
+    BenchmarkScenario("level2_swarm", 600, _setup_level2_swarm,
+                      script=[(60, (pygame.K_d, pygame.K_SPACE)), (60, (pygame.K_s, pygame.K_SPACE)),
+                              (60, (pygame.K_a, pygame.K_SPACE)), (60, (pygame.K_w, pygame.K_SPACE))],
+                      on_frame=_keep_player_alive),
+    BenchmarkScenario("level3_altar", 900, _setup_level3_altar, on_frame=_keep_player_alive),
+    BenchmarkScenario("world_map", 300, _setup_world_map),
+    BenchmarkScenario("ending", 900, _setup_ending),
+]
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Percentile nearest-rank dari list yang sudah diurutkan"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def run_benchmark_scenario(scenario: BenchmarkScenario, seed: int,
+                           frames: Optional[int] = None,
+                           options: Optional[Dict[str, object]] = None) -> Dict[str, object]:
+    RNG.reseed(seed)
+    # Jam simulasi dipasang sebelum Game() dan setup skenario (timer level, start_time)
+    set_simulation_clock(SimulationClock(0))
+    try:
+        game = Game(**(options or {}))
+        try:
+            scenario.setup(game)
+            result = game.run_headless(frames or scenario.frames, draw=True,
+                                       script=ScriptedInput(scenario.script, loop=True),
+                                       on_frame=scenario.on_frame, record_timings=True)
+        finally:
+            game.level_loader.shutdown()
+    finally:
+        set_simulation_clock(None)
+    
+    update_times = result["update_times"]
+    draw_times = result["draw_times"]
+    totals = sorted(u + d for u, d in zip(update_times, draw_times))
+    count = max(1, len(totals))
+    stats = {
+        "frames": len(totals),
+        "mean_ms": sum(totals) / count * 1000,
+        "p50_ms": _percentile(totals, 50) * 1000,
+        "p95_ms": _percentile(totals, 95) * 1000,
+        "p99_ms": _percentile(totals, 99) * 1000,
+        "max_ms": (totals[-1] if totals else 0.0) * 1000,
+        "update_mean_ms": sum(update_times) / count * 1000,
+        "draw_mean_ms": sum(draw_times) / count * 1000,
+    }
+    if "ai_ticks" in result:
+        stats["ai_ticks"] = result["ai_ticks"]
+    # Backend yang benar-benar dipakai (env bisa jatuh ke pool/object tanpa NumPy)
+    stats["backends"] = {
+        "particle_system": type(game.particle_system).__name__,
+        "enemy_store": game.enemy_store is not None,
+        "ai_lod": game.ai_scheduler is not None,
+    }
+    return stats
+
+
+def run_benchmarks(names: Optional[List[str]] = None, seed: int = 1234,
+                   frames: Optional[int] = None,
+                   options: Optional[Dict[str, object]] = None) -> Dict[str, object]:
+    results = {}
+    backends: Dict[str, object] = {}
+    for scenario in BENCHMARK_SCENARIOS:
+        if names and scenario.name not in names:
+            continue
+        stats = run_benchmark_scenario(scenario, seed, frames, options)
+        backends = stats.pop("backends")
+        results[scenario.name] = stats
+    return {
+        "seed": seed,
+        "python": sys.version.split()[0],
+        "pygame": pygame.version.ver,
+        **backends,
+        "scenarios": results,
+    }
+
+
+def format_benchmarks(report: Dict[str, object]) -> str:
+    lines = [f"{'scenario':<18}{'mean':>8}{'p50':>8}{'p95':>8}{'p99':>8}{'update':>8}{'draw':>8}  (ms)"]
+    for name, stats in report["scenarios"].items():
+        lines.append(f"{name:<18}{stats['mean_ms']:>8.2f}{stats['p50_ms']:>8.2f}{stats['p95_ms']:>8.2f}"
+                     f"{stats['p99_ms']:>8.2f}{stats['update_mean_ms']:>8.2f}{stats['draw_mean_ms']:>8.2f}")
+    return "\n".join(lines)
+
+
+def compare_benchmarks(report: Dict[str, object], baseline: Dict[str, object],
+                       threshold: float = 10.0) -> Tuple[str, bool]:
+    """Bandingkan dengan baseline; regresi jika mean/p95 naik lebih dari threshold persen"""
+    lines = [f"{'scenario':<18}{'mean':>18}{'p95':>18}"]
+    regressed = False
+    for name, stats in report["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            lines.append(f"{name:<18}{'(tidak ada di baseline)':>36}")
+            continue
+        cells = []
+        for key in ("mean_ms", "p95_ms"):
+            delta = (stats[key] - base[key]) / base[key] * 100 if base[key] else 0.0
+            marker = " !" if delta > threshold else ""
+            regressed = regressed or delta > threshold
+            cells.append(f"{base[key]:.2f}->{stats[key]:.2f} {delta:+.0f}%{marker}")
+        lines.append(f"{name:<18}{cells[0]:>18}{cells[1]:>18}")
+    return "\n".join(lines), regressed
+
+
+def run_benchmark_cli(args: argparse.Namespace) -> int:
+    report = run_benchmarks(args.scenario, seed=args.seed if args.seed is not None else 1234,
+                            frames=args.benchmark_frames, options=render_options(args))
+    print(format_benchmarks(report))
+    
+    if args.benchmark_json:
+        with open(args.benchmark_json, "w") as f:
+            json.dump(report, f, indent=2)
+    
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        comparison, regressed = compare_benchmarks(report, baseline, args.threshold)
+        print()
+        print(comparison)
+        if regressed:
+            print(f"Regresi > {args.threshold:.0f}% terdeteksi")
+            return 1
+    return 0
 
 
 # ==================== ENTRY POINT ====================
+def parse_render_size(value: str) -> Tuple[int, int]:
+    """Parse "WxH" untuk --render-size"""
+    try:
+        width, height = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WxH, got {value!r}")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"render size must be positive, got {value!r}")
+    return width, height
+
+
+def parse_tick_rate(value: str) -> float:
+    """Parse --tick-rate: jumlah tick per detik, harus positif dan berhingga"""
+    try:
+        rate = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a number, got {value!r}")
+    if not math.isfinite(rate) or rate <= 0:
+        raise argparse.ArgumentTypeError(f"tick rate must be positive and finite, got {value!r}")
+    return rate
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="ELION – The Last Lightkeeper")
+    parser.add_argument("--seed", type=int, default=RNG_SEED,
+                        help="seed master untuk semua stream RNG (default: $ELION_SEED atau acak)")
+    parser.add_argument("--headless", action="store_true", default=HEADLESS,
+                        help="simulasi tanpa display/audio (SDL dummy driver, juga $ELION_HEADLESS)")
+    parser.add_argument("--frames", type=int, default=3600,
+                        help="jumlah frame simulasi untuk --headless")
+    parser.add_argument("--tick-rate", type=parse_tick_rate, default=FPS,
+                        help=f"tick simulasi per detik untuk --headless (default: {FPS})")
+    parser.add_argument("--level", type=int, choices=[level.value for level in Level], default=1,
+                        help="level awal untuk --headless")
+    parser.add_argument("--draw", action="store_true",
+                        help="tetap jalankan Game.draw() saat --headless")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="jalankan skenario benchmark frame-time lalu keluar")
+    parser.add_argument("--scenario", action="append",
+                        choices=[scenario.name for scenario in BENCHMARK_SCENARIOS],
+                        help="batasi benchmark ke skenario ini (boleh diulang)")
+    parser.add_argument("--benchmark-frames", type=int, default=None,
+                        help="override jumlah frame per skenario")
+    parser.add_argument("--benchmark-json", metavar="PATH",
+                        help="simpan hasil benchmark sebagai JSON")
+    parser.add_argument("--baseline", metavar="PATH",
+                        help="bandingkan dengan JSON benchmark sebelumnya")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="batas regresi dalam persen untuk --baseline")
+    parser.add_argument("--profile", action="store_true", default=PROFILER_ENABLED,
+                        help="mulai dengan overlay profiler aktif (toggle F3, juga $ELION_PROFILE)")
+    parser.add_argument("--render-size", type=parse_render_size, metavar="WxH",
+                        default=(RENDER_WIDTH, RENDER_HEIGHT),
+                        help=f"resolusi internal (default: {RENDER_WIDTH}x{RENDER_HEIGHT})")
+    parser.add_argument("--scaler", choices=RENDER_SCALERS, default=RENDER_SCALER,
+                        help="scaler ke window (default: $ELION_SCALER atau nearest)")
+    parser.add_argument("--lowres-screens", action="store_true", default=LOWRES_SCREENS,
+                        help="world map, codex, cutscene dan ending juga di resolusi internal (juga $ELION_LOWRES_SCREENS)")
+    return parser.parse_args(argv)
+
+
+def render_options(args: argparse.Namespace) -> Dict[str, object]:
+    """Argumen Game() untuk pipeline render dari CLI"""
+    return {"render_size": args.render_size, "scaler": args.scaler,
+            "lowres_screens": args.lowres_screens}
+
+
+def run_headless_cli(args: argparse.Namespace) -> None:
+    """Soak test: pemain berjalan bolak-balik sambil menyerang"""
+    # Jam simulasi dipasang sebelum Game()/start_level supaya seed sama = frame sama
+    set_simulation_clock(SimulationClock(0))
+    try:
+        game = Game(**render_options(args))
+        game.start_level(Level(args.level))
+        script = ScriptedInput([
+            (90, (pygame.K_d, pygame.K_SPACE)),
+            (60, (pygame.K_s,)),
+            (90, (pygame.K_a, pygame.K_SPACE)),
+            (60, (pygame.K_w,)),
+        ], loop=True)
+        result = game.run_headless(args.frames, dt=1.0 / args.tick_rate, draw=args.draw, script=script)
+        game.level_loader.shutdown()
+    finally:
+        set_simulation_clock(None)
+    print(f"{result['frames']} frames ({result['simulated_seconds']:.1f}s simulasi) "
+          f"dalam {result['wall_seconds']:.2f}s -> {result['fps']:.0f} fps")
+    if "ai_ticks" in result:
+        print("AI LOD: " + "  ".join(f"{name} {count}" for name, count in result["ai_ticks"].items()))
+
+
 if __name__ == "__main__":
+    args = parse_args()
+    if args.seed is not None:
+        RNG.reseed(args.seed)
+    
+    if args.benchmark:
+        exit_code = run_benchmark_cli(args)
+        pygame.quit()
+        sys.exit(exit_code)
+    
+    if args.headless:
+        run_headless_cli(args)
+        pygame.quit()
+        sys.exit()
+    
     print("=" * 60)
     print("🌲 ELION – The Last Lightkeeper 🌲")
     print("=" * 60)
@@ -5188,7 +8536,10 @@ if __name__ == "__main__":
     print("  • New Enemies (Flare Wolf, Forest Guardian)")
     print("  • Final Boss Battle")
     print("  • Spirit Tree Restoration Ending")
+    print(f"RNG seed: {RNG.seed}")
     print("=" * 60)
     
-    game = Game()
+    game = Game(**render_options(args))
+    if args.profile and not game.profiler.enabled:
+        game.profiler.toggle()
     game.run()
\ No newline at end of file